@@ -1,151 +1,402 @@
+from functools import partial
+from typing import AsyncIterator
+
+import orjson
 from fastapi import APIRouter
 from fastapi import Depends
-from fastapi.responses import JSONResponse
-from sqlalchemy import Select, Result
+from fastapi import Header
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from sqlalchemy import Select, Result, Delete, CursorResult, delete
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
 from sqlalchemy.future import select
 
-from apis.utils.cache import get_and_add_user_posts_into_cache, delete_post_from_cache
-from apis.utils.token import get_current_user_email, get_current_user
-from config.database import async_session
+from apis.utils.cache import (
+    get_or_build_user_posts_page, add_posts_into_cache, delete_post_from_cache, delete_posts_from_cache
+)
+from apis.utils.etag import etag_matches
+from apis.utils.pagination import encode_cursor, decode_cursor
+from apis.utils.post_inserts import insert_posts
+from apis.utils.token import get_current_principal, get_principal_user_id
+from apis.utils.write_batcher import POST_WRITE_BATCHING, post_write_batcher
+from config.database import get_session, read_session, replica_router
 from config.logger import logger
-from config.models import User, Post
-from config.schemas import PostAdd, PostDelete
+from config.models import Post
+from config.schemas import PostAdd, PostsBulkAdd, PostDelete, PostsDelete, PostsPage, Principal
 
 # Register APIs
 posts_router: APIRouter = APIRouter()
 
+# Streaming Conf
+NDJSON_MEDIA_TYPE: str = "application/x-ndjson"
+STREAM_YIELD_PER: int = 100  # Rows Fetched from Server-Side Cursor at Once
+
 
 @posts_router.post("/post/add")
 async def add_post(
         body: PostAdd,
-        current_user_email: str | bool = Depends(get_current_user_email)
+        principal: Principal | bool = Depends(get_current_principal),
+        session: AsyncSession = Depends(get_session)
 ) -> JSONResponse:
     """
     Add Post API with Auth Token Requireid for Creating Post
     """
     try:
-        async with async_session() as session:
-            if not current_user_email:
-                return JSONResponse(
-                    {
-                        "error": "invalid Token"
-                    },
-                    status_code=401
-                )
+        if not principal:
+            return JSONResponse(
+                {
+                    "error": "invalid Token"
+                },
+                status_code=401
+            )
 
-            # Get Current User Object
-            user: User = await get_current_user(
-                session=session,
-                current_user_email=current_user_email
+        # Get Current User Id from Token or DB for Old Tokens
+        user_id: int | None = await get_principal_user_id(
+            principal=principal
+        )
+        if not user_id:
+            return JSONResponse(
+                {
+                    "error": "Don't Exist Such User with Such Email"
+                },
+                status_code=401
             )
-            if not user:
-                return JSONResponse(
-                    {
-                        "error": "Don't Exist Such User with Such Email"
-                    },
-                    status_code=401
-                )
 
+        if POST_WRITE_BATCHING:
+            # Save Post Together with Posts of Concurrent Requests in One Commit
+            post_id: int = await post_write_batcher.add(
+                {
+                    "user_id": user_id,
+                    "text": body.text
+                }
+            )
+        else:
             # Create Post
             post: Post = Post(
-                user_id=user.id,
+                user_id=user_id,
                 text=body.text
             )
 
             # Add Post into Session for Saving
             session.add(post)
 
-            # Save User into DB
+            # Save Post into DB
             await session.commit()
 
-            # If Cache is Exist -> Add New Post into Cache Posts List
-            await get_and_add_user_posts_into_cache(
-                post=post,
-                user_email=current_user_email
+            post_id: int = post.id
+
+        # Next Reads of This User Go to Primary Until Replicas Get This Write
+        replica_router.mark_user_write(principal.user_email)
+
+        # If Cache is Exist -> Add New Post into Cached Last Posts Pages
+        await add_posts_into_cache(
+            user_email=principal.user_email,
+            posts=[
+                {
+                    "id": post_id,
+                    "text": body.text
+                }
+            ]
+        )
+
+        return JSONResponse(
+            {
+                "success": True,
+                "post": {
+                    "id": post_id,
+                    "user_email": principal.user_email,
+                    "text": body.text
+                }
+            },
+            status_code=201
+        )
+    except Exception as e:
+        logger.error(f"An error occurred while add post | {e}")
+        return JSONResponse(
+            {
+                "error": f"An error occurred while add post | {e}"
+            },
+            status_code=500
+        )
+
+
+@posts_router.post("/posts/bulk")
+async def add_posts(
+        body: PostsBulkAdd,
+        principal: Principal | bool = Depends(get_current_principal),
+        session: AsyncSession = Depends(get_session)
+) -> JSONResponse:
+    """
+    Bulk Add Posts API with Auth Token Requireid for Creating Many Posts in One Transaction
+    """
+    try:
+        if not principal:
+            return JSONResponse(
+                {
+                    "error": "invalid Token"
+                },
+                status_code=401
             )
 
+        # Get Current User Id from Token or DB for Old Tokens
+        user_id: int | None = await get_principal_user_id(
+            principal=principal
+        )
+        if not user_id:
             return JSONResponse(
                 {
-                    "success": True,
-                    "post": {
-                        "id": post.id,
-                        "user_email": post.user.email,
-                        "text": post.text
-                    }
+                    "error": "Don't Exist Such User with Such Email"
                 },
-                status_code=201
+                status_code=401
             )
+
+        # Create Posts Rows
+        posts: list[dict] = [
+            {
+                "user_id": user_id,
+                "text": post.text
+            }
+            for post in body.posts
+        ]
+
+        # Insert ALL Posts with Multi-Row INSERT
+        posts_ids: list[int] = await insert_posts(
+            session=session,
+            posts=posts
+        )
+
+        # Save Posts into DB
+        await session.commit()
+
+        # Next Reads of This User Go to Primary Until Replicas Get This Write
+        replica_router.mark_user_write(principal.user_email)
+
+        # If Cache is Exist -> Add New Posts into Cached Last Posts Pages
+        await add_posts_into_cache(
+            user_email=principal.user_email,
+            posts=[
+                {
+                    "id": post_id,
+                    "text": post["text"]
+                }
+                for post_id, post in zip(posts_ids, posts)
+            ]
+        )
+
+        return JSONResponse(
+            {
+                "success": True,
+                "posts_ids": posts_ids
+            },
+            status_code=201
+        )
     except Exception as e:
-        logger.error(f"An error occurred while add post | {e}")
+        logger.error(f"An error occurred while add posts | {e}")
         return JSONResponse(
             {
-                "error": f"An error occurred while add post | {e}"
+                "error": f"An error occurred while add posts | {e}"
             },
             status_code=500
         )
 
 
+async def build_user_posts_page(
+        principal: Principal,
+        after_id: int,
+        limit: int
+) -> dict | None:
+    """
+    Build User Posts Page From DB with Own Session -> Can Outlive Request That Started It
+    """
+    async with read_session(user_email=principal.user_email) as session:
+        # Get Current User Id from Token or DB for Old Tokens
+        user_id: int | None = await get_principal_user_id(
+            principal=principal
+        )
+        if not user_id:
+            return None
+
+        # Get Next Posts after Cursor, One Extra Post Shows If Next Page Exist
+        query: Select = select(Post).filter(
+            Post.user_id == user_id,
+            Post.id > after_id
+        ).order_by(Post.id).limit(limit + 1)
+
+        # Execute Query
+        result: Result = await session.execute(query)
+
+        user_posts: list[Post] = list(result.scalars().all())
+
+    # Format Response
+    posts: list[dict] = [
+        {
+            "id": post.id,
+            "user_email": principal.user_email,
+            "text": post.text
+        }
+        for post in user_posts[:limit]
+    ]
+
+    return {
+        "user_id": user_id,
+        "after_id": after_id,
+        "limit": limit,
+        "posts": posts,
+        "next_cursor": encode_cursor(
+            user_id=user_id,
+            post_id=posts[-1]["id"]
+        ) if len(user_posts) > limit else None
+    }
+
+
+async def stream_user_posts(
+        user_id: int,
+        user_email: str,
+        after_id: int
+) -> AsyncIterator[bytes]:
+    """
+    Stream User Posts as NDJSON Lines Reading Rows with Server-Side Cursor
+    """
+    try:
+        async with read_session(user_email=user_email) as session:
+            # Only Needed Columns -> No ORM Objects Kept in Session While Streaming
+            query: Select = select(Post.id, Post.text).filter(
+                Post.user_id == user_id,
+                Post.id > after_id
+            ).order_by(Post.id).execution_options(yield_per=STREAM_YIELD_PER)
+
+            # Execute Query with Server-Side Cursor
+            result: AsyncResult = await session.stream(query)
+
+            async for post_id, post_text in result:
+                yield orjson.dumps(
+                    {
+                        "id": post_id,
+                        "user_email": user_email,
+                        "text": post_text
+                    },
+                    option=orjson.OPT_APPEND_NEWLINE
+                )
+    except Exception as e:
+        # Response Status is Already Sent -> Only Log and Break Stream
+        logger.error(f"An error occurred while stream posts | {e}")
+        raise
+
+
 @posts_router.get("/posts")
 async def get_posts(
-        current_user_email: str | bool = Depends(get_current_user_email)
-) -> JSONResponse:
+        page: PostsPage = Depends(),
+        principal: Principal | bool = Depends(get_current_principal),
+        accept: str | None = Header(None),
+        if_none_match: str | None = Header(None)
+) -> Response:
     """
-    Get ALL User Posts API with Auth Token Requireid and Caching Response
+    Get User Posts Page API with Auth Token Requireid, Keyset Pagination and Caching Response,
+    or ALL User Posts Streamed as NDJSON with "?stream=1" or "Accept: application/x-ndjson"
+
+    Cached Page is Sent with ETag, "If-None-Match" with Same ETag Gets 304 Without Body
     """
     try:
-        async with async_session() as session:
-            if not current_user_email:
+        if not principal:
+            return JSONResponse(
+                {
+                    "error": "invalid Token"
+                },
+                status_code=401
+            )
+
+        # Decode Cursor of Previous Page
+        cursor_user_id: int | None = None
+        after_id: int = 0
+        if page.after:
+            decoded_cursor: tuple[int, int] | bool = decode_cursor(page.after)
+            if not decoded_cursor:
                 return JSONResponse(
                     {
-                        "error": "invalid Token"
+                        "error": "Invalid Cursor"
                     },
-                    status_code=401
+                    status_code=400
                 )
+            cursor_user_id, after_id = decoded_cursor
 
-            # Get Cached Posts
-            cached_posts: list[dict] | None = await get_and_add_user_posts_into_cache(
-                user_email=current_user_email
+        if page.stream or NDJSON_MEDIA_TYPE in (accept or ""):
+            # Get Current User Id from Token or DB for Old Tokens
+            user_id: int | None = await get_principal_user_id(
+                principal=principal
             )
-            if not cached_posts:
-                # Get Current User Object
-                user: User = await get_current_user(
-                    session=session,
-                    current_user_email=current_user_email
+            if not user_id:
+                return JSONResponse(
+                    {
+                        "error": "Don't Exist Such User with Such Email"
+                    },
+                    status_code=401
                 )
-                if not user:
-                    return JSONResponse(
-                        {
-                            "error": "Don't Exist Such User with Such Email"
-                        },
-                        status_code=401
-                    )
-
-                # Get ALL User Posts
-                user_posts: list[Post] = user.posts
-
-                # Format Response
-                posts: list[dict] = [
+
+            # Check if That Cursor is About This User
+            if cursor_user_id is not None and cursor_user_id != user_id:
+                return JSONResponse(
                     {
-                        "id": post.id,
-                        "user_email": post.user.email,
-                        "text": post.text
-                    }
-                    for post in user_posts
-                ]
-
-                # Add User Posts into Cache
-                await get_and_add_user_posts_into_cache(
-                    post=posts,
-                    user_email=current_user_email
+                        "error": "That Cursor is Not About This User"
+                    },
+                    status_code=400
                 )
 
+            # Stream Posts One by One -> Memory Doesn't Grow with Posts Count
+            return StreamingResponse(
+                stream_user_posts(
+                    user_id=user_id,
+                    user_email=principal.user_email,
+                    after_id=after_id
+                ),
+                media_type=NDJSON_MEDIA_TYPE
+            )
+
+        # Get Cached Posts Page or Build It From DB
+        posts_page: dict | None = await get_or_build_user_posts_page(
+            user_email=principal.user_email,
+            after_id=after_id,
+            limit=page.limit,
+            build_page=partial(
+                build_user_posts_page,
+                principal=principal,
+                after_id=after_id,
+                limit=page.limit
+            )
+        )
+        if posts_page is None:
+            return JSONResponse(
+                {
+                    "error": "Don't Exist Such User with Such Email"
+                },
+                status_code=401
+            )
+
+        # Check if That Cursor is About This User
+        if cursor_user_id is not None and cursor_user_id != posts_page["user_id"]:
             return JSONResponse(
                 {
-                    "success": True,
-                    "posts": cached_posts if cached_posts else posts
+                    "error": "That Cursor is Not About This User"
                 },
-                status_code=200
+                status_code=400
             )
+
+        # Page Built but Not Cached Has No ETag
+        etag: str | None = posts_page.get("etag")
+        headers: dict = {"ETag": etag} if etag else {}
+
+        # Client Already Has This Page -> Nothing to Send
+        if etag_matches(if_none_match, etag):
+            return Response(
+                status_code=304,
+                headers=headers
+            )
+
+        # Cached Page Keeps Ready Response Body -> No Serialization on Cache Hit
+        return Response(
+            content=posts_page["body"],
+            media_type="application/json",
+            status_code=200,
+            headers=headers
+        )
     except Exception as e:
         logger.error(f"An error occurred while get posts | {e}")
         return JSONResponse(
@@ -159,94 +410,141 @@ async def get_posts(
 @posts_router.post("/post/delete")
 async def delete_post(
         body: PostDelete,
-        current_user_email: str | bool = Depends(get_current_user_email)
+        principal: Principal | bool = Depends(get_current_principal),
+        session: AsyncSession = Depends(get_session)
 ) -> JSONResponse:
     """
     Delete Post API with Auth Token Requireid for Deleting Post
     """
     try:
-        async with async_session() as session:
-            if not current_user_email:
-                return JSONResponse(
-                    {
-                        "error": "invalid Token"
-                    },
-                    status_code=401
-                )
+        if not principal:
+            return JSONResponse(
+                {
+                    "error": "invalid Token"
+                },
+                status_code=401
+            )
 
-            # Get Current User Object
-            user: User = await get_current_user(
-                session=session,
-                current_user_email=current_user_email
+        # Get Current User Id from Token or DB for Old Tokens
+        user_id: int | None = await get_principal_user_id(
+            principal=principal
+        )
+        if not user_id:
+            return JSONResponse(
+                {
+                    "error": "Don't Exist Such User with Such Email"
+                },
+                status_code=401
             )
-            if not user:
-                return JSONResponse(
-                    {
-                        "error": "Don't Exist Such User with Such Email"
-                    },
-                    status_code=401
-                )
 
-            # Get Post by Input Post Id
-            query: Select = select(Post).filter_by(id=body.post_id)
+        # Delete Post Only If It is About This User in One Statement
+        query: Delete = delete(Post).where(
+            Post.id == body.post_id,
+            Post.user_id == user_id
+        ).execution_options(synchronize_session=False)
 
-            # Execute Query
-            result: Result = await session.execute(query)
+        # Execute Query
+        result: CursorResult = await session.execute(query)
 
-            post: Post = result.scalars().first()
-            if not post:
-                return JSONResponse(
-                    {
-                        "error": "Don't Exist Such Post with Such Post Id"
-                    },
-                    status_code=400
-                )
+        # Delete Post from DB
+        await session.commit()
 
-            # Get ALL user Posts
-            user_posts: list[Post] = user.posts
-            if not user_posts:
-                return JSONResponse(
-                    {
-                        "error": "Don't Exist Such Post for Such User"
-                    },
-                    status_code=400
-                )
+        if not result.rowcount:
+            return JSONResponse(
+                {
+                    "error": "Don't Exist Such Post with Such Post Id for This User"
+                },
+                status_code=400
+            )
 
-            # Create List of ALL User Posts Ids
-            user_posts_id: list = [user_post.id for user_post in user_posts]
+        # Next Reads of This User Go to Primary Until Replicas Get This Write
+        replica_router.mark_user_write(principal.user_email)
 
-            # Check if That Post is About This User
-            if post.id not in user_posts_id:
-                return JSONResponse(
-                    {
-                        "error": "That Post is Not About This User"
-                    },
-                    status_code=400
-                )
+        # Update Cached Posts Without Deleted Post
+        await delete_post_from_cache(
+            user_email=principal.user_email,
+            post_id=body.post_id
+        )
 
-            # Add Post into Session for Deleting
-            await session.delete(post)
+        return JSONResponse(
+            {
+                "success": True
+            },
+            status_code=200
+        )
+    except Exception as e:
+        logger.error(f"An error occurred while delete post | {e}")
+        return JSONResponse(
+            {
+                "error": f"An error occurred while delete post | {e}"
+            },
+            status_code=500
+        )
 
-            # Delete Post from DB
-            await session.commit()
 
-            # Update Cached Posts Without Deleted Post
-            await delete_post_from_cache(
-                user_email=current_user_email,
-                post_id=post.id
+@posts_router.post("/posts/delete")
+async def delete_posts(
+        body: PostsDelete,
+        principal: Principal | bool = Depends(get_current_principal),
+        session: AsyncSession = Depends(get_session)
+) -> JSONResponse:
+    """
+    Bulk Delete Posts API with Auth Token Requireid for Deleting Many Posts in One Round-Trip
+    """
+    try:
+        if not principal:
+            return JSONResponse(
+                {
+                    "error": "invalid Token"
+                },
+                status_code=401
             )
 
+        # Get Current User Id from Token or DB for Old Tokens
+        user_id: int | None = await get_principal_user_id(
+            principal=principal
+        )
+        if not user_id:
             return JSONResponse(
                 {
-                    "success": True
+                    "error": "Don't Exist Such User with Such Email"
                 },
-                status_code=200
+                status_code=401
             )
+
+        # Delete Only Posts About This User in One Statement
+        query: Delete = delete(Post).where(
+            Post.id.in_(body.post_ids),
+            Post.user_id == user_id
+        ).execution_options(synchronize_session=False)
+
+        # Execute Query
+        result: CursorResult = await session.execute(query)
+
+        # Delete Posts from DB
+        await session.commit()
+
+        # Next Reads of This User Go to Primary Until Replicas Get This Write
+        replica_router.mark_user_write(principal.user_email)
+
+        # Update Cached Posts Without Deleted Posts
+        await delete_posts_from_cache(
+            user_email=principal.user_email,
+            post_ids=body.post_ids
+        )
+
+        return JSONResponse(
+            {
+                "success": True,
+                "deleted": result.rowcount
+            },
+            status_code=200
+        )
     except Exception as e:
-        logger.error(f"An error occurred while delete post | {e}")
+        logger.error(f"An error occurred while delete posts | {e}")
         return JSONResponse(
             {
-                "error": f"An error occurred while delete post | {e}"
+                "error": f"An error occurred while delete posts | {e}"
             },
             status_code=500
         )
@@ -1,11 +1,15 @@
-import bcrypt
 from fastapi import APIRouter
+from fastapi import Depends
 from fastapi.responses import JSONResponse
 from sqlalchemy import Select, Result, Row
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from apis.utils.password import hash_password, check_password, PasswordHasherBusy
 from apis.utils.token import create_access_token
-from config.database import async_session
+from apis.utils.user_loader import user_loader
+from config.database import get_session, replica_router
 from config.logger import logger
 from config.models import User
 from config.schemas import SignUpOrLogin
@@ -16,63 +20,91 @@ users_router: APIRouter = APIRouter()
 
 @users_router.post("/user/signup")
 async def signup(
-        body: SignUpOrLogin
+        body: SignUpOrLogin,
+        session: AsyncSession = Depends(get_session)
 ) -> JSONResponse:
     """
     SignUp API for Creating User and JWT Access Token
     """
     try:
-        async with async_session() as session:
-            # Get User with Input Email
-            query: Select = select(User).filter_by(email=body.email)
-
-            # Execute Query
-            result: Result = await session.execute(query)
-
-            existing_user: User = result.scalars().first()
-            if existing_user:
-                return JSONResponse(
-                    {
-                        "error": "Such User with Such Email Already Exist"
-                    },
-                    status_code=400
-                )
-
-            # Create Hash of Password
-            hashed_password: bytes = bcrypt.hashpw(
-                body.password.encode('utf-8'),
-                bcrypt.gensalt()
-            )
+        # Get User with Input Email
+        query: Select = select(User).filter_by(email=body.email)
+
+        # Execute Query
+        result: Result = await session.execute(query)
 
-            # Create User
-            user: User = User(
-                email=body.email, password=hashed_password
+        existing_user: User = result.scalars().first()
+        if existing_user:
+            return JSONResponse(
+                {
+                    "error": "Such User with Such Email Already Exist"
+                },
+                status_code=400
             )
 
-            # Add User into Session for Saving
-            session.add(user)
+        # End Read Transaction -> Connection Goes Back to Pool While Password is Hashed in Executor
+        await session.rollback()
 
-            # Save User into DB
-            await session.commit()
+        # Create Hash of Password
+        hashed_password: str = await hash_password(body.password)
 
-            # Generate JWT Token
-            token: str = create_access_token(
-                {
-                    "user_email": user.email
-                }
-            )
+        # Create User
+        user: User = User(
+            email=body.email, password=hashed_password
+        )
+
+        # Add User into Session for Saving
+        session.add(user)
 
+        try:
+            # Save User into DB
+            await session.commit()
+        except IntegrityError:
+            # Same Email Signed Up by Concurrent Request While Password was Hashed
+            await session.rollback()
             return JSONResponse(
                 {
-                    "success": True,
-                    "user": {
-                        "id": user.id,
-                        "email": user.email
-                    },
-                    "token": token
+                    "error": "Such User with Such Email Already Exist"
                 },
-                status_code=201
+                status_code=400
             )
+
+        # Login Right After SignUp Reads User from Primary Until Replicas Get Him
+        replica_router.mark_user_write(user.email)
+
+        # Lookups Started Before SignUp Must Not be Joined by Later Ones
+        user_loader.invalidate(user.email)
+
+        # Generate JWT Token
+        token: str = create_access_token(
+            {
+                "user_email": user.email,
+                "user_id": user.id
+            }
+        )
+
+        return JSONResponse(
+            {
+                "success": True,
+                "user": {
+                    "id": user.id,
+                    "email": user.email
+                },
+                "token": token
+            },
+            status_code=201
+        )
+    except PasswordHasherBusy as e:
+        logger.error(f"Password hasher is busy while signup user | {e}")
+        return JSONResponse(
+            {
+                "error": f"{e}"
+            },
+            status_code=503,
+            headers={
+                "Retry-After": "1"
+            }
+        )
     except Exception as e:
         logger.error(f"An error occurred while signup user | {e}")
         return JSONResponse(
@@ -91,53 +123,61 @@ async def login(
     Login API for Check Input Email and Password and Return JWT Access Token
     """
     try:
-        async with async_session() as session:
-            # Get User with Input Email
-            query: Select = select(User).filter_by(email=body.email)
-
-            # Execute Query
-            result: Result = await session.execute(query)
-
-            existing_user: User = result.scalars().first()
-            if not existing_user:
-                return JSONResponse(
-                    {
-                        "error": "Such User with Such Email Are Not Exist"
-                    },
-                    status_code=400
-                )
-
-            # Check Password
-            validated_password: bool = bcrypt.checkpw(
-                password=body.password.encode('utf-8'),
-                hashed_password=existing_user.password.encode('utf-8')
-            )
-            if not validated_password:
-                return JSONResponse(
-                    {
-                        "error": "Invalid Password"
-                    },
-                    status_code=400
-                )
-
-            # Generate JWT Token
-            token: str = create_access_token(
+        # Get User with Input Email Together with Concurrent Logins, Without His Posts
+        # Loader Session Lives Only Around Query -> Connection is Back in Pool Before Slow Password Check
+        existing_user: User | None = await user_loader.load(body.email)
+
+        if not existing_user:
+            return JSONResponse(
                 {
-                    "user_email": existing_user.email
-                }
+                    "error": "Such User with Such Email Are Not Exist"
+                },
+                status_code=400
             )
 
+        # Check Password
+        validated_password: bool = await check_password(
+            password=body.password,
+            hashed_password=existing_user.password
+        )
+        if not validated_password:
             return JSONResponse(
                 {
-                    "success": True,
-                    "user": {
-                        "id": existing_user.id,
-                        "email": existing_user.email
-                    },
-                    "token": token
+                    "error": "Invalid Password"
                 },
-                status_code=200
+                status_code=400
             )
+
+        # Generate JWT Token
+        token: str = create_access_token(
+            {
+                "user_email": existing_user.email,
+                "user_id": existing_user.id
+            }
+        )
+
+        return JSONResponse(
+            {
+                "success": True,
+                "user": {
+                    "id": existing_user.id,
+                    "email": existing_user.email
+                },
+                "token": token
+            },
+            status_code=200
+        )
+    except PasswordHasherBusy as e:
+        logger.error(f"Password hasher is busy while login user | {e}")
+        return JSONResponse(
+            {
+                "error": f"{e}"
+            },
+            status_code=503,
+            headers={
+                "Retry-After": "1"
+            }
+        )
     except Exception as e:
         logger.error(f"An error occurred while login user | {e}")
         return JSONResponse(
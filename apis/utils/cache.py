@@ -1,99 +1,630 @@
-from aiocache import caches
-
-from config.models import Post
-
-# Cache Config
-caches.set_config({
-    'default': {
-        'cache': "aiocache.SimpleMemoryCache",
-        'serializer': {
-            'class': "aiocache.serializers.PickleSerializer"
-        },
-        'ttl': 300  # 5 Minutes
+import asyncio
+import bisect
+import time
+from typing import Awaitable, Callable
+from uuid import uuid4
+
+import orjson
+from aiocache import Cache, caches
+from aiocache.base import BaseCache
+
+from apis.utils.cache_bus import cache_invalidation_bus
+from apis.utils.etag import make_etag
+from apis.utils.key_locks import KeyLocks
+from apis.utils.memory_cache import BoundedMemoryCache
+from apis.utils.pagination import encode_cursor
+from apis.utils.serializers import CompressedMsgPackSerializer
+from apis.utils.server_timing import ServerTimingPhase
+from apis.utils.single_flight import SingleFlight
+from apis.utils.tiered_cache import TieredCache
+from config.database import replica_router
+from config.env import env
+from config.logger import logger
+
+# Cache Memory Limits Conf
+CACHE_MAX_BYTES: int = env.int("CACHE_MAX_BYTES", 128 * 1024 * 1024)  # 128 MB
+CACHE_MAX_ENTRY_BYTES: int = env.int("CACHE_MAX_ENTRY_BYTES", 4 * 1024 * 1024)  # 4 MB
+
+# Cache Freshness Conf -> After TTL Page is Served Stale for STALE TTL While Refreshing
+CACHE_TTL: int = env.int("CACHE_TTL", 300)  # 5 Minutes
+CACHE_STALE_TTL: int = env.int("CACHE_STALE_TTL", 60)  # 1 Minute
+
+# Cache Backend Conf -> "memory" Keeps Pages in Each Worker, "redis" and "memcached" Share Them Between
+# ALL Workers and Hosts, "local" is In-Process Stand-In of Shared Store with Same Serialization
+CACHE_BACKEND: str = env("CACHE_BACKEND", "memory")
+CACHE_URL: str = env(
+    "CACHE_URL",
+    {"redis": "redis://localhost:6379/0", "memcached": "memcached://localhost:11211"}.get(CACHE_BACKEND, "")
+)
+CACHE_SHARED: bool = CACHE_BACKEND != "memory"
+
+# Shared Cache Serialization Conf -> Bigger Packed Values are Compressed (zlib, zstd or none)
+CACHE_COMPRESSION: str = env("CACHE_COMPRESSION", "zlib")
+CACHE_COMPRESS_MIN_BYTES: int = env.int("CACHE_COMPRESS_MIN_BYTES", 1024)  # 1 KB
+
+# Two-Tier Conf -> Small In-Process L1 in Front of Shared Cache
+CACHE_L1: bool = env.bool("CACHE_L1", False)
+CACHE_L1_MAX_BYTES: int = env.int("CACHE_L1_MAX_BYTES", 16 * 1024 * 1024)  # 16 MB
+CACHE_L1_TTL: int = env.int("CACHE_L1_TTL", 5)  # 5 Seconds
+
+
+def _create_cache() -> BaseCache:
+    """
+    Create Posts Cache of Configured Backend
+    """
+    if not CACHE_SHARED:
+        # In-Process Values are Kept as Is, Without Pickling on Every Hit
+        caches.set_config({
+            'default': {
+                'cache': "apis.utils.memory_cache.BoundedMemoryCache",
+                'ttl': CACHE_TTL + CACHE_STALE_TTL,
+                'max_bytes': CACHE_MAX_BYTES,
+                'max_entry_bytes': CACHE_MAX_ENTRY_BYTES
+            }
+        })
+        return caches.get('default')
+
+    serializer: CompressedMsgPackSerializer = CompressedMsgPackSerializer(
+        compression=CACHE_COMPRESSION,
+        compress_min_bytes=CACHE_COMPRESS_MIN_BYTES
+    )
+
+    if CACHE_BACKEND == "local":
+        shared_cache: BaseCache = BoundedMemoryCache(
+            serializer=serializer,
+            max_bytes=CACHE_MAX_BYTES,
+            max_entry_bytes=CACHE_MAX_ENTRY_BYTES
+        )
+    elif CACHE_BACKEND in ("redis", "memcached"):
+        shared_cache: BaseCache = Cache.from_url(CACHE_URL)
+        shared_cache.serializer = serializer
+    else:
+        raise ValueError(f"Unknown cache backend {CACHE_BACKEND}, use memory, local, redis or memcached")
+
+    local_cache: BoundedMemoryCache | None = BoundedMemoryCache(
+        max_bytes=CACHE_L1_MAX_BYTES,
+        max_entry_bytes=CACHE_MAX_ENTRY_BYTES
+    ) if CACHE_L1 else None
+
+    return TieredCache(
+        l2=shared_cache,
+        l1=local_cache,
+        l1_ttl=CACHE_L1_TTL,
+        ttl=CACHE_TTL + CACHE_STALE_TTL
+    )
+
+
+cache: BaseCache = _create_cache()
+
+# Serialize Updates of Each User Posts Cache
+user_posts_locks: KeyLocks = KeyLocks()
+
+# Coalesce Concurrent Posts Pages Rebuilds by Cache Key
+posts_pages_single_flight: SingleFlight = SingleFlight()
+
+_stale_stats: dict[str, int] = {
+    "stale_served": 0
+}
+
+
+def get_cache_stats() -> dict:
+    """
+    Get Cache Hits, Misses, Evictions, Memory Usage and Coalescing Counters
+    """
+    return {
+        "backend": CACHE_BACKEND,
+        **cache.stats,
+        "max_bytes": cache.max_bytes,
+        "max_entry_bytes": cache.max_entry_bytes,
+        "rebuilds": posts_pages_single_flight.stats["calls"],
+        "coalesced": posts_pages_single_flight.stats["coalesced"],
+        **_stale_stats,
+        "invalidations_sent": cache_invalidation_bus.stats["sent"],
+        "invalidations_received": cache_invalidation_bus.stats["received"],
+        "invalidations_dropped": cache_invalidation_bus.stats["dropped"]
     }
-})
 
-cache = caches.get('default')
 
+def encode_posts_page(
+        page: dict
+) -> dict:
+    """
+    Turn Built Posts Page into Cache Entry with Ready JSON Response Body
+    """
+    with ServerTimingPhase("encode"):
+        return {
+            "user_id": page["user_id"],
+            "after_id": page["after_id"],
+            "limit": page["limit"],
+            "next_cursor": page["next_cursor"],
+            "posts_ids": [post["id"] for post in page["posts"]],
+            "body": orjson.dumps(
+                {
+                    "success": True,
+                    "posts": page["posts"],
+                    "next_cursor": page["next_cursor"]
+                }
+            )
+        }
 
-async def get_cached_posts_and_cache_key(
+
+def _update_cached_page_posts(
+        cached_page: dict,
+        posts: list[dict]
+) -> None:
+    """
+    Save New Posts and Next Cursor into Cached Page Response Body
+    """
+    cached_page.update(
+        encode_posts_page(
+            {
+                **cached_page,
+                "posts": posts
+            }
+        )
+    )
+
+
+def _get_page_cache_key(
+        user_email: str,
+        generation: str,
+        after_id: int,
+        limit: int
+) -> str:
+    """
+    Get Cache Key for Posts Page
+    """
+    return f"{user_email}_posts_{generation}_{after_id}_{limit}"
+
+
+def _get_index_cache_key(
+        user_email: str
+) -> str:
+    """
+    Get Cache Key for Index of User Posts Pages
+    """
+    return f"{user_email}_posts_index"
+
+
+async def get_user_posts_index_and_index_key(
         user_email: str
 ) -> tuple[
-    list | None,
+    dict | None,
     str
 ]:
     """
-    Get Cached Posts And Cache Key by User Email
+    Get Index of ALL Cached User Posts Pages And Index Key by User Email
+    """
+    # Cache Key for Index of User Pages
+    index_key: str = _get_index_cache_key(user_email)
+
+    # Get Cached Index
+    index: dict | None = await cache.get(index_key, None)
+
+    return index, index_key
+
+
+async def get_user_posts_version(
+        user_email: str
+) -> tuple[str, int]:
+    """
+    Get Current (Generation, Version) of User Posts Cache and Create Index If Not Exist
+    """
+    async with user_posts_locks.lock(user_email):
+        index, index_key = await get_user_posts_index_and_index_key(
+            user_email=user_email
+        )
+        index: dict | None
+        index_key: str
+
+        if index is None:
+            # Index Expired or Evicted -> New Generation Makes Old Pages Unreachable
+            index: dict = {
+                "generation": uuid4().hex,
+                "version": 0,
+                "pages_keys": []
+            }
+            try:
+                await cache.add(index_key, index)
+            except ValueError:
+                # Other Worker Created Index of Shared Cache First -> Use His Generation
+                index = await cache.get(index_key, None) or index
+
+        return index["generation"], index["version"]
+
+
+async def get_cached_posts_and_cache_key(
+        user_email: str,
+        after_id: int,
+        limit: int
+) -> tuple[
+    dict | None,
+    str | None
+]:
+    """
+    Get Cached Posts Page And Cache Key by User Email and Page Position
     """
-    # Cache Key for Posts
-    cache_key: str = f"{user_email}_posts"
+    # Get Index of User Pages
+    index, _ = await get_user_posts_index_and_index_key(
+        user_email=user_email
+    )
+    index: dict | None
+    if index is None:
+        # Without Index ALL User Pages are Unreachable
+        return None, None
+
+    # Cache Key for Posts Page
+    cache_key: str = _get_page_cache_key(
+        user_email=user_email,
+        generation=index["generation"],
+        after_id=after_id,
+        limit=limit
+    )
 
-    # Get Cached Posts
-    cached_posts: list | None = await cache.get(cache_key, None)
+    # Get Cached Posts Page
+    cached_page: dict | None = await cache.get(cache_key, None)
 
-    return cached_posts, cache_key
+    return cached_page, cache_key
 
 
 async def get_and_add_user_posts_into_cache(
         user_email: str,
-        post: Post | list = None
-) -> list[dict] | None:
+        after_id: int,
+        limit: int,
+        page: dict = None,
+        version: tuple[str, int] = None
+) -> dict | None:
     """
-    Get From Cache And Add Posts Into Cache
+    Get From Cache And Add Posts Page Built at (Generation, Version) Into Cache
     """
 
-    # Get Cached Posts and Cache Key
-    cached_posts, cache_key = await get_cached_posts_and_cache_key(
-        user_email=user_email
+    # If Page Exist -> Than Mean Called This Function from "Get Posts API" After DB Query
+    if page is not None:
+        # Encode Response Body Once -> Cache Hits Serve Ready Bytes
+        page: dict = encode_posts_page(page)
+
+        async with user_posts_locks.lock(user_email):
+            # Get Index of User Pages
+            index, index_key = await get_user_posts_index_and_index_key(
+                user_email=user_email
+            )
+            index: dict | None
+            index_key: str
+
+            # Compare And Set -> Page Read Before Other Write Must Not Overwrite Its Update
+            if index is None or (index["generation"], index["version"]) != version:
+                return page
+
+            # Cache Key for Posts Page
+            cache_key: str = _get_page_cache_key(
+                user_email=user_email,
+                generation=index["generation"],
+                after_id=after_id,
+                limit=limit
+            )
+
+            # Page is Fresh Until TTL, Than Served Stale Until Refreshed
+            page["fresh_until"] = time.time() + CACHE_TTL
+            page["version"] = index["version"]
+
+            # Only Cached Page Gets ETag -> Same ETag Always Means Same Body
+            page["etag"] = make_etag(
+                generation=index["generation"],
+                version=index["version"]
+            )
+
+            # Update Cache, Too Large Pages are Skipped by Cache Backend
+            # Shared Cache Pages are Never Patched -> They are Not Registered in Index
+            if await cache.set(cache_key, page) and not CACHE_SHARED:
+                # Register Page Key in User Pages Index for Future Updates
+                if cache_key not in index["pages_keys"]:
+                    index["pages_keys"].append(cache_key)
+                await cache.set(index_key, index)
+
+        return page
+
+    # Get Cached Posts Page
+    cached_page, _ = await get_cached_posts_and_cache_key(
+        user_email=user_email,
+        after_id=after_id,
+        limit=limit
     )
-    cached_posts: list | None
-    cache_key: str
-
-    # If Post Object Exist
-    if post:
-
-        # If One Post Object -> Than Mean Called This Function from "Add Post API"
-        if isinstance(post, Post):
-
-            # If Exist Cached Posts List -> Append Into This List New Post
-            if cached_posts:
-                cached_posts.append(
-                    {
-                        "id": post.id,
-                        "user_email": post.user.email,
-                        "text": post.text
-                    }
+    cached_page: dict | None
+
+    return cached_page
+
+
+def _on_refresh_done(
+        task: asyncio.Task
+) -> None:
+    """
+    Log Error of Finished Background Refresh
+    """
+    if not task.cancelled() and task.exception():
+        logger.error(f"An error occurred while refresh cached posts page | {task.exception()}")
+
+
+async def get_or_build_user_posts_page(
+        user_email: str,
+        after_id: int,
+        limit: int,
+        build_page: Callable[[], Awaitable[dict | None]]
+) -> dict | None:
+    """
+    Get Posts Page From Cache or Build It Once for ALL Concurrent Requests
+    """
+
+    # Get Cached Posts Page
+    with ServerTimingPhase("cache"):
+        cached_page, _ = await get_cached_posts_and_cache_key(
+            user_email=user_email,
+            after_id=after_id,
+            limit=limit
+        )
+        cached_page: dict | None
+
+    # Rebuild Key Doesn't Depend on Index Generation -> Requests Before First Index Are Coalesced Too
+    rebuild_key: str = f"{user_email}_posts_{after_id}_{limit}"
+
+    async def rebuild_page() -> dict | None:
+        """
+        Build Posts Page From DB and Add It Into Cache
+        """
+        # Remember Version Before DB Read -> Writes Done Meanwhile Will Reject This Page
+        version: tuple[str, int] = await get_user_posts_version(
+            user_email=user_email
+        )
+
+        # DB Queries and ORM Loading
+        with ServerTimingPhase("build"):
+            page: dict | None = await build_page()
+        if page is None:
+            return None
+
+        return await get_and_add_user_posts_into_cache(
+            user_email=user_email,
+            after_id=after_id,
+            limit=limit,
+            page=page,
+            version=version
+        )
+
+    if cached_page is None:
+        # Cache Miss -> Only One Request Rebuilds Page, Others Await Its Result
+        return await posts_pages_single_flight.do(rebuild_key, rebuild_page)
+
+    if cached_page["fresh_until"] < time.time():
+        # Page is Stale -> Serve It and Refresh in Background
+        _stale_stats["stale_served"] += 1
+        if not posts_pages_single_flight.is_in_flight(rebuild_key):
+            task: asyncio.Task = posts_pages_single_flight.start(rebuild_key, rebuild_page)
+            task.add_done_callback(_on_refresh_done)
+
+    return cached_page
+
+
+async def _update_user_posts_pages(
+        user_email: str,
+        update_page: Callable[[dict], bool | None]
+) -> None:
+    """
+    Atomically Bump User Posts Version and Update ALL Cached User Posts Pages
+
+    Update Returns True If Page Changed and None If Page Must be Dropped Together with Next
+    Pages of Same Limit
+    """
+    # Sibling Workers Drop Their Pages of This User Even If Nothing is Cached Here
+    cache_invalidation_bus.publish(user_email)
+
+    if CACHE_SHARED:
+        # Patches of Same Pages from Several Workers Could Lose Posts -> Drop Index,
+        # Next Read Starts New Generation
+        await cache.delete(_get_index_cache_key(user_email))
+        return
+
+    async with user_posts_locks.lock(user_email):
+        # Get Index of User Pages
+        index, index_key = await get_user_posts_index_and_index_key(
+            user_email=user_email
+        )
+        index: dict | None
+        index_key: str
+        if index is None:
+            # Nothing Cached for This User
+            return
+
+        # New Version Rejects Pages Which are Being Built from DB Right Now
+        index["version"] += 1
+
+        # Limit -> Lowest Cursor of Dropped Page, Pages of Same Limit from It On are Rebuilt from DB
+        dropped_after_ids: dict[int, int] = {}
+        updated_pages: list[tuple[str, dict, bool | None]] = []
+        for cache_key in index["pages_keys"]:
+            cached_page: dict | None = await cache.get(cache_key, None)
+            if cached_page is None:
+                # Page Already Expired -> Drop It from Index
+                continue
+
+            changed: bool | None = update_page(cached_page)
+            if changed is None:
+                dropped_after_ids[cached_page["limit"]] = min(
+                    cached_page["after_id"],
+                    dropped_after_ids.get(cached_page["limit"], cached_page["after_id"])
                 )
+            updated_pages.append((cache_key, cached_page, changed))
 
-        # If Post = List Object -> Than Mean Called This Function from "Get Posts API"
-        if isinstance(post, list):
-            # Add Into Cached Posts ALL User Posts
-            cached_posts: list[dict] = post
+        alive_pages_keys: list[str] = []
+        for cache_key, cached_page, changed in updated_pages:
+            if cached_page["after_id"] >= dropped_after_ids.get(cached_page["limit"], float("inf")):
+                await cache.delete(cache_key)
+                continue
 
-        # Update Cache
-        await cache.set(cache_key, cached_posts)
+            if changed:
+                cached_page["version"] = index["version"]
+                cached_page["etag"] = make_etag(
+                    generation=index["generation"],
+                    version=index["version"]
+                )
 
-    return cached_posts
+                # Update Cache, Page Grown Too Large is Dropped by Cache Backend
+                if not await cache.set(cache_key, cached_page):
+                    continue
 
+            alive_pages_keys.append(cache_key)
 
-async def delete_post_from_cache(
+        index["pages_keys"] = alive_pages_keys
+        await cache.set(index_key, index)
+
+
+async def invalidate_user_posts_cache(
+        user_email: str
+) -> None:
+    """
+    Drop ALL Cached User Posts Pages After His Posts Changed in Other Worker
+    """
+    # Pin Is Only on Writer Worker -> Rebuild Here Must Not Read Replica Which Lags Behind Write
+    replica_router.mark_user_write(user_email)
+
+    if CACHE_SHARED:
+        # Writer Already Dropped Shared Index -> Only Copy in L1 of This Worker is Left
+        await cache.delete_local(_get_index_cache_key(user_email))
+        return
+
+    async with user_posts_locks.lock(user_email):
+        index, index_key = await get_user_posts_index_and_index_key(
+            user_email=user_email
+        )
+        index: dict | None
+        index_key: str
+        if index is None:
+            return
+
+        # Without Index Pages are Unreachable and Pages Being Built Now are Not Stored
+        await cache.delete(index_key)
+        for cache_key in index["pages_keys"]:
+            await cache.delete(cache_key)
+
+
+async def add_posts_into_cache(
         user_email: str,
-        post_id: int
+        posts: list[dict]
 ) -> None:
     """
-    Update Cached Posts List Without Deleted Post
+    Update Cached Posts Pages With New Posts
     """
+    # Pages are Ordered by Post Id
+    new_posts: list[dict] = sorted(posts, key=lambda post: post["id"])
 
-    # Get Cached Posts and Cache Key
-    cached_posts, cache_key = await get_cached_posts_and_cache_key(
-        user_email=user_email
+    def add_posts_into_page(
+            cached_page: dict
+    ) -> bool:
+        """
+        Insert New Posts Into Page by Post Id Order, Return True If Page Changed
+        """
+        page_posts: list[dict] | None = None
+        changed: bool = False
+        for post in new_posts:
+            # Page Contains Only Posts After Its Cursor
+            if post["id"] <= cached_page["after_id"]:
+                continue
+
+            if page_posts is None:
+                page_posts: list[dict] = orjson.loads(cached_page["body"])["posts"]
+            page_posts_ids: list[int] = [page_post["id"] for page_post in page_posts]
+
+            # Page Built After Post Was Saved Already Contains It
+            if post["id"] in page_posts_ids:
+                continue
+
+            if page_posts_ids and post["id"] > page_posts_ids[-1]:
+                if cached_page["next_cursor"]:
+                    # Post is After Last Post of Page -> It is on One of Next Pages
+                    continue
+
+                if len(page_posts) >= cached_page["limit"]:
+                    # Last Page is Full -> New Post Will be on Next Page
+                    cached_page["next_cursor"] = encode_cursor(
+                        user_id=cached_page["user_id"],
+                        post_id=page_posts_ids[-1]
+                    )
+                    changed = True
+                    continue
+
+            # Ids Could be Committed Out of Order -> Insert New Post in Its Sorted Position
+            page_posts.insert(
+                bisect.bisect(page_posts_ids, post["id"]),
+                {
+                    "id": post["id"],
+                    "user_email": user_email,
+                    "text": post["text"]
+                }
+            )
+            changed = True
+
+            if len(page_posts) > cached_page["limit"]:
+                # Overflow Post Moves to Next Page
+                page_posts.pop()
+                cached_page["next_cursor"] = encode_cursor(
+                    user_id=cached_page["user_id"],
+                    post_id=page_posts[-1]["id"]
+                )
+
+        if not changed:
+            return False
+
+        _update_cached_page_posts(cached_page, page_posts)
+        return True
+
+    await _update_user_posts_pages(
+        user_email=user_email,
+        update_page=add_posts_into_page
     )
-    cached_posts: list | None
-    cache_key: str
 
-    if cached_posts:
-        # Create List with Cached Post Without Specific Post
-        cached_posts: list = [post for post in cached_posts if post["id"] != post_id]
 
-        # Update Cache
-        await cache.set(cache_key, cached_posts)
+async def delete_posts_from_cache(
+        user_email: str,
+        post_ids: list[int]
+) -> None:
+    """
+    Update Cached Posts Pages Without Deleted Posts
+    """
+    deleted_posts_ids: set[int] = set(post_ids)
+
+    def delete_posts_from_page(
+            cached_page: dict
+    ) -> bool | None:
+        """
+        Remove Deleted Posts from Last Page, Return True If Page Changed and None If Page Must be Dropped
+        """
+        if deleted_posts_ids.isdisjoint(cached_page["posts_ids"]):
+            return False
+
+        if cached_page["next_cursor"]:
+            # Posts of Next Page Should Move Up -> Page and Next Pages are Rebuilt from DB
+            return None
+
+        # Create List with Cached Page Posts Without Specific Posts
+        page_posts: list[dict] = [
+            post for post in orjson.loads(cached_page["body"])["posts"] if post["id"] not in deleted_posts_ids
+        ]
+
+        _update_cached_page_posts(cached_page, page_posts)
+        return True
+
+    await _update_user_posts_pages(
+        user_email=user_email,
+        update_page=delete_posts_from_page
+    )
+
+
+async def delete_post_from_cache(
+        user_email: str,
+        post_id: int
+) -> None:
+    """
+    Update Cached Posts Pages Without Deleted Post
+    """
+    await delete_posts_from_cache(
+        user_email=user_email,
+        post_ids=[post_id]
+    )
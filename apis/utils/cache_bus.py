@@ -0,0 +1,149 @@
+import asyncio
+import os
+import socket
+from typing import Awaitable, Callable
+
+from config.env import env
+from config.logger import logger
+
+# Cache Invalidation Bus Conf -> Workers on One Host Tell Each Other Which User Posts Changed
+CACHE_INVALIDATION_BUS: bool = env.bool("CACHE_INVALIDATION_BUS", False)
+CACHE_INVALIDATION_BUS_DIR: str = env("CACHE_INVALIDATION_BUS_DIR", "/tmp/fast_api_mvc_cache_bus")
+
+# Invalidation Message is User Email -> Bigger Datagrams are Not Expected
+MAX_MESSAGE_BYTES: int = 1024
+
+
+class CacheInvalidationBus:
+    """
+    Broadcast Invalidations of User Posts Cache to Sibling Workers over Unix Datagram Sockets
+
+    Each Worker Binds "<pid>.sock" in Shared Directory and Sends Every Invalidation to ALL Other
+    Sockets There, Sockets of Dead Workers are Removed on First Failed Send
+    """
+
+    def __init__(
+            self,
+            directory: str
+    ):
+        self.directory: str = directory
+        self.path: str | None = None
+        self._socket: socket.socket | None = None
+        self._on_invalidate: Callable[[str], Awaitable[None]] | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+        # Bus Counters
+        self.stats: dict[str, int] = {
+            "sent": 0,
+            "received": 0,
+            "dropped": 0
+        }
+
+    @property
+    def is_started(self) -> bool:
+        """
+        Check If Worker Socket is Bound
+        """
+        return self._socket is not None
+
+    def start(
+            self,
+            on_invalidate: Callable[[str], Awaitable[None]],
+            name: str | None = None
+    ) -> None:
+        """
+        Bind Worker Socket (Named by Worker PID by Default) and Call "on_invalidate"
+        with User Email of Every Received Invalidation
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        self.path = os.path.join(self.directory, f"{name or os.getpid()}.sock")
+
+        # Socket Left by Dead Process with Same PID
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._socket.setblocking(False)
+        self._socket.bind(self.path)
+
+        self._on_invalidate = on_invalidate
+        asyncio.get_running_loop().add_reader(self._socket.fileno(), self._receive)
+
+    async def close(self) -> None:
+        """
+        Stop Receiving, Wait for Running Invalidations and Remove Worker Socket
+        """
+        if self._socket is None:
+            return
+
+        asyncio.get_running_loop().remove_reader(self._socket.fileno())
+        self._socket.close()
+        self._socket = None
+
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def publish(
+            self,
+            user_email: str
+    ) -> None:
+        """
+        Send Invalidation of User Posts Cache to ALL Sibling Workers Without Waiting
+        """
+        if self._socket is None:
+            return
+
+        message: bytes = user_email.encode('utf-8')
+        for name in os.listdir(self.directory):
+            path: str = os.path.join(self.directory, name)
+            if path == self.path or not name.endswith(".sock"):
+                continue
+
+            try:
+                self._socket.sendto(message, path)
+                self.stats["sent"] += 1
+            except (ConnectionRefusedError, FileNotFoundError):
+                # Worker is Gone -> Remove Its Socket
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+            except OSError as e:
+                # Receiver Queue is Full -> Its Pages Stay Stale Until TTL
+                self.stats["dropped"] += 1
+                logger.error(f"An error occurred while send cache invalidation to {name} | {e}")
+
+    def _receive(self) -> None:
+        """
+        Read ALL Waiting Invalidations and Apply Each in Own Task
+        """
+        while self._socket is not None:
+            try:
+                message: bytes = self._socket.recv(MAX_MESSAGE_BYTES)
+            except BlockingIOError:
+                return
+
+            self.stats["received"] += 1
+
+            task: asyncio.Task = asyncio.create_task(self._on_invalidate(message.decode('utf-8')))
+            self._tasks.add(task)
+            task.add_done_callback(self._on_invalidate_done)
+
+    def _on_invalidate_done(
+            self,
+            task: asyncio.Task
+    ) -> None:
+        """
+        Forget Finished Invalidation and Log Its Error
+        """
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"An error occurred while invalidate posts cache | {task.exception()}")
+
+
+cache_invalidation_bus: CacheInvalidationBus = CacheInvalidationBus(CACHE_INVALIDATION_BUS_DIR)
@@ -0,0 +1,26 @@
+def make_etag(
+        generation: str,
+        version: int
+) -> str:
+    """
+    Make Strong ETag from (Generation, Version) of Cached User Posts
+    """
+    return f'"{generation}-{version}"'
+
+
+def etag_matches(
+        if_none_match: str | None,
+        etag: str | None
+) -> bool:
+    """
+    Check If Any ETag from "If-None-Match" Header Matches Current ETag (Weak Comparison)
+    """
+    if not if_none_match or not etag:
+        return False
+
+    for client_etag in if_none_match.split(","):
+        client_etag: str = client_etag.strip()
+        if client_etag == "*" or client_etag.removeprefix("W/") == etag:
+            return True
+
+    return False
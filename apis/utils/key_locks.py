@@ -0,0 +1,32 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+
+class KeyLocks:
+    """
+    Asyncio Locks by Key, Lock is Dropped When Nobody Holds or Waits for It
+    """
+
+    def __init__(self):
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._users: dict[str, int] = {}
+
+    @asynccontextmanager
+    async def lock(
+            self,
+            key: str
+    ) -> AsyncIterator[None]:
+        """
+        Hold Lock by Key
+        """
+        lock: asyncio.Lock = self._locks.setdefault(key, asyncio.Lock())
+        self._users[key] = self._users.get(key, 0) + 1
+        try:
+            async with lock:
+                yield
+        finally:
+            self._users[key] -= 1
+            if not self._users[key]:
+                del self._users[key]
+                del self._locks[key]
@@ -0,0 +1,193 @@
+import asyncio
+import sys
+from collections import OrderedDict
+
+from aiocache.base import BaseCache
+from aiocache.serializers import NullSerializer
+
+
+class BoundedMemoryCache(BaseCache):
+    """
+    In-Process Memory Cache with Total Byte Budget and LRU Eviction
+
+    Config options on top of :class:`aiocache.SimpleMemoryCache` ones are:
+
+    :param max_bytes: total size of ALL stored values, least recently used values are evicted above it.
+    :param max_entry_bytes: size of one value, bigger values are not cached at all.
+    """
+
+    NAME = "bounded_memory"
+
+    def __init__(
+            self,
+            serializer=None,
+            max_bytes: int = 64 * 1024 * 1024,
+            max_entry_bytes: int = 4 * 1024 * 1024,
+            **kwargs
+    ):
+        super().__init__(serializer=serializer or NullSerializer(), **kwargs)
+
+        self.max_bytes: int = max_bytes
+        self.max_entry_bytes: int = max_entry_bytes
+
+        self._cache: OrderedDict[str, object] = OrderedDict()
+        self._sizes: dict[str, int] = {}
+        self._handlers: dict[str, asyncio.TimerHandle] = {}
+
+        # Memory Accounting Counters
+        self.stats: dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "skipped": 0,
+            "entries": 0,
+            "bytes": 0
+        }
+
+    @classmethod
+    def _sizeof(
+            cls,
+            value: object
+    ) -> int:
+        """
+        Get Size of Stored Value in Bytes, Containers are Counted with Their Items
+        """
+        if isinstance(value, (bytes, bytearray, str)):
+            return len(value)
+        if isinstance(value, dict):
+            return sys.getsizeof(value) + sum(cls._sizeof(item) for item in value.values())
+        if isinstance(value, (list, tuple)):
+            return sys.getsizeof(value) + sum(cls._sizeof(item) for item in value)
+        return sys.getsizeof(value)
+
+    async def _get(self, key, encoding="utf-8", _conn=None):
+        if key not in self._cache:
+            self.stats["misses"] += 1
+            return None
+
+        # Mark Key as Most Recently Used
+        self._cache.move_to_end(key)
+        self.stats["hits"] += 1
+        return self._cache[key]
+
+    async def _gets(self, key, encoding="utf-8", _conn=None):
+        return await self._get(key, encoding=encoding, _conn=_conn)
+
+    async def _multi_get(self, keys, encoding="utf-8", _conn=None):
+        return [await self._get(key, encoding=encoding) for key in keys]
+
+    async def _set(self, key, value, ttl=None, _cas_token=None, _conn=None):
+        if _cas_token is not None and _cas_token != self._cache.get(key):
+            return 0
+
+        size: int = self._sizeof(value)
+        if size > self.max_entry_bytes:
+            # Value is Too Large -> Drop Old Value Too, It is Not Actual Anymore
+            self._delete_key(key)
+            self.stats["skipped"] += 1
+            return False
+
+        self._delete_key(key)
+
+        self._cache[key] = value
+        self._sizes[key] = size
+        self.stats["bytes"] += size
+        self.stats["entries"] += 1
+
+        if ttl:
+            loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+            self._handlers[key] = loop.call_later(ttl, self._delete_key, key)
+
+        # Evict Least Recently Used Values Until Cache Fits Into Byte Budget
+        while self.stats["bytes"] > self.max_bytes:
+            oldest_key: str = next(iter(self._cache))
+            self._delete_key(oldest_key)
+            self.stats["evictions"] += 1
+
+        return True
+
+    async def _multi_set(self, pairs, ttl=None, _conn=None):
+        for key, value in pairs:
+            await self._set(key, value, ttl=ttl)
+        return True
+
+    async def _add(self, key, value, ttl=None, _conn=None):
+        if key in self._cache:
+            raise ValueError("Key {} already exists, use .set to update the value".format(key))
+
+        await self._set(key, value, ttl=ttl)
+        return True
+
+    async def _exists(self, key, _conn=None):
+        return key in self._cache
+
+    async def _increment(self, key, delta, _conn=None):
+        if key not in self._cache:
+            value: int = delta
+        else:
+            try:
+                value: int = int(self._cache[key]) + delta
+            except ValueError:
+                raise TypeError("Value is not an integer") from None
+
+        handle: asyncio.TimerHandle | None = self._handlers.pop(key, None)
+        await self._set(key, value)
+        if handle:
+            self._handlers[key] = handle
+        return value
+
+    async def _expire(self, key, ttl, _conn=None):
+        if key in self._cache:
+            handle: asyncio.TimerHandle | None = self._handlers.pop(key, None)
+            if handle:
+                handle.cancel()
+            if ttl:
+                loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+                self._handlers[key] = loop.call_later(ttl, self._delete_key, key)
+            return True
+
+        return False
+
+    async def _delete(self, key, _conn=None):
+        return self._delete_key(key)
+
+    async def _clear(self, namespace=None, _conn=None):
+        for key in list(self._cache):
+            if not namespace or key.startswith(namespace):
+                self._delete_key(key)
+        return True
+
+    async def _raw(self, command, *args, encoding="utf-8", _conn=None, **kwargs):
+        return getattr(self._cache, command)(*args, **kwargs)
+
+    async def _redlock_release(self, key, value):
+        if self._cache.get(key) == value:
+            self._delete_key(key)
+            return 1
+        return 0
+
+    def _delete_key(
+            self,
+            key: str
+    ) -> int:
+        """
+        Delete Value by Key and Update Memory Accounting
+        """
+        if key not in self._cache:
+            return 0
+
+        del self._cache[key]
+        self.stats["bytes"] -= self._sizes.pop(key)
+        self.stats["entries"] -= 1
+
+        handle: asyncio.TimerHandle | None = self._handlers.pop(key, None)
+        if handle:
+            handle.cancel()
+        return 1
+
+    @classmethod
+    def parse_uri_path(cls, path):
+        return {}
+
+    def __repr__(self):
+        return "BoundedMemoryCache ({} of {} bytes)".format(self.stats["bytes"], self.max_bytes)
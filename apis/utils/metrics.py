@@ -0,0 +1,274 @@
+import asyncio
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from apis.utils.cache import get_cache_stats
+from config.database import engine, replica_router
+
+# Histograms Buckets (in seconds or in queries)
+LATENCY_BUCKETS: tuple[float, ...] = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERIES_BUCKETS: tuple[float, ...] = (0, 1, 2, 3, 5, 10, 20, 50)
+
+# Event Loop Lag Probe Interval (in seconds)
+LOOP_LAG_INTERVAL_S: float = 0.5
+
+# DB Queries (Count, Seconds) of Current Request
+_request_queries: ContextVar[list | None] = ContextVar("request_queries", default=None)
+
+
+class Histogram:
+    """
+    Prometheus Histogram with Labels, Observation is Only Bucket Search and Two Additions
+    """
+
+    def __init__(
+            self,
+            name: str,
+            description: str,
+            label_names: tuple[str, ...],
+            buckets: tuple[float, ...]
+    ):
+        self.name: str = name
+        self.description: str = description
+        self.label_names: tuple[str, ...] = label_names
+        self.buckets: tuple[float, ...] = buckets
+
+        # Label Values -> [Count per Bucket (Last is +Inf), Sum]
+        self._series: dict[tuple[str, ...], list] = {}
+
+    def observe(
+            self,
+            value: float,
+            *label_values: str
+    ) -> None:
+        """
+        Add Observed Value into Histogram Series of Label Values
+        """
+        series: list | None = self._series.get(label_values)
+        if series is None:
+            series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0]
+
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def render(self) -> list[str]:
+        """
+        Render Histogram in Prometheus Text Format
+        """
+        lines: list[str] = [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} histogram"
+        ]
+        for label_values, (counts, total) in sorted(self._series.items()):
+            labels: str = ",".join(
+                f'{name}="{_escape(value)}"' for name, value in zip(self.label_names, label_values)
+            )
+            prefix: str = f"{labels}," if labels else ""
+
+            cumulative: int = 0
+            for bucket, count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{{prefix}le="{bucket}"}} {cumulative}')
+
+            labels_block: str = f"{{{labels}}}" if labels else ""
+            lines.append(f"{self.name}_sum{labels_block} {total}")
+            lines.append(f"{self.name}_count{labels_block} {cumulative}")
+
+        return lines
+
+
+def _escape(
+        value: str
+) -> str:
+    """
+    Escape Label Value for Prometheus Text Format
+    """
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# Application Histograms
+request_duration: Histogram = Histogram(
+    name="http_request_duration_seconds",
+    description="HTTP request latency, _count is the count of requests",
+    label_names=("method", "route", "status"),
+    buckets=LATENCY_BUCKETS
+)
+request_db_queries: Histogram = Histogram(
+    name="http_request_db_queries",
+    description="DB queries done while handling one HTTP request",
+    label_names=("method", "route"),
+    buckets=QUERIES_BUCKETS
+)
+request_db_duration: Histogram = Histogram(
+    name="http_request_db_duration_seconds",
+    description="Time of DB queries done while handling one HTTP request",
+    label_names=("method", "route"),
+    buckets=LATENCY_BUCKETS
+)
+password_hashing_duration: Histogram = Histogram(
+    name="password_hashing_duration_seconds",
+    description="Time of bcrypt hash or check including wait for hashing executor",
+    label_names=("operation",),
+    buckets=LATENCY_BUCKETS
+)
+event_loop_lag: Histogram = Histogram(
+    name="event_loop_lag_seconds",
+    description="Delay of event loop callbacks behind their schedule",
+    label_names=(),
+    buckets=LATENCY_BUCKETS
+)
+
+
+class MetricsMiddleware:
+    """
+    ASGI Middleware Observing Latency and DB Queries of Each HTTP Request by Route Template
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        started: float = time.perf_counter()
+        status: list[int] = [500]
+        queries: list = [0, 0.0]
+        token = _request_queries.set(queries)
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            _request_queries.reset(token)
+
+            # Route Template Instead of Path -> Series Count Doesn't Grow with Ids in Paths
+            route = scope.get("route")
+            route_path: str = route.path if route is not None else "unmatched"
+
+            request_duration.observe(time.perf_counter() - started, scope["method"], route_path, str(status[0]))
+            request_db_queries.observe(queries[0], scope["method"], route_path)
+            request_db_duration.observe(queries[1], scope["method"], route_path)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._metrics_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    queries: list | None = _request_queries.get()
+    if queries is not None:
+        queries[0] += 1
+        queries[1] += time.perf_counter() - context._metrics_started
+
+
+def instrument_engine(
+        db_engine: AsyncEngine
+) -> None:
+    """
+    Count Queries and Their Time of Engine into Current Request Metrics
+    """
+    event.listen(db_engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(db_engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+for _db_engine in (engine, *replica_router.replicas):
+    instrument_engine(_db_engine)
+
+
+class LoopLagMonitor:
+    """
+    Background Task Measuring How Late Event Loop Wakes Up Sleeping Task
+    """
+
+    def __init__(
+            self,
+            interval_s: float
+    ):
+        self.interval_s: float = interval_s
+        self._task: asyncio.Task | None = None
+
+    async def _run(self) -> None:
+        while True:
+            scheduled: float = time.perf_counter() + self.interval_s
+            await asyncio.sleep(self.interval_s)
+            event_loop_lag.observe(max(0.0, time.perf_counter() - scheduled))
+
+    def start(self) -> None:
+        """
+        Start Measuring Event Loop Lag
+        """
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stop Measuring Event Loop Lag
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+loop_lag_monitor: LoopLagMonitor = LoopLagMonitor(
+    interval_s=LOOP_LAG_INTERVAL_S
+)
+
+
+def _render_cache_metrics() -> list[str]:
+    """
+    Render Posts Cache Counters Collected by Cache Itself
+    """
+    cache_stats: dict = get_cache_stats()
+
+    lines: list[str] = []
+    for name, stat, metric_type, description in (
+            ("posts_cache_hits_total", "hits", "counter", "Posts cache hits"),
+            ("posts_cache_misses_total", "misses", "counter", "Posts cache misses"),
+            ("posts_cache_evictions_total", "evictions", "counter", "Posts cache LRU evictions"),
+            ("posts_cache_stale_served_total", "stale_served", "counter", "Stale posts pages served while refreshing"),
+            ("posts_cache_coalesced_total", "coalesced", "counter", "Posts page builds awaited by other requests"),
+            ("posts_cache_invalidations_sent_total", "invalidations_sent", "counter",
+             "Posts cache invalidations sent to sibling workers"),
+            ("posts_cache_invalidations_received_total", "invalidations_received", "counter",
+             "Posts cache invalidations received from sibling workers"),
+            ("posts_cache_invalidations_dropped_total", "invalidations_dropped", "counter",
+             "Posts cache invalidations not delivered to sibling workers"),
+            ("posts_cache_entries", "entries", "gauge", "Posts cache entries"),
+            ("posts_cache_bytes", "bytes", "gauge", "Posts cache size in bytes")
+    ):
+        lines.extend(
+            [
+                f"# HELP {name} {description}",
+                f"# TYPE {name} {metric_type}",
+                f"{name} {cache_stats[stat]}"
+            ]
+        )
+
+    return lines
+
+
+def render_metrics() -> str:
+    """
+    Render ALL Metrics in Prometheus Text Format
+    """
+    lines: list[str] = []
+    for histogram in (request_duration, request_db_queries, request_db_duration, password_hashing_duration,
+                      event_loop_lag):
+        lines.extend(histogram.render())
+
+    lines.extend(_render_cache_metrics())
+
+    return "\n".join(lines) + "\n"
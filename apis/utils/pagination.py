@@ -0,0 +1,33 @@
+import base64
+import binascii
+
+
+def encode_cursor(
+        user_id: int,
+        post_id: int
+) -> str:
+    """
+    Encode Opaque Keyset Cursor from (User Id, Post Id)
+    """
+    raw_cursor: bytes = f"{user_id}:{post_id}".encode('utf-8')
+
+    return base64.urlsafe_b64encode(raw_cursor).decode('utf-8').rstrip("=")
+
+
+def decode_cursor(
+        cursor: str
+) -> tuple[int, int] | bool:
+    """
+    Decode Opaque Keyset Cursor into (User Id, Post Id)
+    """
+    try:
+        # Restore Base64 Padding Removed by Encoding
+        padded_cursor: str = cursor + "=" * (-len(cursor) % 4)
+
+        raw_cursor: str = base64.urlsafe_b64decode(padded_cursor.encode('utf-8')).decode('utf-8')
+
+        user_id, post_id = raw_cursor.split(":")
+
+        return int(user_id), int(post_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return False
@@ -0,0 +1,127 @@
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+import bcrypt
+
+from apis.utils.metrics import password_hashing_duration
+from config.env import env
+
+# Password Hashing Executor Conf
+PASSWORD_HASHER_EXECUTOR: str = env("PASSWORD_HASHER_EXECUTOR", "thread")  # thread | process
+PASSWORD_HASHER_WORKERS: int = env.int("PASSWORD_HASHER_WORKERS", 4)
+PASSWORD_HASHER_MAX_QUEUE: int = env.int("PASSWORD_HASHER_MAX_QUEUE", 64)
+
+_executor: Executor | None = None
+
+# Count of Hashing Jobs Running or Waiting in Executor
+_pending_jobs: int = 0
+
+
+class PasswordHasherBusy(Exception):
+    """
+    Raised When Password Hashing Executor Queue is Full
+    """
+
+
+def _hash_password(
+        password: bytes
+) -> bytes:
+    """
+    Create Hash of Password (Runs Inside Executor)
+    """
+    return bcrypt.hashpw(password, bcrypt.gensalt())
+
+
+def _check_password(
+        password: bytes,
+        hashed_password: bytes
+) -> bool:
+    """
+    Check Password with Hash (Runs Inside Executor)
+    """
+    return bcrypt.checkpw(password=password, hashed_password=hashed_password)
+
+
+def get_password_executor() -> Executor:
+    """
+    Get Password Hashing Executor and Create It on First Use
+    """
+    global _executor
+
+    if _executor is None:
+        if PASSWORD_HASHER_EXECUTOR == "process":
+            _executor = ProcessPoolExecutor(max_workers=PASSWORD_HASHER_WORKERS)
+        else:
+            # Bcrypt Releases GIL -> Threads Hash in Parallel Too
+            _executor = ThreadPoolExecutor(
+                max_workers=PASSWORD_HASHER_WORKERS,
+                thread_name_prefix="password_hasher"
+            )
+
+    return _executor
+
+
+def shutdown_password_executor() -> None:
+    """
+    Stop Password Hashing Executor Workers
+    """
+    global _executor
+
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+async def _run_in_password_executor(
+        operation: str,
+        func,
+        *args
+):
+    """
+    Run Password Hashing Job in Executor or Fail Fast If Queue is Full
+    """
+    global _pending_jobs
+
+    if _pending_jobs >= PASSWORD_HASHER_WORKERS + PASSWORD_HASHER_MAX_QUEUE:
+        raise PasswordHasherBusy("Too Many Password Hashing Requests, Try Again Later")
+
+    _pending_jobs += 1
+    started: float = time.perf_counter()
+    try:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_password_executor(), func, *args)
+    finally:
+        _pending_jobs -= 1
+        password_hashing_duration.observe(time.perf_counter() - started, operation)
+
+
+async def hash_password(
+        password: str
+) -> str:
+    """
+    Create Hash of Password without Blocking Event Loop
+    """
+    hashed_password: bytes = await _run_in_password_executor(
+        "hash",
+        _hash_password,
+        password.encode('utf-8')
+    )
+
+    # User Password Column is String
+    return hashed_password.decode('utf-8')
+
+
+async def check_password(
+        password: str,
+        hashed_password: str
+) -> bool:
+    """
+    Check Password with Hash without Blocking Event Loop
+    """
+    return await _run_in_password_executor(
+        "check",
+        _check_password,
+        password.encode('utf-8'),
+        hashed_password.encode('utf-8')
+    )
@@ -0,0 +1,96 @@
+from sqlalchemy import Insert, CursorResult, Result, insert, text
+from sqlalchemy.engine import Dialect
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config.logger import logger
+from config.models import Post
+
+# Max Size of Posts Texts in One INSERT Statement (MySQL max_allowed_packet is 64 MB by Default)
+INSERT_CHUNK_BYTES: int = 16 * 1024 * 1024
+
+# Is MySQL Server Giving Consecutive Ids to Multi-Row INSERT, Checked Once
+_mysql_consecutive_ids: list[bool] = []
+
+
+async def _has_mysql_consecutive_ids(
+        session: AsyncSession
+) -> bool:
+    """
+    Check MySQL Auto-Increment Settings -> Only "Traditional" or "Consecutive" Lock Mode
+    with Increment 1 Gives Multi-Row INSERT Ids Following One by One from LAST_INSERT_ID
+    """
+    if not _mysql_consecutive_ids:
+        result: Result = await session.execute(
+            text("SELECT @@innodb_autoinc_lock_mode, @@auto_increment_increment")
+        )
+        lock_mode, increment = result.one()
+
+        _mysql_consecutive_ids.append(int(lock_mode) < 2 and int(increment) == 1)
+        if not _mysql_consecutive_ids[0]:
+            logger.warning(
+                f"MySQL innodb_autoinc_lock_mode is {lock_mode} and auto_increment_increment is {increment}, "
+                f"posts are inserted with one INSERT per row, set innodb_autoinc_lock_mode=1 for multi-row INSERT"
+            )
+
+    return _mysql_consecutive_ids[0]
+
+
+async def insert_posts(
+        session: AsyncSession,
+        posts: list[dict]
+) -> list[int]:
+    """
+    Insert Posts with Multi-Row INSERTs Limited by Size and Get Their Ids in Input Order
+    """
+    posts_ids: list[int] = []
+
+    chunk: list[dict] = []
+    chunk_bytes: int = 0
+    for post in posts:
+        post_bytes: int = len(post["text"].encode('utf-8'))
+        if chunk and chunk_bytes + post_bytes > INSERT_CHUNK_BYTES:
+            posts_ids.extend(await _insert_posts_chunk(session, chunk))
+            chunk, chunk_bytes = [], 0
+
+        chunk.append(post)
+        chunk_bytes += post_bytes
+
+    posts_ids.extend(await _insert_posts_chunk(session, chunk))
+
+    return posts_ids
+
+
+async def _insert_posts_chunk(
+        session: AsyncSession,
+        posts: list[dict]
+) -> list[int]:
+    """
+    Insert Posts with One Multi-Row INSERT and Get Their Ids in Input Order
+    """
+    dialect: Dialect = session.get_bind().dialect
+
+    if dialect.insert_returning:
+        # One Multi-Row INSERT with RETURNING (SQLite, MariaDB, PostgreSQL)
+        query: Insert = insert(Post).values(posts).returning(Post.id)
+
+        # Execute Query
+        result: Result = await session.execute(query)
+
+        # Ids Grow in Rows Order Inside One Statement, RETURNING Order is Not Guaranteed
+        return sorted(result.scalars().all())
+
+    if dialect.name == "mysql" and await _has_mysql_consecutive_ids(session):
+        # One Multi-Row INSERT, Ids are Consecutive from First Inserted Row Id
+        query: Insert = insert(Post).values(posts)
+
+        # Execute Query
+        result: CursorResult = await session.execute(query)
+
+        return list(range(result.lastrowid, result.lastrowid + len(posts)))
+
+    # Interleaved Auto-Increment -> Ids are Read Row by Row, Still in One Transaction
+    post_objects: list[Post] = [Post(**post) for post in posts]
+    session.add_all(post_objects)
+    await session.flush()
+
+    return [post.id for post in post_objects]
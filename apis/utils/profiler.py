@@ -0,0 +1,134 @@
+import asyncio
+import cProfile
+import hmac
+import os
+import re
+import time
+
+from config.env import env
+from config.logger import logger
+
+# Request Profiler Conf -> Disabled Without Token, Profiles are Kept in Bounded Directory
+PROFILER_TOKEN: str | None = env("PROFILER_TOKEN", None)
+PROFILER_DIR: str = env("PROFILER_DIR", "/tmp/fast_api_mvc_profiles")
+PROFILER_KEEP: int = env.int("PROFILER_KEEP", 20)
+
+# Request Header with Profiler Token
+PROFILER_HEADER: bytes = b"x-profile"
+
+# Only Safe Characters from Request Path Go into Profile File Name
+_UNSAFE_NAME_CHARS: re.Pattern = re.compile(r"[^A-Za-z0-9_-]+")
+
+
+def is_profiler_token(
+        token: str | None
+) -> bool:
+    """
+    Check Profiler Token in Constant Time
+    """
+    if not PROFILER_TOKEN or not token:
+        return False
+
+    return hmac.compare_digest(token.encode('utf-8'), PROFILER_TOKEN.encode('utf-8'))
+
+
+def list_profiles() -> list[str]:
+    """
+    Get Names of Saved Profiles, Newest First
+    """
+    if not os.path.isdir(PROFILER_DIR):
+        return []
+
+    return sorted((name for name in os.listdir(PROFILER_DIR) if name.endswith(".prof")), reverse=True)
+
+
+def get_profile_path(
+        name: str
+) -> str | None:
+    """
+    Get Path of Saved Profile by Name, None If There is No Such Profile
+    """
+    if name not in list_profiles():
+        return None
+
+    return os.path.join(PROFILER_DIR, name)
+
+
+def _save_profile(
+        profile: cProfile.Profile,
+        name: str
+) -> None:
+    """
+    Save Profile Stats and Remove Oldest Profiles Above Limit (Runs in Thread)
+    """
+    os.makedirs(PROFILER_DIR, exist_ok=True)
+    profile.dump_stats(os.path.join(PROFILER_DIR, name))
+
+    for old_name in list_profiles()[PROFILER_KEEP:]:
+        os.remove(os.path.join(PROFILER_DIR, old_name))
+
+
+def _send_with_headers(
+        send,
+        headers: list[tuple[bytes, bytes]]
+):
+    """
+    Wrap ASGI Send to Add Headers into Response Start
+    """
+
+    async def wrapped_send(message):
+        if message["type"] == "http.response.start":
+            message["headers"] = [*message.get("headers", []), *headers]
+        await send(message)
+
+    return wrapped_send
+
+
+class ProfilerMiddleware:
+    """
+    ASGI Middleware Running Request Under cProfile When It Has Profiler Token Header,
+    Stats are Saved in pstats Format and Their File Name is Sent in "X-Profile-File" Header
+
+    cProfile Profiles Whole Thread -> Other Requests Awaited Meanwhile are in Stats Too,
+    So Only One Request is Profiled at a Time
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._profiling: bool = False
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        token: bytes | None = next(
+            (value for name, value in scope["headers"] if name == PROFILER_HEADER),
+            None
+        )
+        if token is None or not is_profiler_token(token.decode('latin-1')):
+            return await self.app(scope, receive, send)
+
+        if self._profiling:
+            # Other Request is Profiled Now -> Serve This One as Usual
+            return await self.app(scope, receive, _send_with_headers(send, [(b"x-profile-status", b"busy")]))
+
+        # Time in Name Keeps Profiles Sorted from Oldest to Newest
+        name: str = "{}_{}_{}.prof".format(
+            time.time_ns(),
+            scope["method"],
+            _UNSAFE_NAME_CHARS.sub("_", scope["path"]).strip("_") or "root"
+        )
+
+        self._profiling = True
+        profile: cProfile.Profile = cProfile.Profile()
+        profile.enable()
+        try:
+            await self.app(scope, receive, _send_with_headers(send, [(b"x-profile-file", name.encode('latin-1'))]))
+        finally:
+            profile.disable()
+            self._profiling = False
+
+            try:
+                await asyncio.to_thread(_save_profile, profile, name)
+            except Exception as e:
+                logger.error(f"An error occurred while save request profile | {e}")
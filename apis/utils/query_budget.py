@@ -0,0 +1,47 @@
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+class QueryBudgetExceeded(AssertionError):
+    """
+    Raised When Block of Code Runs More SQL Statements than Its Budget
+    """
+
+
+class QueryBudget:
+    """
+    Count SQL Statements Run on Engine Inside Block and Fail If There are More than Budget
+
+        with QueryBudget(engine, max_statements=2):
+            await client.get("/posts")
+    """
+
+    def __init__(
+            self,
+            db_engine: AsyncEngine,
+            max_statements: int
+    ):
+        self.db_engine: AsyncEngine = db_engine
+        self.max_statements: int = max_statements
+        self.statements: list[str] = []
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def __enter__(self):
+        self.statements = []
+        event.listen(self.db_engine.sync_engine, "after_cursor_execute", self._after_cursor_execute)
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        event.remove(self.db_engine.sync_engine, "after_cursor_execute", self._after_cursor_execute)
+
+        if exc_type is None and len(self.statements) > self.max_statements:
+            raise QueryBudgetExceeded(
+                "{} SQL statements, budget is {}:\n{}".format(
+                    len(self.statements),
+                    self.max_statements,
+                    "\n".join(f"  {statement}" for statement in self.statements)
+                )
+            )
+        return False
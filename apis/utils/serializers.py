@@ -0,0 +1,69 @@
+import zlib
+
+import msgpack
+from aiocache.serializers import BaseSerializer
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+class CompressedMsgPackSerializer(BaseSerializer):
+    """
+    Serialize Cache Values with msgpack and Compress Big Ones with zlib or zstd
+
+    First Byte of Stored Value Tells How the Rest is Compressed -> Values Written
+    with Other Compression Settings are Still Read
+
+    :param compression: "zlib", "zstd" (needs ``zstandard`` installed) or "none".
+    :param compress_min_bytes: smaller packed values are stored without compression.
+    """
+
+    # Values are Bytes -> Backends Must Not Decode Them
+    DEFAULT_ENCODING = None
+
+    RAW: bytes = b"\x00"
+    ZLIB: bytes = b"\x01"
+    ZSTD: bytes = b"\x02"
+
+    def __init__(
+            self,
+            *args,
+            compression: str = "zlib",
+            compress_min_bytes: int = 1024,
+            **kwargs
+    ):
+        if compression not in ("zlib", "zstd", "none"):
+            raise ValueError(f"Unknown cache compression {compression}, use zlib, zstd or none")
+        if compression == "zstd" and zstandard is None:
+            raise RuntimeError("zstandard not installed, zstd cache compression unavailable")
+
+        self.compression: str = compression
+        self.compress_min_bytes: int = compress_min_bytes
+        super().__init__(*args, **kwargs)
+
+    def dumps(self, value) -> bytes:
+        packed: bytes = msgpack.packb(value, use_bin_type=True)
+        if self.compression == "none" or len(packed) < self.compress_min_bytes:
+            return self.RAW + packed
+
+        if self.compression == "zstd":
+            return self.ZSTD + zstandard.ZstdCompressor().compress(packed)
+        return self.ZLIB + zlib.compress(packed)
+
+    def loads(self, value: bytes | None):
+        if value is None:
+            return None
+
+        header: bytes = value[:1]
+        if header == self.ZLIB:
+            packed: bytes = zlib.decompress(value[1:])
+        elif header == self.ZSTD:
+            if zstandard is None:
+                raise RuntimeError("zstandard not installed, can't read zstd compressed cache value")
+            packed: bytes = zstandard.ZstdDecompressor().decompress(value[1:])
+        else:
+            packed: bytes = value[1:]
+
+        return msgpack.unpackb(packed, raw=False)
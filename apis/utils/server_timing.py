@@ -0,0 +1,171 @@
+import random
+import time
+from contextvars import ContextVar
+
+import orjson
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from config.database import engine, replica_router
+from config.env import env
+from config.logger import logger
+
+# Server-Timing Conf -> Phases of Request are Timed Only When Enabled
+SERVER_TIMING: bool = env.bool("SERVER_TIMING", False)
+SERVER_TIMING_SLOW_MS: float = env.float("SERVER_TIMING_SLOW_MS", 500)  # Slower Requests are Logged
+SERVER_TIMING_SLOW_SAMPLE_RATE: float = env.float("SERVER_TIMING_SLOW_SAMPLE_RATE", 1.0)  # Part of Them Logged
+
+# Statement Text in Slow Request Log is Cut to This Length
+STATEMENT_LOG_LENGTH: int = 200
+
+# Timings of Current Request -> {"phases": {Phase: Seconds}, "statements": [(Statement, Seconds)]}
+_request_timings: ContextVar[dict | None] = ContextVar("request_timings", default=None)
+
+
+class ServerTimingPhase:
+    """
+    Time Block of Code as Request Phase, Does Nothing If Request is Not Timed
+
+        with ServerTimingPhase("cache"):
+            ...
+    """
+
+    __slots__ = ("phase", "_timings", "_started")
+
+    def __init__(
+            self,
+            phase: str
+    ):
+        self.phase: str = phase
+
+    def __enter__(self):
+        self._timings: dict | None = _request_timings.get()
+        if self._timings is not None:
+            self._started: float = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if self._timings is not None:
+            phases: dict[str, float] = self._timings["phases"]
+            phases[self.phase] = phases.get(self.phase, 0.0) + time.perf_counter() - self._started
+        return False
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _request_timings.get() is not None:
+        context._server_timing_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    timings: dict | None = _request_timings.get()
+    if timings is not None:
+        timings["statements"].append((statement, time.perf_counter() - context._server_timing_started))
+
+
+def instrument_engine(
+        db_engine: AsyncEngine
+) -> None:
+    """
+    Attribute Time of Every Statement of Engine to Request Which Ran It
+    """
+    event.listen(db_engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(db_engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+if SERVER_TIMING:
+    for _db_engine in (engine, *replica_router.replicas):
+        instrument_engine(_db_engine)
+
+
+def _format_server_timing(
+        timings: dict,
+        app_seconds: float
+) -> str:
+    """
+    Format Request Phases as "Server-Timing" Header Value (Durations in Milliseconds)
+    """
+    metrics: list[str] = [
+        f"{phase};dur={seconds * 1000:.3f}" for phase, seconds in timings["phases"].items()
+    ]
+
+    if timings["statements"]:
+        db_seconds: float = sum(seconds for _, seconds in timings["statements"])
+        metrics.append(f'db;dur={db_seconds * 1000:.3f};desc="{len(timings["statements"])} queries"')
+
+    metrics.append(f"app;dur={app_seconds * 1000:.3f}")
+
+    return ", ".join(metrics)
+
+
+class ServerTimingMiddleware:
+    """
+    ASGI Middleware Sending Request Phases Timings in "Server-Timing" Header
+    and Logging Slow Requests with Their Phases and Statements
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        started: float = time.perf_counter()
+        timings: dict = {
+            "phases": {},
+            "statements": []
+        }
+        status: list[int] = [500]
+        token = _request_timings.set(timings)
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (
+                        b"server-timing",
+                        _format_server_timing(timings, time.perf_counter() - started).encode('latin-1')
+                    )
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _request_timings.reset(token)
+
+            total_ms: float = (time.perf_counter() - started) * 1000
+            if total_ms >= SERVER_TIMING_SLOW_MS and random.random() < SERVER_TIMING_SLOW_SAMPLE_RATE:
+                self._log_slow_request(scope, status[0], total_ms, timings)
+
+    @staticmethod
+    def _log_slow_request(
+            scope: dict,
+            status: int,
+            total_ms: float,
+            timings: dict
+    ) -> None:
+        """
+        Log Slow Request as One JSON Line
+        """
+        logger.warning(
+            "Slow request | " + orjson.dumps(
+                {
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status": status,
+                    "total_ms": round(total_ms, 3),
+                    "phases_ms": {
+                        phase: round(seconds * 1000, 3) for phase, seconds in timings["phases"].items()
+                    },
+                    "statements": [
+                        {
+                            "sql": statement[:STATEMENT_LOG_LENGTH],
+                            "ms": round(seconds * 1000, 3)
+                        }
+                        for statement, seconds in timings["statements"]
+                    ]
+                }
+            ).decode('utf-8')
+        )
@@ -0,0 +1,57 @@
+import asyncio
+from typing import Any, Awaitable, Callable
+
+
+class SingleFlight:
+    """
+    Coalesce Concurrent Calls by Key -> Only One Call Runs, Others Await Its Result
+    """
+
+    def __init__(self):
+        self._in_flight: dict[str, asyncio.Task] = {}
+
+        # Coalescing Counters
+        self.stats: dict[str, int] = {
+            "calls": 0,
+            "coalesced": 0
+        }
+
+    def is_in_flight(
+            self,
+            key: str
+    ) -> bool:
+        """
+        Check If Call by Key is Running Now
+        """
+        return key in self._in_flight
+
+    def start(
+            self,
+            key: str,
+            func: Callable[[], Awaitable[Any]]
+    ) -> asyncio.Task:
+        """
+        Start Function by Key or Get Already Running Call with Same Key
+        """
+        task: asyncio.Task | None = self._in_flight.get(key)
+        if task is None:
+            self.stats["calls"] += 1
+
+            # Run Call in Own Task -> Cancelled Caller Doesn't Cancel Call for Others
+            task: asyncio.Task = asyncio.ensure_future(func())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            self.stats["coalesced"] += 1
+
+        return task
+
+    async def do(
+            self,
+            key: str,
+            func: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Run Function by Key or Join Already Running Call with Same Key
+        """
+        return await asyncio.shield(self.start(key, func))
@@ -0,0 +1,165 @@
+from aiocache.base import BaseCache
+from aiocache.serializers import NullSerializer
+
+from apis.utils.memory_cache import BoundedMemoryCache
+
+
+class TieredCache(BaseCache):
+    """
+    Shared Cache (L2) with Optional Small In-Process Cache (L1) in Front of It
+
+    L2 Serializes Values Itself, L1 Keeps Them as Objects for Short TTL -> Hot Keys
+    are Served Without Network Round Trip and Deserialization, Writes Go to Both Tiers
+
+    :param l2: shared cache (Redis, memcached or its in-process stand-in).
+    :param l1: in-process cache, None disables the first tier.
+    :param l1_ttl: seconds a value stays in L1, bounds how long other workers' writes are not seen.
+    """
+
+    NAME = "tiered"
+
+    def __init__(
+            self,
+            l2: BaseCache,
+            l1: BoundedMemoryCache | None = None,
+            l1_ttl: int = 5,
+            **kwargs
+    ):
+        super().__init__(serializer=NullSerializer(), **kwargs)
+
+        self.l2: BaseCache = l2
+        self.l1: BoundedMemoryCache | None = l1
+        self.l1_ttl: int = l1_ttl
+
+        # Counters of Both Tiers
+        self._counters: dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "l1_hits": 0
+        }
+
+    @property
+    def max_bytes(self) -> int:
+        """
+        Memory Limit of L1
+        """
+        return self.l1.max_bytes if self.l1 is not None else 0
+
+    @property
+    def max_entry_bytes(self) -> int:
+        """
+        Entry Size Limit of L1
+        """
+        return self.l1.max_entry_bytes if self.l1 is not None else 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Hits and Misses of Both Tiers and Memory Usage of L1
+        """
+        l1_stats: dict = self.l1.stats if self.l1 is not None else {}
+        return {
+            **self._counters,
+            "evictions": l1_stats.get("evictions", 0),
+            "skipped": l1_stats.get("skipped", 0),
+            "entries": l1_stats.get("entries", 0),
+            "bytes": l1_stats.get("bytes", 0)
+        }
+
+    def _get_l1_ttl(
+            self,
+            ttl: float | None
+    ) -> int:
+        """
+        Get TTL of Value in L1, Never Longer than Its TTL in L2
+        """
+        return min(int(ttl), self.l1_ttl) if ttl else self.l1_ttl
+
+    async def _get(self, key, encoding="utf-8", _conn=None):
+        if self.l1 is not None:
+            value = await self.l1.get(key)
+            if value is not None:
+                self._counters["hits"] += 1
+                self._counters["l1_hits"] += 1
+                return value
+
+        value = await self.l2.get(key)
+        if value is None:
+            self._counters["misses"] += 1
+            return None
+
+        self._counters["hits"] += 1
+        if self.l1 is not None:
+            await self.l1.set(key, value, ttl=self.l1_ttl)
+        return value
+
+    async def _gets(self, key, encoding="utf-8", _conn=None):
+        return await self.l2._gets(key, encoding=self.l2.serializer.encoding)
+
+    async def _multi_get(self, keys, encoding="utf-8", _conn=None):
+        return [await self._get(key) for key in keys]
+
+    async def _set(self, key, value, ttl=None, _cas_token=None, _conn=None):
+        stored: bool = await self.l2.set(key, value, ttl=int(ttl) if ttl else None, _cas_token=_cas_token)
+
+        if self.l1 is not None:
+            if stored:
+                await self.l1.set(key, value, ttl=self._get_l1_ttl(ttl))
+            else:
+                await self.l1.delete(key)
+        return stored
+
+    async def _multi_set(self, pairs, ttl=None, _conn=None):
+        for key, value in pairs:
+            await self._set(key, value, ttl=ttl)
+        return True
+
+    async def _add(self, key, value, ttl=None, _conn=None):
+        await self.l2.add(key, value, ttl=int(ttl) if ttl else None)
+
+        if self.l1 is not None:
+            await self.l1.set(key, value, ttl=self._get_l1_ttl(ttl))
+        return True
+
+    async def _exists(self, key, _conn=None):
+        return await self.l2.exists(key)
+
+    async def _increment(self, key, delta, _conn=None):
+        await self.delete_local(key)
+        return await self.l2.increment(key, delta)
+
+    async def _expire(self, key, ttl, _conn=None):
+        await self.delete_local(key)
+        return await self.l2.expire(key, ttl)
+
+    async def _delete(self, key, _conn=None):
+        await self.delete_local(key)
+        return await self.l2.delete(key)
+
+    async def _clear(self, namespace=None, _conn=None):
+        if self.l1 is not None:
+            await self.l1.clear(namespace=namespace)
+        return await self.l2.clear(namespace=namespace)
+
+    async def _raw(self, command, *args, encoding="utf-8", _conn=None, **kwargs):
+        return await self.l2.raw(command, *args, **kwargs)
+
+    async def _close(self, *args, _conn=None, **kwargs):
+        await self.l2.close()
+
+    async def delete_local(
+            self,
+            key: str
+    ) -> None:
+        """
+        Drop Value Only from L1, Shared Value is Kept
+        """
+        if self.l1 is not None:
+            await self.l1.delete(key)
+
+    @classmethod
+    def parse_uri_path(cls, path):
+        return {}
+
+    def __repr__(self):
+        return "TieredCache (L1 {}, L2 {})".format(self.l1, self.l2)
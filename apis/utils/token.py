@@ -3,18 +3,23 @@ from datetime import datetime, timedelta
 import jwt
 from fastapi import Depends
 from fastapi import Header
-from sqlalchemy import Select, Result
-from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload, sessionmaker
 
-from config.database import env
-from config.models import User
+from apis.utils.server_timing import ServerTimingPhase
+from apis.utils.token_cache import VerifiedTokenCache
+from apis.utils.user_loader import user_loader
+from config.env import env
+from config.schemas import Principal
 
 # JWT Conf
 SECRET_KEY = env("JWT_SECRET_KEY")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES: str = env("ACCESS_TOKEN_EXPIRE_MINUTES")
 
+# Verified Tokens Cache Conf -> Reused Token is Not Verified and Parsed Again Until Its Expiration
+JWT_CACHE_SIZE: int = env.int("JWT_CACHE_SIZE", 10000)  # 0 Disables Cache
+
+verified_tokens: VerifiedTokenCache = VerifiedTokenCache(JWT_CACHE_SIZE)
+
 
 def create_access_token(
         data: dict,
@@ -70,7 +75,7 @@ def decode_access_token(
         return False
 
 
-def get_token_from_header(
+async def get_token_from_header(
         authorization: str = Header(None)
 ) -> str | bool:
     """
@@ -81,40 +86,61 @@ def get_token_from_header(
     return authorization.split(" ")[1]
 
 
-def get_current_user_email(
+async def get_current_principal(
         token: str | bool = Depends(get_token_from_header)
-) -> str | bool:
+) -> Principal | bool:
     """
-    Get Current User Email by JWT Token
+    Get Current User Email and User Id by JWT Token without DB Query
+
+    Async -> Runs in Event Loop, Not in Thread Pool Like Sync Dependencies
     """
     if not token:
         return False
 
-    # Decode Token
-    decoded_token: dict | bool = decode_access_token(token)
-    if not decoded_token:
-        return False
+    with ServerTimingPhase("auth"):
+        # Token Already Verified by Earlier Request
+        principal: Principal | None = verified_tokens.get(token)
+        if principal is not None:
+            return principal
+
+        # Decode Token
+        decoded_token: dict | bool = decode_access_token(token)
+        if not decoded_token or not decoded_token.get("user_email", None):
+            return False
+
+        # Get User Email and User Id from Token, Old Tokens Have Only User Email
+        principal: Principal = Principal(
+            user_email=decoded_token["user_email"],
+            user_id=decoded_token.get("user_id", None)
+        )
 
-    # Get User Email from Token
-    user_email: str = decoded_token["user_email"]
+        # Tokens without Expiration are Verified Every Time
+        if decoded_token.get("exp", None) is not None:
+            verified_tokens.set(token, principal, expire=decoded_token["exp"])
 
-    return user_email
+    return principal
 
 
-async def get_current_user(
-        session,
+async def get_current_user_id(
         current_user_email: str
-) -> User:
+) -> int | None:
     """
-    Get Current User Object with Database Async Session and PreLoad User Posts
+    Get Current User Id from Short-Lived Cache or Together with Concurrent Lookups
     """
+    principal: Principal | None = await user_loader.load_principal(current_user_email)
 
-    # Get User with Email from Token
-    query: Select = select(User).filter_by(email=current_user_email).options(selectinload(User.posts))
+    return principal.user_id if principal else None
 
-    # Execute Query
-    result: Result = await session.execute(query)
 
-    user: User = result.scalars().first()
+async def get_principal_user_id(
+        principal: Principal
+) -> int | None:
+    """
+    Get User Id from Token Claim, Only Old Tokens without It Need DB Query
+    """
+    if principal.user_id is not None:
+        return principal.user_id
 
-    return user
+    return await get_current_user_id(
+        current_user_email=principal.user_email
+    )
@@ -0,0 +1,92 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU Cache of Already Verified Tokens Keyed by Token Digest
+
+    Entry Lives Until "exp" Claim of Its Token -> Expired Token is Never Served from Cache,
+    Only Tokens with Valid Signature are Stored, So Garbage Tokens Can't Evict Good Ones
+    """
+
+    def __init__(
+            self,
+            max_size: int
+    ):
+        self.max_size: int = max_size
+
+        # Token Digest -> (Value, Expire Timestamp)
+        self._entries: OrderedDict[bytes, tuple[Any, float]] = OrderedDict()
+
+        # Cache Counters
+        self.stats: dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0
+        }
+
+    @staticmethod
+    def _digest(
+            token: str
+    ) -> bytes:
+        """
+        Get Digest of Token -> Raw Tokens are Not Kept in Memory
+        """
+        return hashlib.blake2b(token.encode('utf-8'), digest_size=16).digest()
+
+    def get(
+            self,
+            token: str
+    ) -> Any | None:
+        """
+        Get Value of Verified Token, None If Token is Not Cached or Expired
+        """
+        digest: bytes = self._digest(token)
+        entry: tuple[Any, float] | None = self._entries.get(digest)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+
+        value, expire = entry
+        if expire <= time.time():
+            del self._entries[digest]
+            self.stats["misses"] += 1
+            return None
+
+        # Mark Token as Most Recently Used
+        self._entries.move_to_end(digest)
+        self.stats["hits"] += 1
+        return value
+
+    def set(
+            self,
+            token: str,
+            value: Any,
+            expire: float
+    ) -> None:
+        """
+        Save Value of Verified Token Until Its Expire Timestamp
+        """
+        if self.max_size <= 0:
+            return
+
+        digest: bytes = self._digest(token)
+        self._entries[digest] = (value, expire)
+        self._entries.move_to_end(digest)
+
+        # Evict Least Recently Used Tokens Above Size Limit
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def clear(self) -> None:
+        """
+        Forget ALL Verified Tokens
+        """
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,223 @@
+import asyncio
+import time
+from collections import OrderedDict
+
+from sqlalchemy import Select, Result
+from sqlalchemy.future import select
+
+from config.database import read_session, replica_router
+from config.env import env
+from config.logger import logger
+from config.models import User
+from config.schemas import Principal
+
+# User Loader Conf -> Lookups Queued Within Window are Loaded with One Query, Principals are Cached for TTL
+USER_LOADER_WINDOW_MS: float = env.float("USER_LOADER_WINDOW_MS", 0)  # 0 -> Lookups of Same Loop Iteration
+USER_LOADER_BATCH_SIZE: int = env.int("USER_LOADER_BATCH_SIZE", 100)
+USER_LOADER_TTL: float = env.float("USER_LOADER_TTL", 5)  # 5 Seconds
+USER_LOADER_CACHE_SIZE: int = env.int("USER_LOADER_CACHE_SIZE", 10000)
+
+
+class UserLoader:
+    """
+    DataLoader-Style Users Lookup by Email
+
+    Concurrent Lookups of Different Emails are Loaded with One "WHERE email IN (...)" Query,
+    Lookups of Email Which is Being Loaded Await Same Result, Found Principals are Cached
+    for Short TTL, Missing Users are Not -> Signup in Any Worker is Seen at Once
+
+    Returned Users are Detached from Session -> Their Relationships are Not Loaded
+    """
+
+    def __init__(
+            self,
+            window_ms: float,
+            max_batch_size: int,
+            ttl: float,
+            max_cached: int
+    ):
+        self.window_s: float = window_ms / 1000
+        self.max_batch_size: int = max_batch_size
+        self.ttl: float = ttl
+        self.max_cached: int = max_cached
+
+        # Lookups Queued or Being Loaded -> Email -> Future of User
+        self._futures: dict[str, asyncio.Future] = {}
+        self._queue: list[tuple[str, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._batches: set[asyncio.Task] = set()
+
+        # Email -> (Principal, Expire Time)
+        self._principals: OrderedDict[str, tuple[Principal, float]] = OrderedDict()
+
+        # Loader Counters
+        self.stats: dict[str, int] = {
+            "loads": 0,
+            "coalesced": 0,
+            "batches": 0,
+            "cache_hits": 0
+        }
+
+    async def load(
+            self,
+            email: str
+    ) -> User | None:
+        """
+        Load User by Email Together with Other Concurrent Lookups
+        """
+        future: asyncio.Future | None = self._futures.get(email)
+        if future is None:
+            self.stats["loads"] += 1
+
+            loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+            future: asyncio.Future = loop.create_future()
+            self._futures[email] = future
+            self._queue.append((email, future))
+
+            # First Lookup in Batch -> Load When Window Ends
+            if self._timer is None:
+                self._timer = loop.call_later(self.window_s, self._dispatch)
+        else:
+            self.stats["coalesced"] += 1
+
+        # Shield -> Cancelled Request Doesn't Break Lookup of Other Requests
+        return await asyncio.shield(future)
+
+    async def load_principal(
+            self,
+            email: str
+    ) -> Principal | None:
+        """
+        Get Principal of User by Email from Cache or Load It
+        """
+        entry: tuple[Principal, float] | None = self._principals.get(email)
+        if entry is not None and entry[1] > time.monotonic():
+            self._principals.move_to_end(email)
+            self.stats["cache_hits"] += 1
+            return entry[0]
+
+        user: User | None = await self.load(email)
+        if user is None:
+            return None
+
+        return Principal(
+            user_email=user.email,
+            user_id=user.id
+        )
+
+    def invalidate(
+            self,
+            email: str
+    ) -> None:
+        """
+        Forget Cached Principal and Running Lookups of Email -> Next Lookup Queries DB
+        """
+        self._principals.pop(email, None)
+        self._futures.pop(email, None)
+
+    def clear(self) -> None:
+        """
+        Forget ALL Cached Principals
+        """
+        self._principals.clear()
+
+    def _cache_principal(
+            self,
+            email: str,
+            user: User
+    ) -> None:
+        """
+        Cache Principal of Loaded User
+        """
+        principal: Principal = Principal(user_email=user.email, user_id=user.id)
+
+        self._principals[email] = (principal, time.monotonic() + self.ttl)
+        self._principals.move_to_end(email)
+
+        # Drop Least Recently Used Principals Above Limit
+        while len(self._principals) > self.max_cached:
+            self._principals.popitem(last=False)
+
+    def _dispatch(self) -> None:
+        """
+        Split Queued Lookups into Batches and Load Each in Background Task
+        """
+        self._timer = None
+        lookups: list[tuple[str, asyncio.Future]] = self._queue
+        self._queue = []
+
+        for start in range(0, len(lookups), self.max_batch_size):
+            task: asyncio.Task = asyncio.create_task(
+                self._load_batch(lookups[start:start + self.max_batch_size])
+            )
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _load_batch(
+            self,
+            lookups: list[tuple[str, asyncio.Future]]
+    ) -> None:
+        """
+        Load Users of Batch with One Query and Resolve Their Lookups
+        """
+        self.stats["batches"] += 1
+        emails: list[str] = [email for email, _ in lookups]
+
+        try:
+            # Read Your Writes -> Batch with Just Written User is Read from Primary
+            pinned_email: str | None = next(
+                (email for email in emails if replica_router.is_user_pinned(email)),
+                None
+            )
+
+            async with read_session(user_email=pinned_email) as session:
+                query: Select = select(User).where(User.email.in_(emails))
+
+                # Execute Query
+                result: Result = await session.execute(query)
+
+                # MySQL Matches Emails Case-Insensitively -> Match Rows to Lookups Same Way
+                users: dict[str, User] = {user.email.lower(): user for user in result.scalars()}
+        except Exception as e:
+            logger.error(f"An error occurred while load users | {e}")
+            for email, future in lookups:
+                self._resolve(email, future, exception=e)
+            return
+
+        for email, future in lookups:
+            user: User | None = users.get(email.lower())
+
+            # Lookup Invalidated While Loading -> Its Result Must Not be Cached
+            # Missing User is Not Cached -> Signup Handled by Other Worker is Not Broadcast Here
+            if user is not None and self._futures.get(email) is future:
+                self._cache_principal(email, user)
+
+            self._resolve(email, future, user=user)
+
+    def _resolve(
+            self,
+            email: str,
+            future: asyncio.Future,
+            user: User | None = None,
+            exception: Exception | None = None
+    ) -> None:
+        """
+        Give Result to Lookup Awaiting It and Forget Lookup
+        """
+        if self._futures.get(email) is future:
+            del self._futures[email]
+
+        if future.done():
+            return
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(user)
+
+
+user_loader: UserLoader = UserLoader(
+    window_ms=USER_LOADER_WINDOW_MS,
+    max_batch_size=USER_LOADER_BATCH_SIZE,
+    ttl=USER_LOADER_TTL,
+    max_cached=USER_LOADER_CACHE_SIZE
+)
@@ -0,0 +1,191 @@
+import asyncio
+import time
+
+from sqlalchemy.orm import sessionmaker
+
+from apis.utils.post_inserts import insert_posts
+from config.database import async_session
+from config.env import env
+from config.logger import logger
+
+# Group Commit Conf -> Posts Arrived Within Window or Up to Batch Size are Saved in One Transaction
+POST_WRITE_BATCHING: bool = env.bool("POST_WRITE_BATCHING", False)
+POST_WRITE_BATCH_WINDOW_MS: float = env.float("POST_WRITE_BATCH_WINDOW_MS", 5)
+POST_WRITE_BATCH_SIZE: int = env.int("POST_WRITE_BATCH_SIZE", 100)
+
+
+class PostWriteBatcher:
+    """
+    Collect Posts from Concurrent Requests and Insert Them with One Commit
+    """
+
+    def __init__(
+            self,
+            session_maker: sessionmaker,
+            window_ms: float,
+            max_batch_size: int
+    ):
+        self.session_maker: sessionmaker = session_maker
+        self.window_s: float = window_ms / 1000
+        self.max_batch_size: int = max_batch_size
+
+        # Posts Waiting for Commit -> (Post Row, Future of Post Id, Enqueue Time)
+        self._pending: list[tuple[dict, asyncio.Future, float]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._flushes: set[asyncio.Task] = set()
+
+        # Batching Counters
+        self.stats: dict = {
+            "batches": 0,
+            "posts": 0,
+            "failed_batches": 0,
+            "max_batch_size": 0,
+            "wait_ms_total": 0.0,
+            "max_wait_ms": 0.0,
+            "batch_sizes": {}  # Upper Bound of Size (Power of 2) -> Count of Batches
+        }
+
+    async def add(
+            self,
+            post: dict
+    ) -> int:
+        """
+        Add Post Row Into Next Batch and Wait for Its Id After Commit
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending.append((post, future, time.perf_counter()))
+
+        if len(self._pending) >= self.max_batch_size:
+            # Batch is Full -> Commit Right Now
+            self._start_flush()
+        elif self._timer is None:
+            # First Post in Batch -> Commit When Window Ends
+            self._timer = loop.call_later(self.window_s, self._start_flush)
+
+        # Shield -> Cancelled Request Doesn't Break Commit of Other Posts in Batch
+        return await asyncio.shield(future)
+
+    def _start_flush(self) -> None:
+        """
+        Take Pending Posts as One Batch and Commit Them in Background Task
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch: list[tuple[dict, asyncio.Future, float]] = self._pending
+        self._pending = []
+        if not batch:
+            return
+
+        task: asyncio.Task = asyncio.ensure_future(self._flush(batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush(
+            self,
+            batch: list[tuple[dict, asyncio.Future, float]]
+    ) -> None:
+        """
+        Insert Batch of Posts in One Transaction and Resolve Each Request with Its Post Id
+        """
+        started: float = time.perf_counter()
+        self._record_batch(batch, started)
+
+        try:
+            async with self.session_maker() as session:
+                posts_ids: list[int] = await insert_posts(
+                    session=session,
+                    posts=[post for post, _, _ in batch]
+                )
+                await session.commit()
+        except Exception as e:
+            logger.error(f"An error occurred while commit posts batch, retry posts one by one | {e}")
+            self.stats["failed_batches"] += 1
+
+            # One Bad Post Must Not Fail Other Posts -> Commit Each Post Separately
+            for post, future, _ in batch:
+                await self._flush_one(post, future)
+            return
+
+        for (_, future, _), post_id in zip(batch, posts_ids):
+            if not future.done():
+                future.set_result(post_id)
+
+    async def _flush_one(
+            self,
+            post: dict,
+            future: asyncio.Future
+    ) -> None:
+        """
+        Insert One Post in Own Transaction and Resolve Its Request
+        """
+        try:
+            async with self.session_maker() as session:
+                posts_ids: list[int] = await insert_posts(
+                    session=session,
+                    posts=[post]
+                )
+                await session.commit()
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+            return
+
+        if not future.done():
+            future.set_result(posts_ids[0])
+
+    def _record_batch(
+            self,
+            batch: list[tuple[dict, asyncio.Future, float]],
+            started: float
+    ) -> None:
+        """
+        Save Batch Size and Wait Times of Its Posts into Counters
+        """
+        batch_size: int = len(batch)
+        self.stats["batches"] += 1
+        self.stats["posts"] += batch_size
+        self.stats["max_batch_size"] = max(self.stats["max_batch_size"], batch_size)
+
+        size_bucket: int = 1 << (batch_size - 1).bit_length()
+        self.stats["batch_sizes"][size_bucket] = self.stats["batch_sizes"].get(size_bucket, 0) + 1
+
+        for _, _, enqueued in batch:
+            wait_ms: float = (started - enqueued) * 1000
+            self.stats["wait_ms_total"] += wait_ms
+            self.stats["max_wait_ms"] = max(self.stats["max_wait_ms"], wait_ms)
+
+    def get_stats(self) -> dict:
+        """
+        Get Batch Sizes and Wait Times Counters
+        """
+        return {
+            "enabled": POST_WRITE_BATCHING,
+            "window_ms": self.window_s * 1000,
+            "max_batch_size_limit": self.max_batch_size,
+            "batches": self.stats["batches"],
+            "posts": self.stats["posts"],
+            "failed_batches": self.stats["failed_batches"],
+            "avg_batch_size": round(self.stats["posts"] / self.stats["batches"], 2) if self.stats["batches"] else 0,
+            "max_batch_size": self.stats["max_batch_size"],
+            "avg_wait_ms": round(self.stats["wait_ms_total"] / self.stats["posts"], 3) if self.stats["posts"] else 0,
+            "max_wait_ms": round(self.stats["max_wait_ms"], 3),
+            "batch_sizes": dict(sorted(self.stats["batch_sizes"].items()))
+        }
+
+    async def close(self) -> None:
+        """
+        Commit Pending Posts and Wait for Running Commits
+        """
+        self._start_flush()
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+
+
+post_write_batcher: PostWriteBatcher = PostWriteBatcher(
+    session_maker=async_session,
+    window_ms=POST_WRITE_BATCH_WINDOW_MS,
+    max_batch_size=POST_WRITE_BATCH_SIZE
+)
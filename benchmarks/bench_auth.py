@@ -0,0 +1,120 @@
+"""
+Benchmark of Authentication Overhead per Request
+
+Measures the principal dependency alone (full JWT verification against a cache hit
+of already verified token) and whole "/posts" requests served from posts cache with
+verified tokens cache enabled and disabled. The database is a temporary SQLite file,
+so MySQL is not needed.
+
+Run from the project root:
+
+    python -m benchmarks.bench_auth
+"""
+import asyncio
+import logging
+import os
+import statistics
+import tempfile
+import time
+
+CALLS: int = 20000
+REQUESTS: int = 3000
+PASSWORD: str = "Benchmark1!"
+
+
+async def _measure_dependency(
+        token: str
+) -> None:
+    """
+    Time Principal Dependency with and without Verified Tokens Cache
+    """
+    from apis.utils.token import get_current_principal, verified_tokens
+
+    for name, max_size in (("jwt verification", 0), ("verified token cache", 10000)):
+        verified_tokens.max_size = max_size
+        verified_tokens.clear()
+        await get_current_principal(token)
+
+        started: float = time.perf_counter()
+        for _ in range(CALLS):
+            await get_current_principal(token)
+        per_call_us: float = (time.perf_counter() - started) / CALLS * 1_000_000
+
+        print(f"  {name:<22} {per_call_us:>8.2f} us per call")
+
+
+async def _measure_requests(
+        client,
+        headers: dict
+) -> None:
+    """
+    Time Cached "/posts" Requests with and without Verified Tokens Cache
+    """
+    from apis.utils.token import verified_tokens
+
+    for name, max_size in (("jwt verification", 0), ("verified token cache", 10000)):
+        verified_tokens.max_size = max_size
+        verified_tokens.clear()
+        await client.get("/posts", headers=headers)
+
+        latencies: list[float] = []
+        for _ in range(REQUESTS):
+            started: float = time.perf_counter()
+            await client.get("/posts", headers=headers)
+            latencies.append((time.perf_counter() - started) * 1_000_000)
+
+        print(
+            f"  {name:<22} median {statistics.median(latencies):>8.1f} us   "
+            f"mean {statistics.fmean(latencies):>8.1f} us per request"
+        )
+
+
+async def run() -> None:
+    """
+    Create User with Posts and Run Measurements
+    """
+    # APP Modules Read DB URL on Import -> Import Them Only After It is Set
+    from config.app import app
+    from config.database import engine
+    from config.models import Base
+
+    import httpx
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://benchmark") as client:
+        response: httpx.Response = await client.post(
+            "/user/signup", json={"email": "auth@gmail.com", "password": PASSWORD}
+        )
+        token: str = response.json()["token"]
+        headers: dict = {"Authorization": f"Bearer {token}"}
+        for post_number in range(20):
+            await client.post(
+                "/post/add", json={"text": f"Benchmark post number {post_number} with words"}, headers=headers
+            )
+
+        print(f"Principal dependency, {CALLS} calls:")
+        await _measure_dependency(token)
+
+        print(f"Cached /posts requests, {REQUESTS} requests:")
+        await _measure_requests(client, headers)
+
+    await engine.dispose()
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # SQLite Database and Settings Not Depending on Local .env
+        os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{os.path.join(tmp_dir, 'bench.db')}"
+        os.environ["DATABASE_REPLICA_URLS"] = ""
+        os.environ.setdefault("JWT_SECRET_KEY", "benchmark")
+        os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
+
+        asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark of Posts Creation Throughput -> Single Post Path vs Bulk Multi-Row INSERT
+
+Writes the same number of posts on a local SQLite database, once like
+"POST /post/add" does (own session, INSERT and commit for every post) and once
+like "POST /posts/bulk" does (one session, multi-row INSERT and one commit per batch).
+
+Run from the project root:
+
+    python -m benchmarks.bench_bulk_posts
+"""
+import asyncio
+import os
+import tempfile
+import time
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from apis.utils.post_inserts import insert_posts
+from config.models import Base, Post, User
+
+POSTS_COUNT: int = 2000
+BATCH_SIZE: int = 100
+POST_TEXT: str = "Benchmark post text with more than five words"
+
+
+async def _single_posts(
+        session_maker: sessionmaker,
+        user_id: int
+) -> None:
+    """
+    One Session, INSERT and Commit per Post
+    """
+    for _ in range(POSTS_COUNT):
+        async with session_maker() as session:
+            session.add(Post(user_id=user_id, text=POST_TEXT))
+            await session.commit()
+
+
+async def _bulk_posts(
+        session_maker: sessionmaker,
+        user_id: int
+) -> None:
+    """
+    One Session, Multi-Row INSERT and Commit per Batch
+    """
+    for _ in range(POSTS_COUNT // BATCH_SIZE):
+        async with session_maker() as session:
+            await insert_posts(
+                session=session,
+                posts=[{"user_id": user_id, "text": POST_TEXT} for _ in range(BATCH_SIZE)]
+            )
+            await session.commit()
+
+
+async def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine: AsyncEngine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmp_dir, 'bench.db')}")
+        session_maker: sessionmaker = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+
+        async with session_maker() as session:
+            user: User = User(email="benchmark@gmail.com", password="hash")
+            session.add(user)
+            await session.commit()
+
+        print(f"Creating {POSTS_COUNT} posts")
+        for name, run in (("single post path", _single_posts), (f"bulk, {BATCH_SIZE} per request", _bulk_posts)):
+            started: float = time.perf_counter()
+            await run(session_maker, user.id)
+            elapsed: float = time.perf_counter() - started
+            print(f"  {name:<22}: {elapsed:.2f} s, {POSTS_COUNT / elapsed:.0f} posts/s")
+
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
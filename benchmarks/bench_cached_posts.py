@@ -0,0 +1,129 @@
+"""
+Benchmark of Cached Posts Page Serving -> Pickled Page vs Ready Response Body
+
+Compares the work done for one cache hit of "GET /posts" before (unpickle the
+cached page and serialize it with the standard json module) and now (return
+the response body bytes kept in the cache), then sends requests with a cached
+page to the in-process APP.
+
+Run from the project root (the usual .env settings must be available):
+
+    python -m benchmarks.bench_cached_posts
+"""
+import asyncio
+import json
+import pickle
+import time
+
+import httpx
+
+from apis.utils.cache import encode_posts_page, get_or_build_user_posts_page
+from apis.utils.pagination import encode_cursor
+from apis.utils.token import create_access_token
+from config.app import app
+
+USER_ID: int = 1
+USER_EMAIL: str = "benchmark@gmail.com"
+PAGE_LIMIT: int = 100
+POST_TEXT: str = "Benchmark post text with more than five words " * 4
+
+SERIALIZE_ROUNDS: int = 5000
+REQUESTS_COUNT: int = 5000
+CONCURRENCY: int = 32
+
+
+async def _build_page() -> dict:
+    """
+    Full Posts Page Without DB Query
+    """
+    posts: list[dict] = [
+        {
+            "id": post_id,
+            "user_email": USER_EMAIL,
+            "text": POST_TEXT
+        }
+        for post_id in range(1, PAGE_LIMIT + 1)
+    ]
+    return {
+        "user_id": USER_ID,
+        "after_id": 0,
+        "limit": PAGE_LIMIT,
+        "posts": posts,
+        "next_cursor": encode_cursor(user_id=USER_ID, post_id=posts[-1]["id"])
+    }
+
+
+def _compare_serialization(
+        page: dict
+) -> None:
+    """
+    Time One Cache Hit Work -> Old Pickled Page Against New Ready Body
+    """
+    pickled_page: bytes = pickle.dumps(page)
+
+    started: float = time.perf_counter()
+    for _ in range(SERIALIZE_ROUNDS):
+        cached_page: dict = pickle.loads(pickled_page)
+        json.dumps(
+            {
+                "success": True,
+                "posts": cached_page["posts"],
+                "next_cursor": cached_page["next_cursor"]
+            }
+        ).encode('utf-8')
+    old_us: float = (time.perf_counter() - started) / SERIALIZE_ROUNDS * 1e6
+
+    cached_page: dict = encode_posts_page(page)
+
+    started: float = time.perf_counter()
+    for _ in range(SERIALIZE_ROUNDS):
+        bytes(cached_page["body"])
+    new_us: float = (time.perf_counter() - started) / SERIALIZE_ROUNDS * 1e6
+
+    print(f"Cache hit of page with {PAGE_LIMIT} posts")
+    print(f"  pickle + json.dumps : {old_us:.1f} us")
+    print(f"  ready body bytes    : {new_us:.1f} us")
+
+
+async def _send_requests(
+        client: httpx.AsyncClient,
+        count: int,
+        headers: dict
+) -> None:
+    """
+    Send Requests for Cached Page One by One
+    """
+    for _ in range(count):
+        response: httpx.Response = await client.get("/posts", params={"limit": PAGE_LIMIT}, headers=headers)
+        response.raise_for_status()
+
+
+async def main() -> None:
+    _compare_serialization(await _build_page())
+
+    # Put Page into Cache Through Cache API -> Requests are Served Without DB
+    await get_or_build_user_posts_page(
+        user_email=USER_EMAIL,
+        after_id=0,
+        limit=PAGE_LIMIT,
+        build_page=_build_page
+    )
+
+    headers: dict = {
+        "Authorization": f"Bearer {create_access_token({'user_email': USER_EMAIL, 'user_id': USER_ID})}"
+    }
+    transport: httpx.ASGITransport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        started: float = time.perf_counter()
+        await asyncio.gather(
+            *(_send_requests(client, REQUESTS_COUNT // CONCURRENCY, headers) for _ in range(CONCURRENCY))
+        )
+        elapsed: float = time.perf_counter() - started
+
+    requests_count: int = REQUESTS_COUNT // CONCURRENCY * CONCURRENCY
+    print(f"GET /posts with cached page, {CONCURRENCY} concurrent clients")
+    print(f"  {requests_count} requests: {elapsed:.2f} s, {requests_count / elapsed:.0f} requests/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
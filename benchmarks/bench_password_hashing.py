@@ -0,0 +1,165 @@
+"""
+Benchmark of "/posts" Latency During Burst of Logins
+
+Sends "GET /posts" requests of a reader to the in-process APP on a fixed schedule
+while a burst of concurrent "POST /user/login" requests is running, once with bcrypt
+called directly inside the event loop (old login behaviour) and once through the
+password hashing executor. The database is a temporary SQLite file, so MySQL is
+not needed.
+
+Run from the project root:
+
+    python -m benchmarks.bench_password_hashing
+"""
+import asyncio
+import logging
+import os
+import statistics
+import tempfile
+import time
+
+PASSWORD: str = "Benchmark1!"
+CONCURRENT_LOGINS: int = 32
+PROBE_INTERVAL_S: float = 0.005
+POSTS_COUNT: int = 20
+
+
+async def _blocking_check_password(
+        password: str,
+        hashed_password: str
+) -> bool:
+    """
+    Old Login Behaviour -> bcrypt Called Inside Event Loop
+    """
+    import bcrypt
+
+    return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
+
+
+async def _probe(
+        client,
+        headers: dict,
+        latencies: list[float],
+        logins_done: asyncio.Event
+) -> None:
+    """
+    Send "/posts" Requests Every Interval Until Logins Done and Save Their Latency
+    """
+    scheduled: float = time.perf_counter()
+    while not logins_done.is_set():
+        await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+        await client.get("/posts", headers=headers)
+        finished: float = time.perf_counter()
+        # Latency is Counted from Planned Send Time -> Time of Blocked Event Loop is Included
+        latencies.append((finished - scheduled) * 1000)
+        # Slow Response Does Not Move Later Probes Behind Schedule
+        scheduled = max(scheduled + PROBE_INTERVAL_S, finished)
+
+
+async def _logins(
+        client,
+        emails: list[str],
+        logins_done: asyncio.Event
+) -> None:
+    """
+    Run Burst of Concurrent Logins
+    """
+    await asyncio.sleep(0)
+    responses = await asyncio.gather(*[
+        client.post("/user/login", json={"email": email, "password": PASSWORD}) for email in emails
+    ])
+    logins_done.set()
+
+    assert all(response.status_code == 200 for response in responses)
+
+
+async def _measure(
+        client,
+        headers: dict,
+        emails: list[str]
+) -> dict:
+    """
+    Run "/posts" Probes Next to Burst of Logins
+    """
+    latencies: list[float] = []
+    logins_done: asyncio.Event = asyncio.Event()
+
+    started: float = time.perf_counter()
+    await asyncio.gather(
+        _probe(client, headers, latencies, logins_done),
+        _logins(client, emails, logins_done)
+    )
+    elapsed: float = time.perf_counter() - started
+
+    quantiles: list[float] = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "probes": len(latencies),
+        "p50_ms": round(quantiles[49], 2),
+        "p99_ms": round(quantiles[98], 2),
+        "max_ms": round(max(latencies), 2),
+        "elapsed_s": round(elapsed, 2)
+    }
+
+
+async def run() -> None:
+    """
+    Create Reader with Posts and Users Logging In, Than Measure Both Login Behaviours
+    """
+    # APP Modules Read DB URL on Import -> Import Them Only After It is Set
+    import apis.user_apis as user_apis
+    from apis.utils.password import shutdown_password_executor
+    from config.app import app
+    from config.database import engine
+    from config.models import Base
+
+    import httpx
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://benchmark") as client:
+        response = await client.post("/user/signup", json={"email": "reader@gmail.com", "password": PASSWORD})
+        headers: dict = {"Authorization": f"Bearer {response.json()['token']}"}
+        for post_number in range(POSTS_COUNT):
+            await client.post(
+                "/post/add", json={"text": f"Benchmark post number {post_number} with words"}, headers=headers
+            )
+
+        emails: list[str] = [f"login{number}@gmail.com" for number in range(CONCURRENT_LOGINS)]
+        for email in emails:
+            await client.post("/user/signup", json={"email": email, "password": PASSWORD})
+
+        # Warm Up Posts Page Cache and Users Lookups
+        await client.get("/posts", headers=headers)
+
+        check_password = user_apis.check_password
+        user_apis.check_password = _blocking_check_password
+        try:
+            before: dict = await _measure(client, headers, emails)
+        finally:
+            user_apis.check_password = check_password
+        after: dict = await _measure(client, headers, emails)
+
+    shutdown_password_executor()
+    await engine.dispose()
+
+    print(f"/posts latency during {CONCURRENT_LOGINS} concurrent /user/login requests")
+    print(f"  bcrypt in event loop : {before}")
+    print(f"  bcrypt in executor   : {after}")
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # SQLite Database and Settings Not Depending on Local .env
+        os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{os.path.join(tmp_dir, 'bench.db')}"
+        os.environ["DATABASE_REPLICA_URLS"] = ""
+        os.environ.setdefault("JWT_SECRET_KEY", "benchmark")
+        os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
+
+        asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Benchmark of Startup Time and Throughput of run.py in Development and Production Modes
+
+Starts run.py as a real server on a free port for every mode, measures time until
+"/app-status" answers, then sends a fixed number of concurrent requests over TCP and
+finally measures how long graceful shutdown takes after SIGTERM. The database is a
+temporary SQLite file, so MySQL is not needed.
+
+Run from the project root:
+
+    python -m benchmarks.bench_run_modes
+
+The load client is a single Python process, so on machines with few cores it can
+become the bottleneck before the server does.
+"""
+import asyncio
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+REQUESTS: int = 3000
+CONCURRENCY: int = 32
+STARTUP_TIMEOUT_S: float = 120
+PROBE_PATH: str = "/app-status"
+
+MODES: dict[str, dict[str, str]] = {
+    "development": {
+        "APP_MODE": "development"
+    },
+    "production_1_worker": {
+        "APP_MODE": "production",
+        "APP_WORKERS": "1"
+    },
+    "production_cpu_workers": {
+        "APP_MODE": "production",
+        "APP_WORKERS": str(os.cpu_count() or 1)
+    }
+}
+
+
+def _get_free_port() -> int:
+    """
+    Get Free TCP Port of Localhost
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_until_ready(
+        url: str,
+        process: subprocess.Popen
+) -> float:
+    """
+    Poll APP Status Until Server Answers, Get Seconds Spent
+    """
+    started: float = time.perf_counter()
+    while time.perf_counter() - started < STARTUP_TIMEOUT_S:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited with code {process.returncode}")
+        try:
+            if httpx.get(url, timeout=1).status_code == 200:
+                return time.perf_counter() - started
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.05)
+
+    raise TimeoutError("Server did not start")
+
+
+async def _measure_throughput(
+        url: str
+) -> float:
+    """
+    Send Requests with Fixed Concurrency, Get Requests per Second
+    """
+    sent: int = 0
+
+    async with httpx.AsyncClient(limits=httpx.Limits(max_connections=CONCURRENCY)) as client:
+        async def worker() -> None:
+            nonlocal sent
+            while sent < REQUESTS:
+                sent += 1
+                await client.get(url)
+
+        started: float = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(CONCURRENCY)))
+        return REQUESTS / (time.perf_counter() - started)
+
+
+def _run_mode(
+        name: str,
+        mode_env: dict[str, str],
+        tmp_dir: str
+) -> dict:
+    """
+    Start Server in Mode, Measure It and Stop It
+    """
+    port: int = _get_free_port()
+    url: str = f"http://127.0.0.1:{port}{PROBE_PATH}"
+    process_env: dict[str, str] = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite+aiosqlite:///{os.path.join(tmp_dir, 'bench.db')}",
+        "DATABASE_REPLICA_URLS": "",
+        "JWT_SECRET_KEY": os.environ.get("JWT_SECRET_KEY", "benchmark"),
+        "ACCESS_TOKEN_EXPIRE_MINUTES": os.environ.get("ACCESS_TOKEN_EXPIRE_MINUTES", "60"),
+        "APP_PORT": str(port),
+        "APP_ACCESS_LOG": "false",
+        **mode_env
+    }
+
+    process: subprocess.Popen = subprocess.Popen(
+        [sys.executable, "run.py"],
+        env=process_env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+    try:
+        startup_s: float = _wait_until_ready(url, process)
+        throughput: float = asyncio.run(_measure_throughput(url))
+
+        stopping: float = time.perf_counter()
+        process.send_signal(signal.SIGTERM)
+        process.wait(timeout=60)
+        shutdown_s: float = time.perf_counter() - stopping
+    finally:
+        if process.poll() is None:
+            os.killpg(process.pid, signal.SIGKILL)
+            process.wait()
+
+    print(
+        f"  {name:<24} startup {startup_s:>7.2f} s   throughput {throughput:>8.1f} req/s   "
+        f"shutdown {shutdown_s:>5.2f} s"
+    )
+    return {
+        "startup_s": startup_s,
+        "throughput_rps": throughput,
+        "shutdown_s": shutdown_s
+    }
+
+
+def main() -> None:
+    print(f"run.py modes: {REQUESTS} requests to {PROBE_PATH}, concurrency {CONCURRENCY}, {os.cpu_count()} CPUs")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, mode_env in MODES.items():
+            _run_mode(name, mode_env, tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
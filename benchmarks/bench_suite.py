@@ -0,0 +1,275 @@
+"""
+Load-Test and Benchmark Suite of the APP Running on SQLite, Without MySQL
+
+Drives the in-process APP through httpx ASGITransport on a fresh aiosqlite
+database and measures throughput and latency percentiles of signup, login,
+add post, list posts (cold and hot cache) and delete post. Every run uses the
+same users, posts and order of requests, so results of different commits can
+be compared.
+
+Run from the project root:
+
+    python -m benchmarks.bench_suite --output benchmarks/results/my_change.json
+
+and compare two saved runs:
+
+    python -m benchmarks.bench_suite --compare old.json new.json
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Awaitable, Callable
+
+USERS_COUNT: int = 16
+POSTS_PER_USER: int = 50
+LIST_REQUESTS: int = 400
+CONCURRENCY: int = 8
+PAGE_LIMIT: int = 20
+PASSWORD: str = "Benchmark1!"
+
+
+def _percentile(
+        values: list[float],
+        percent: float
+) -> float:
+    """
+    Get Percentile of Sorted Values (Nearest Rank)
+    """
+    index: int = max(0, min(len(values) - 1, round(percent / 100 * len(values)) - 1))
+    return values[index]
+
+
+async def _run_scenario(
+        name: str,
+        requests: list[Callable[[], Awaitable[int]]],
+        concurrency: int,
+        before_request: Callable[[], Awaitable[None]] | None = None
+) -> dict:
+    """
+    Send Requests with Fixed Concurrency and Collect Their Latencies and Statuses
+    """
+    latencies: list[float] = []
+    errors: int = 0
+    queue: asyncio.Queue = asyncio.Queue()
+    for request in requests:
+        queue.put_nowait(request)
+
+    async def worker() -> None:
+        nonlocal errors
+        while not queue.empty():
+            request: Callable[[], Awaitable[int]] = queue.get_nowait()
+            if before_request is not None:
+                await before_request()
+
+            started: float = time.perf_counter()
+            status: int = await request()
+            latencies.append((time.perf_counter() - started) * 1000)
+            if status >= 400:
+                errors += 1
+
+    started: float = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed: float = time.perf_counter() - started
+
+    latencies.sort()
+    result: dict = {
+        "requests": len(latencies),
+        "errors": errors,
+        "concurrency": concurrency,
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(_percentile(latencies, 50), 3),
+        "p95_ms": round(_percentile(latencies, 95), 3),
+        "p99_ms": round(_percentile(latencies, 99), 3)
+    }
+    print(
+        f"  {name:<18} {result['requests']:>5} req  {result['throughput_rps']:>8} req/s  "
+        f"p50 {result['p50_ms']:>8} ms  p95 {result['p95_ms']:>8} ms  p99 {result['p99_ms']:>8} ms  "
+        f"errors {errors}"
+    )
+    return result
+
+
+async def run_suite() -> dict:
+    """
+    Run ALL Scenarios on Fresh SQLite Database
+    """
+    # APP Modules Read DB URL on Import -> Import Them Only After It is Set
+    from apis.utils.cache import cache
+    from config.app import app
+    from config.database import engine
+    from config.models import Base
+
+    import httpx
+
+    # Client Logging of Every Request Would be Measured Too
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    scenarios: dict = {}
+    transport: httpx.ASGITransport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        emails: list[str] = [f"benchmark{user_number}@gmail.com" for user_number in range(USERS_COUNT)]
+        tokens: dict[str, str] = {}
+
+        async def signup(email: str) -> int:
+            response: httpx.Response = await client.post(
+                "/user/signup", json={"email": email, "password": PASSWORD}
+            )
+            tokens[email] = response.json().get("token", "")
+            return response.status_code
+
+        async def login(email: str) -> int:
+            response: httpx.Response = await client.post(
+                "/user/login", json={"email": email, "password": PASSWORD}
+            )
+            return response.status_code
+
+        def headers(email: str) -> dict:
+            return {"Authorization": f"Bearer {tokens[email]}"}
+
+        posts_ids: dict[str, list[int]] = {email: [] for email in emails}
+
+        async def add_post(email: str, post_number: int) -> int:
+            response: httpx.Response = await client.post(
+                "/post/add",
+                json={"text": f"Benchmark post number {post_number} with enough words"},
+                headers=headers(email)
+            )
+            if response.status_code == 201:
+                posts_ids[email].append(response.json()["post"]["id"])
+            return response.status_code
+
+        async def list_posts(email: str) -> int:
+            response: httpx.Response = await client.get(
+                "/posts", params={"limit": PAGE_LIMIT}, headers=headers(email)
+            )
+            return response.status_code
+
+        async def delete_post(email: str, post_id: int) -> int:
+            response: httpx.Response = await client.post(
+                "/post/delete", json={"post_id": post_id}, headers=headers(email)
+            )
+            return response.status_code
+
+        async def clear_cache() -> None:
+            await cache.clear()
+
+        print(f"Benchmark suite: {USERS_COUNT} users, {POSTS_PER_USER} posts per user, concurrency {CONCURRENCY}")
+        scenarios["signup"] = await _run_scenario(
+            "signup", [lambda email=email: signup(email) for email in emails], CONCURRENCY
+        )
+        scenarios["login"] = await _run_scenario(
+            "login", [lambda email=email: login(email) for email in emails], CONCURRENCY
+        )
+        scenarios["add_post"] = await _run_scenario(
+            "add_post",
+            [
+                lambda email=email, post_number=post_number: add_post(email, post_number)
+                for post_number in range(POSTS_PER_USER)
+                for email in emails
+            ],
+            CONCURRENCY
+        )
+        scenarios["list_posts_cold"] = await _run_scenario(
+            "list_posts_cold",
+            [lambda email=email: list_posts(email) for email in emails * (LIST_REQUESTS // len(emails) // 4)],
+            1,
+            before_request=clear_cache
+        )
+        scenarios["list_posts_hot"] = await _run_scenario(
+            "list_posts_hot",
+            [lambda email=email: list_posts(email) for email in emails * (LIST_REQUESTS // len(emails))],
+            CONCURRENCY
+        )
+        scenarios["delete_post"] = await _run_scenario(
+            "delete_post",
+            [
+                lambda email=email, post_id=post_id: delete_post(email, post_id)
+                for email in emails
+                for post_id in posts_ids[email][:POSTS_PER_USER // 2]
+            ],
+            CONCURRENCY
+        )
+
+    await engine.dispose()
+    return scenarios
+
+
+def _get_git_commit() -> str | None:
+    """
+    Get Current Git Commit of Project
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(
+        old_path: str,
+        new_path: str
+) -> None:
+    """
+    Print Change of Throughput and p95 Between Two Saved Runs
+    """
+    with open(old_path) as old_file, open(new_path) as new_file:
+        old: dict = json.load(old_file)
+        new: dict = json.load(new_file)
+
+    print(f"{old.get('commit')} -> {new.get('commit')}")
+    for name, new_result in new["scenarios"].items():
+        old_result: dict | None = old["scenarios"].get(name)
+        if old_result is None:
+            continue
+        throughput_change: float = (new_result["throughput_rps"] / old_result["throughput_rps"] - 1) * 100
+        p95_change: float = (new_result["p95_ms"] / old_result["p95_ms"] - 1) * 100 if old_result["p95_ms"] else 0
+        print(f"  {name:<18} throughput {throughput_change:+7.1f} %   p95 {p95_change:+7.1f} %")
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", help="save results into this JSON file")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="compare two saved JSON results")
+    args: argparse.Namespace = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # SQLite Database and Settings Not Depending on Local .env
+        os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{os.path.join(tmp_dir, 'bench.db')}"
+        os.environ["DATABASE_REPLICA_URLS"] = ""
+        os.environ.setdefault("JWT_SECRET_KEY", "benchmark")
+        os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
+
+        scenarios: dict = asyncio.run(run_suite())
+
+    results: dict = {
+        "commit": _get_git_commit(),
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "scenarios": scenarios
+    }
+
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+        print(f"Results saved into {args.output}")
+
+
+if __name__ == "__main__":
+    main()
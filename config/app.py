@@ -1,16 +1,36 @@
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, Depends, Header
 from sqlalchemy import text, CursorResult
-from starlette.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.responses import JSONResponse, PlainTextResponse, FileResponse
 
 from apis.posts_apis import posts_router
 from apis.user_apis import users_router
-from config.database import database, async_session
+from apis.utils.cache import get_cache_stats, invalidate_user_posts_cache
+from apis.utils.cache_bus import CACHE_INVALIDATION_BUS, cache_invalidation_bus
+from apis.utils.metrics import MetricsMiddleware, loop_lag_monitor, render_metrics
+from apis.utils.password import shutdown_password_executor
+from apis.utils.profiler import PROFILER_TOKEN, ProfilerMiddleware, is_profiler_token, list_profiles, get_profile_path
+from apis.utils.server_timing import SERVER_TIMING, ServerTimingMiddleware
+from apis.utils.user_loader import user_loader
+from apis.utils.write_batcher import post_write_batcher
+from config.database import engine, get_read_session, get_pool_stats
 
 # Create Web APP FastAPI
 app: FastAPI = FastAPI(
     title="Fast API MVC"
 )
 
+# Send Phases Timings of Each Request in "Server-Timing" Header
+if SERVER_TIMING:
+    app.add_middleware(ServerTimingMiddleware)
+
+# Profile Request Sent with Profiler Token Header
+if PROFILER_TOKEN:
+    app.add_middleware(ProfilerMiddleware)
+
+# Observe Latency and DB Queries of Each Request
+app.add_middleware(MetricsMiddleware)
+
 
 @app.exception_handler(HTTPException)
 async def custom_http_exception_handler(
@@ -31,17 +51,28 @@ async def custom_http_exception_handler(
 @app.on_event("startup")
 async def startup():
     """
-    Connect To DataBase
+    Start Measuring Event Loop Lag and Join Cache Invalidation Bus of Sibling Workers
     """
-    await database.connect()
+    loop_lag_monitor.start()
+
+    if CACHE_INVALIDATION_BUS:
+        cache_invalidation_bus.start(invalidate_user_posts_cache)
 
 
 @app.on_event("shutdown")
 async def shutdown():
     """
-    Disconnect To DataBase
+    Commit Batched Posts, Close DataBase Pool Connections and Stop Password Hashing Workers
     """
-    await database.disconnect()
+    await loop_lag_monitor.stop()
+
+    await cache_invalidation_bus.close()
+
+    await post_write_batcher.close()
+
+    await engine.dispose()
+
+    shutdown_password_executor()
 
 
 @app.get("/app-status")
@@ -55,20 +86,115 @@ async def app_status():
 
 
 @app.get("/db-status")
-async def db_status():
+async def db_status(
+        session: AsyncSession = Depends(get_read_session)
+):
     """
     Just for DB Status of Checking Successful Working with DB
     """
-    async with async_session() as session:
-        # Perform a Simple Query to Check Database Connection
-        result: CursorResult = await session.execute(text("SELECT 1"))
+    # Perform a Simple Query to Check Database Connection
+    result: CursorResult = await session.execute(text("SELECT 1"))
+    return JSONResponse(
+        {
+            "result": result.scalar()
+        },
+        status_code=200
+    )
+
+
+@app.get("/db-pool-status")
+async def db_pool_status():
+    """
+    Just for DB Connection Pool Status of Checking Pool Usage and Connection Wait Times
+    """
+    return {
+        "pool": get_pool_stats()
+    }
+
+
+@app.get("/cache-status")
+async def cache_status():
+    """
+    Just for Cache Status of Checking Hit Rate and Memory Usage
+    """
+    return {
+        "cache": get_cache_stats(),
+        "user_loader": user_loader.stats
+    }
+
+
+@app.get("/write-batcher-status")
+async def write_batcher_status():
+    """
+    Just for Posts Write Batching Status of Checking Batch Sizes and Wait Times
+    """
+    return {
+        "write_batcher": post_write_batcher.get_stats()
+    }
+
+
+@app.get("/metrics")
+async def metrics():
+    """
+    Metrics in Prometheus Text Format for Scraping
+    """
+    return PlainTextResponse(
+        render_metrics(),
+        media_type="text/plain; version=0.0.4"
+    )
+
+
+@app.get("/profiles")
+async def profiles(
+        x_profile: str | None = Header(None)
+):
+    """
+    Saved Request Profiles, Newest First (Requires Profiler Token Header)
+    """
+    if not is_profiler_token(x_profile):
         return JSONResponse(
             {
-                "result": result.scalar()
+                "error": "Invalid Profiler Token"
             },
-            status_code=200
+            status_code=403
         )
 
+    return {
+        "profiles": list_profiles()
+    }
+
+
+@app.get("/profiles/{name}")
+async def profile(
+        name: str,
+        x_profile: str | None = Header(None)
+):
+    """
+    Download Saved Request Profile in pstats Format (Requires Profiler Token Header)
+    """
+    if not is_profiler_token(x_profile):
+        return JSONResponse(
+            {
+                "error": "Invalid Profiler Token"
+            },
+            status_code=403
+        )
+
+    profile_path: str | None = get_profile_path(name)
+    if profile_path is None:
+        return JSONResponse(
+            {
+                "error": "Don't Exist Such Profile"
+            },
+            status_code=404
+        )
+
+    return FileResponse(
+        profile_path,
+        media_type="application/octet-stream",
+        filename=name
+    )
+
 
 # Register Routers
 app.include_router(users_router)
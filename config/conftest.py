@@ -0,0 +1,60 @@
+import httpx
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+import config.database as database
+from apis.utils.cache import cache
+from apis.utils.token import verified_tokens
+from apis.utils.user_loader import user_loader
+from app import app
+from config.models import Base
+
+TEST_PASSWORD: str = "Test1234!"
+
+
+@pytest_asyncio.fixture
+async def db_engine(tmp_path, monkeypatch):
+    """
+    APP Sessions on Fresh SQLite Database with Empty Caches
+    """
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    monkeypatch.setattr(
+        database, "async_session", sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    )
+    await cache.clear()
+    verified_tokens.clear()
+    user_loader.clear()
+
+    yield engine
+
+    await cache.clear()
+    verified_tokens.clear()
+    user_loader.clear()
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def client(db_engine):
+    """
+    Client of In-Process APP
+    """
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+@pytest_asyncio.fixture
+async def signup_headers(client):
+    """
+    Create User and Get His Auth Headers
+    """
+    async def signup(
+            email: str = "test@gmail.com"
+    ) -> dict:
+        response = await client.post("/user/signup", json={"email": email, "password": TEST_PASSWORD})
+        return {"Authorization": f"Bearer {response.json()['token']}"}
+
+    return signup
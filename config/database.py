@@ -1,27 +1,107 @@
-from databases import Database
-from environs import Env
+import time
+from collections import OrderedDict
+from functools import partial
+from typing import AsyncIterator
+
+from sqlalchemy import exc, event
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from sqlalchemy.orm import sessionmaker
 
-# Read ENV File
-env = Env()
-env.read_env('.env')
+from config.env import env
+
+# Full DB URL Can be Given Directly, Otherwise MySQL from Docker-Compose is Used
+DATABASE_URL: str = env("DATABASE_URL", None) or (
+    f"mysql+aiomysql://{env('MYSQL_USER')}:{env('MYSQL_PASSWORD')}@db:3306/{env('MYSQL_DATABASE')}"
+)
+
+# Connection Pool Conf -> Pool Size Plus Overflow is Max Connections of One Worker
+DB_POOL_SIZE: int = env.int("DB_POOL_SIZE", 5)
+DB_MAX_OVERFLOW: int = env.int("DB_MAX_OVERFLOW", 10)
+DB_POOL_TIMEOUT: float = env.float("DB_POOL_TIMEOUT", 30)  # Seconds to Wait for Free Connection
+DB_POOL_RECYCLE: int = env.int("DB_POOL_RECYCLE", 1800)  # Seconds, Less than MySQL "wait_timeout"
+DB_POOL_PRE_PING: bool = env.bool("DB_POOL_PRE_PING", False)
+
+# SQL Logging -> "false", "true" or "debug" (With Result Rows)
+DB_ECHO: str = env("DB_ECHO", "false").lower()
+
+# Read Replicas Conf -> Read-Only Queries Go to Replicas, Except Reads of User Right After His Own Write
+DATABASE_REPLICA_URLS: list[str] = env.list("DATABASE_REPLICA_URLS", [])
+DB_REPLICA_EJECT_SECONDS: float = env.float("DB_REPLICA_EJECT_SECONDS", 30)  # Failed Replica is Skipped
+DB_READ_YOUR_WRITES_SECONDS: float = env.float("DB_READ_YOUR_WRITES_SECONDS", 5)  # More than Replication Lag
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Connection Pool Counting Time Requests Wait for Connection
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # Checkouts Counters of Connection Pool
+        self.checkout_stats: dict = {
+            "checkouts": 0,
+            "timeouts": 0,
+            "wait_ms_total": 0.0,
+            "max_wait_ms": 0.0
+        }
+
+    def _do_get(self):
+        started: float = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.checkout_stats["timeouts"] += 1
+            raise
+        finally:
+            wait_ms: float = (time.perf_counter() - started) * 1000
+            self.checkout_stats["checkouts"] += 1
+            self.checkout_stats["wait_ms_total"] += wait_ms
+            self.checkout_stats["max_wait_ms"] = max(self.checkout_stats["max_wait_ms"], wait_ms)
+
+
+def _get_engine_options(
+        url: str
+) -> dict:
+    """
+    Get Engine Options for DB URL, Pool Settings are Only for Server DBs
+    """
+    backend_name: str = make_url(url).get_backend_name()
+
+    options: dict = {
+        "echo": "debug" if DB_ECHO == "debug" else DB_ECHO in ("true", "1", "yes")
+    }
+
+    if backend_name == "sqlite":
+        # SQLite Uses Own File Based Pool
+        return options
 
-MYSQL_DATABASE = env("MYSQL_DATABASE")
-MYSQL_USER = env("MYSQL_USER")
-MYSQL_PASSWORD = env("MYSQL_PASSWORD")
+    options.update(
+        {
+            "poolclass": TimedQueuePool,
+            "pool_size": DB_POOL_SIZE,
+            "max_overflow": DB_MAX_OVERFLOW,
+            "pool_timeout": DB_POOL_TIMEOUT,
+            "pool_recycle": DB_POOL_RECYCLE,
+            "pool_pre_ping": DB_POOL_PRE_PING
+        }
+    )
 
-DATABASE_URL = f"mysql+aiomysql://{MYSQL_USER}:{MYSQL_PASSWORD}@db:3306/{MYSQL_DATABASE}"
+    if backend_name == "mysql":
+        options["connect_args"] = {
+            "auth_plugin": "mysql_native_password"
+        }
+
+    return options
 
-database: Database = Database(DATABASE_URL)
 
 engine: AsyncEngine = create_async_engine(
     DATABASE_URL,
-    echo=True,
-    connect_args={
-        "auth_plugin": "mysql_native_password"
-    }
+    **_get_engine_options(DATABASE_URL)
 )
 
 async_session: sessionmaker = sessionmaker(
@@ -29,3 +109,252 @@ async_session: sessionmaker = sessionmaker(
     class_=AsyncSession,
     expire_on_commit=False
 )
+
+
+class ReplicaRouter:
+    """
+    Choose Engine for Read-Only Queries -> Healthy Replicas in Round-Robin,
+    Primary When ALL Replicas are Ejected or User Wrote Something Just Now
+    """
+
+    def __init__(
+            self,
+            replicas: list[AsyncEngine],
+            eject_seconds: float,
+            read_your_writes_seconds: float
+    ):
+        self.replicas: list[AsyncEngine] = replicas
+        self.eject_seconds: float = eject_seconds
+        self.read_your_writes_seconds: float = read_your_writes_seconds
+
+        self._next_replica: int = 0
+        self._ejected_until: list[float] = [0.0] * len(replicas)
+
+        # User Email -> Time Until His Reads Go to Primary, Ordered by This Time
+        self._pinned_users: OrderedDict[str, float] = OrderedDict()
+
+        # Routing Counters
+        self.stats: dict[str, int] = {
+            "replica_reads": 0,
+            "primary_reads": 0,
+            "pinned_reads": 0,
+            "ejections": 0
+        }
+
+        # Connection Errors on Replica Eject It for a While
+        for replica_number, replica in enumerate(replicas):
+            event.listen(replica.sync_engine, "handle_error", partial(self._on_replica_error, replica_number))
+
+    def mark_user_write(
+            self,
+            user_email: str
+    ) -> None:
+        """
+        Send Reads of User to Primary Until Replicas Get His Write
+        """
+        if not self.replicas:
+            return
+
+        now: float = time.monotonic()
+        self._pinned_users[user_email] = now + self.read_your_writes_seconds
+        self._pinned_users.move_to_end(user_email)
+
+        # Drop Expired Pins -> Oldest are First
+        while self._pinned_users:
+            oldest_email, pinned_until = next(iter(self._pinned_users.items()))
+            if pinned_until > now:
+                break
+            del self._pinned_users[oldest_email]
+
+    def is_user_pinned(
+            self,
+            user_email: str | None
+    ) -> bool:
+        """
+        Check If Reads of User Go to Primary After His Recent Write
+        """
+        pinned_until: float | None = self._pinned_users.get(user_email) if user_email else None
+        return pinned_until is not None and pinned_until > time.monotonic()
+
+    def get_read_engine(
+            self,
+            user_email: str | None = None
+    ) -> AsyncEngine | None:
+        """
+        Get Replica Engine for Read-Only Queries, None Means Primary
+        """
+        if not self.replicas:
+            return None
+
+        if self.is_user_pinned(user_email):
+            # Read Your Writes -> Replica Can Still Miss User's Own Write
+            self.stats["pinned_reads"] += 1
+            return None
+
+        now: float = time.monotonic()
+        for _ in range(len(self.replicas)):
+            replica_number: int = self._next_replica % len(self.replicas)
+            self._next_replica += 1
+
+            if self._ejected_until[replica_number] <= now:
+                self.stats["replica_reads"] += 1
+                return self.replicas[replica_number]
+
+        # ALL Replicas are Ejected -> Read from Primary
+        self.stats["primary_reads"] += 1
+        return None
+
+    def _on_replica_error(
+            self,
+            replica_number: int,
+            context: ExceptionContext
+    ) -> None:
+        """
+        Eject Replica After Connection Error
+        """
+        if context.is_disconnect or isinstance(
+                context.sqlalchemy_exception, (exc.OperationalError, exc.InterfaceError)
+        ):
+            self._ejected_until[replica_number] = time.monotonic() + self.eject_seconds
+            self.stats["ejections"] += 1
+
+    def get_stats(self) -> dict:
+        """
+        Get Routing Counters and Currently Ejected Replicas
+        """
+        now: float = time.monotonic()
+        return {
+            "replicas": len(self.replicas),
+            "ejected_replicas": [
+                replica_number
+                for replica_number, ejected_until in enumerate(self._ejected_until)
+                if ejected_until > now
+            ],
+            "pinned_users": len(self._pinned_users),
+            **self.stats
+        }
+
+
+replica_router: ReplicaRouter = ReplicaRouter(
+    replicas=[
+        create_async_engine(replica_url, **_get_engine_options(replica_url))
+        for replica_url in DATABASE_REPLICA_URLS
+    ],
+    eject_seconds=DB_REPLICA_EJECT_SECONDS,
+    read_your_writes_seconds=DB_READ_YOUR_WRITES_SECONDS
+)
+
+
+def read_session(
+        user_email: str | None = None
+) -> AsyncSession:
+    """
+    Create Session for Read-Only Queries, Bound to Replica or Primary
+    """
+    read_engine: AsyncEngine | None = replica_router.get_read_engine(
+        user_email=user_email
+    )
+    if read_engine is None:
+        return async_session()
+
+    return async_session(bind=read_engine)
+
+
+class LazySession:
+    """
+    DB Session of One Request Created on First Use, So Requests Not Using DB Cost Nothing
+
+    Any attribute of :class:`AsyncSession` is available on it, and the pooled
+    connection is taken as usual only by the first query.
+    """
+
+    def __init__(
+            self,
+            session_maker: sessionmaker
+    ):
+        self._session_maker: sessionmaker = session_maker
+        self._session: AsyncSession | None = None
+
+    @property
+    def is_used(self) -> bool:
+        """
+        Was Session Created by Request
+        """
+        return self._session is not None
+
+    def __getattr__(
+            self,
+            name: str
+    ):
+        # Create Session Only When Request Really Needs It
+        if self._session is None:
+            self._session = self._session_maker()
+
+        return getattr(self._session, name)
+
+    async def close(self) -> None:
+        """
+        Close Session If It was Created and Return Its Connection into Pool
+        """
+        if self._session is not None:
+            await self._session.close()
+
+
+async def get_session() -> AsyncIterator[AsyncSession]:
+    """
+    Dependency with Lazy DB Session, Closed After Request
+    """
+    session: LazySession = LazySession(async_session)
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
+async def get_read_session() -> AsyncIterator[AsyncSession]:
+    """
+    Dependency with Lazy DB Session for Read-Only Queries on Replica, Closed After Request
+    """
+    session: LazySession = LazySession(read_session)
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
+def _get_engine_pool_stats(
+        pool_engine: AsyncEngine
+) -> dict:
+    """
+    Get Connection Pool Usage and Checkout Wait Times of Engine
+    """
+    pool = pool_engine.pool
+    if not isinstance(pool, TimedQueuePool):
+        return {
+            "pool": type(pool).__name__
+        }
+
+    checkouts: int = pool.checkout_stats["checkouts"]
+    return {
+        "pool": type(pool).__name__,
+        "size": pool.size(),
+        "max_overflow": DB_MAX_OVERFLOW,
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        "checkouts": checkouts,
+        "timeouts": pool.checkout_stats["timeouts"],
+        "avg_wait_ms": round(pool.checkout_stats["wait_ms_total"] / checkouts, 3) if checkouts else 0,
+        "max_wait_ms": round(pool.checkout_stats["max_wait_ms"], 3)
+    }
+
+
+def get_pool_stats() -> dict:
+    """
+    Get Connection Pools Usage of Primary and Replicas, and Reads Routing Counters
+    """
+    return {
+        **_get_engine_pool_stats(engine),
+        "replicas": [_get_engine_pool_stats(replica) for replica in replica_router.replicas],
+        "routing": replica_router.get_stats()
+    }
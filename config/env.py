@@ -0,0 +1,5 @@
+from environs import Env
+
+# Read ENV File
+env = Env()
+env.read_env('.env')
@@ -85,3 +85,65 @@ class PostDelete(BaseModel):
             raise ValidationError("Post Id Can be Only Integer")
 
         return value
+
+
+class PostsPage(BaseModel):
+    limit: int = 50
+    after: str | None = None
+    stream: bool = False  # Stream ALL Posts after Cursor as NDJSON Instead of One Page
+
+    @field_validator("limit")
+    def limit_validator(
+            cls,
+            value: int
+    ) -> int | ValidationError:
+        """
+        Check Input Page Limit
+        """
+        if value < 1 or value > 100:
+            raise ValidationError("Limit must be between 1 and 100")
+
+        return value
+
+
+class Principal(BaseModel):
+    user_email: str
+    user_id: int | None = None  # None for Tokens Issued Before User Id Claim
+
+
+class PostsDelete(BaseModel):
+    post_ids: list[int]
+
+    @field_validator("post_ids", mode="before")  # Mode Before -> Call Validator Before Pydantic Format Data
+    def post_ids_validator(
+            cls,
+            value: list
+    ) -> list[int] | ValidationError:
+        """
+        Check Input Post Ids
+        """
+        if not isinstance(value, list) or not all(isinstance(post_id, int) for post_id in value):
+            raise ValidationError("Post Ids Can be Only List of Integers")
+
+        if len(value) < 1 or len(value) > 100:
+            raise ValidationError("Post Ids must contain between 1 and 100 ids")
+
+        # Remove Duplicated Ids with Saving Order
+        return list(dict.fromkeys(value))
+
+
+class PostsBulkAdd(BaseModel):
+    posts: list[PostAdd]
+
+    @field_validator("posts")
+    def posts_validator(
+            cls,
+            value: list[PostAdd]
+    ) -> list[PostAdd] | ValidationError:
+        """
+        Check Input Posts Count
+        """
+        if len(value) < 1 or len(value) > 100:
+            raise ValidationError("Posts must contain between 1 and 100 posts")
+
+        return value
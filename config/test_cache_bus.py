@@ -0,0 +1,58 @@
+import asyncio
+import os
+import socket
+
+import pytest
+
+from apis.utils.cache_bus import CacheInvalidationBus
+
+
+@pytest.mark.asyncio
+async def test_invalidation_reaches_sibling_workers(tmp_path):
+    """
+    Test for Delivering Invalidation to ALL Other Workers but Not to Sender
+    """
+    received: dict[str, list[str]] = {"a": [], "b": [], "c": []}
+    buses: dict[str, CacheInvalidationBus] = {}
+    for name in received:
+        async def on_invalidate(user_email, name=name):
+            received[name].append(user_email)
+
+        buses[name] = CacheInvalidationBus(str(tmp_path))
+        buses[name].start(on_invalidate, name=name)
+
+    try:
+        buses["a"].publish("test@gmail.com")
+        for _ in range(100):
+            if received["b"] and received["c"]:
+                break
+            await asyncio.sleep(0.01)
+
+        assert received == {"a": [], "b": ["test@gmail.com"], "c": ["test@gmail.com"]}
+        assert buses["a"].stats["sent"] == 2
+    finally:
+        for bus in buses.values():
+            await bus.close()
+
+    assert not os.listdir(tmp_path)
+
+
+@pytest.mark.asyncio
+async def test_socket_of_dead_worker_is_removed(tmp_path):
+    """
+    Test for Removing Socket Nobody Listens on
+    """
+    dead_socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    dead_socket.bind(str(tmp_path / "dead.sock"))
+    dead_socket.close()
+
+    async def on_invalidate(user_email):
+        pass
+
+    bus = CacheInvalidationBus(str(tmp_path))
+    bus.start(on_invalidate, name="alive")
+    try:
+        bus.publish("test@gmail.com")
+        assert os.listdir(tmp_path) == ["alive.sock"]
+    finally:
+        await bus.close()
@@ -0,0 +1,206 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from config.database import LazySession, ReplicaRouter, TimedQueuePool
+
+
+@pytest.mark.asyncio
+async def test_lazy_session_not_created_without_use():
+    """
+    Test for Not Creating DB Session When Request Doesn't Use It
+    """
+    created = []
+    session = LazySession(lambda: created.append(True))
+
+    await session.close()
+
+    assert not session.is_used
+    assert not created
+
+
+@pytest.mark.asyncio
+async def test_lazy_session_created_on_first_use(tmp_path):
+    """
+    Test for Creating DB Session by First Query and Returning Its Connection on Close
+    """
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'test.db'}",
+        poolclass=AsyncAdaptedQueuePool
+    )
+    session = LazySession(sessionmaker(bind=engine, class_=AsyncSession))
+    try:
+        result = await session.execute(text("SELECT 1"))
+        assert result.scalar() == 1
+        assert session.is_used
+        assert engine.pool.checkedout() == 1
+
+        await session.close()
+        assert engine.pool.checkedout() == 0
+    finally:
+        await session.close()
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_pool_checkout_wait_counted(tmp_path):
+    """
+    Test for Counting Connection Checkouts of Pool
+    """
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'test.db'}",
+        poolclass=TimedQueuePool
+    )
+    try:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+            assert engine.pool.checkedout() == 1
+
+        assert engine.pool.checkout_stats["checkouts"] == 1
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_replica_router_round_robin_and_read_your_writes(tmp_path):
+    """
+    Test for Reading from Replicas in Turn and from Primary Right After User's Own Write
+    """
+    replicas = [create_async_engine(f"sqlite+aiosqlite:///{tmp_path / f'replica_{i}.db'}") for i in range(2)]
+    router = ReplicaRouter(replicas=replicas, eject_seconds=30, read_your_writes_seconds=30)
+
+    assert router.get_read_engine("a@gmail.com") is replicas[0]
+    assert router.get_read_engine("a@gmail.com") is replicas[1]
+
+    router.mark_user_write("a@gmail.com")
+    assert router.get_read_engine("a@gmail.com") is None
+    assert router.get_read_engine("b@gmail.com") is replicas[0]
+
+
+@pytest.mark.asyncio
+async def test_replica_router_ejects_failed_replica(tmp_path):
+    """
+    Test for Skipping Replica After Connection Error
+    """
+    replicas = [
+        create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'replica.db'}"),
+        create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+    ]
+    router = ReplicaRouter(replicas=replicas, eject_seconds=30, read_your_writes_seconds=30)
+
+    try:
+        with pytest.raises(Exception):
+            async with router.get_read_engine().connect() as connection:
+                await connection.execute(text("SELECT 1"))
+
+        assert router.get_read_engine() is replicas[1]
+        assert router.get_read_engine() is replicas[1]
+        assert router.stats["ejections"] == 1
+    finally:
+        for replica in replicas:
+            await replica.dispose()
+
+
+# Runs in Own Process -> Primary and Replica URLs are Read by "config.database" on Import
+REPLICA_ROUTING_SCRIPT: str = """
+import asyncio
+import json
+
+import httpx
+from sqlalchemy import text
+
+from config.app import app
+from apis.utils.cache import cache
+from config.database import engine, replica_router
+from config.models import Base
+
+
+async def get_posts_texts(client, headers):
+    await cache.clear()
+    response = await client.get("/posts", headers=headers)
+    return [post["text"] for post in response.json()["posts"]]
+
+
+async def main():
+    replica = replica_router.replicas[0]
+    for db_engine in (engine, replica):
+        async with db_engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+
+    results = {}
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post("/user/signup", json={"email": "replica@gmail.com", "password": "Test1234!"})
+        headers = {"Authorization": f"Bearer {response.json()['token']}"}
+        user_id = response.json()["user"]["id"]
+        await client.post("/post/add", json={"text": "first post written to primary"}, headers=headers)
+
+        # Reads Right After Own Write Go to Primary
+        results["pinned"] = await get_posts_texts(client, headers)
+
+        # Replica Lags Behind Primary -> Has Only Its Own Post of User
+        async with replica.begin() as connection:
+            await connection.execute(
+                text('INSERT INTO "user" (id, email, password) VALUES (:id, :email, :password)'),
+                {"id": user_id, "email": "replica@gmail.com", "password": "x"}
+            )
+            await connection.execute(
+                text("INSERT INTO post (user_id, text) VALUES (:user_id, :text)"),
+                {"user_id": user_id, "text": "replica post"}
+            )
+
+        # Pin Expired -> Reads Go to Replica
+        await asyncio.sleep(0.5)
+        results["unpinned"] = await get_posts_texts(client, headers)
+
+        # Writes Go to Primary and Pin Reads Again
+        await client.post("/post/add", json={"text": "second post written to primary"}, headers=headers)
+        results["after_write"] = await get_posts_texts(client, headers)
+
+    async with replica.connect() as connection:
+        results["replica_posts"] = (await connection.execute(text("SELECT text FROM post"))).scalars().all()
+    results["stats"] = replica_router.get_stats()
+
+    print(json.dumps(results))
+
+
+asyncio.run(main())
+"""
+
+
+def test_get_posts_reads_replica_and_writes_primary(tmp_path):
+    """
+    Test for Reading Posts Page from Replica, Writes and Reads Right After Them from Primary
+    """
+    env: dict = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}",
+        "DATABASE_REPLICA_URLS": f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}",
+        "DB_READ_YOUR_WRITES_SECONDS": "0.3",
+        "CACHE_BACKEND": "memory",
+        "JWT_SECRET_KEY": "test",
+        "ACCESS_TOKEN_EXPIRE_MINUTES": "60"
+    }
+    process = subprocess.run(
+        [sys.executable, "-c", REPLICA_ROUTING_SCRIPT],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60
+    )
+    assert process.returncode == 0, process.stderr
+
+    results: dict = json.loads(process.stdout.strip().splitlines()[-1])
+    assert results["pinned"] == ["first post written to primary"]
+    assert results["unpinned"] == ["replica post"]
+    assert results["after_write"] == ["first post written to primary", "second post written to primary"]
+    assert results["replica_posts"] == ["replica post"]
+    assert results["stats"]["replica_reads"] >= 1
+    assert results["stats"]["pinned_reads"] >= 2
@@ -0,0 +1,67 @@
+import orjson
+import pytest
+
+from apis.utils.etag import make_etag, etag_matches
+from apis.utils.query_budget import QueryBudget
+
+
+def test_etag_matches():
+    """
+    Test for Matching ETag from "If-None-Match" Header
+    """
+    etag = make_etag(generation="abc", version=3)
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+
+
+def test_etag_not_matches():
+    """
+    Test for Not Matching Old or Missing ETags
+    """
+    etag = make_etag(generation="abc", version=3)
+
+    assert not etag_matches(make_etag(generation="abc", version=2), etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches(etag, None)
+
+
+@pytest.mark.asyncio
+async def test_not_modified_posts_page(client, db_engine, signup_headers, monkeypatch):
+    """
+    Test for Answering 304 Without DB Queries and Serialization and New ETag After Posts Changed
+    """
+    headers = await signup_headers()
+    response = await client.post("/post/add", json={"text": "one two three four five"}, headers=headers)
+    post_id: int = response.json()["post"]["id"]
+
+    response = await client.get("/posts", headers=headers)
+    assert response.status_code == 200
+    etag: str = response.headers["ETag"]
+
+    def dumps_forbidden(*args, **kwargs):
+        raise AssertionError("Response Must Not be Serialized")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(orjson, "dumps", dumps_forbidden)
+        with QueryBudget(db_engine, max_statements=0):
+            response = await client.get("/posts", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+    # Added Post Changes ETag
+    await client.post("/post/add", json={"text": "six seven eight nine ten"}, headers=headers)
+    response = await client.get("/posts", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert len(response.json()["posts"]) == 2
+    added_etag: str = response.headers["ETag"]
+    assert added_etag != etag
+
+    # Deleted Post Changes ETag
+    await client.post("/post/delete", json={"post_id": post_id}, headers=headers)
+    response = await client.get("/posts", headers={**headers, "If-None-Match": added_etag})
+    assert response.status_code == 200
+    assert len(response.json()["posts"]) == 1
+    assert response.headers["ETag"] not in (etag, added_etag)
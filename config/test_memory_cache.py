@@ -0,0 +1,48 @@
+import pytest
+
+from apis.utils.memory_cache import BoundedMemoryCache
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_by_bytes():
+    """
+    Test for Evicting Least Recently Used Values Above Byte Budget
+    """
+    cache = BoundedMemoryCache(max_bytes=30, max_entry_bytes=20)
+
+    await cache.set("first", b"x" * 10)
+    await cache.set("second", b"x" * 10)
+    await cache.get("first")
+    await cache.set("third", b"x" * 15)
+
+    assert await cache.get("second") is None
+    assert await cache.get("first") == b"x" * 10
+    assert cache.stats["evictions"] == 1
+    assert cache.stats["bytes"] == 25
+
+
+@pytest.mark.asyncio
+async def test_oversized_entry_skipped():
+    """
+    Test for Skipping Values Larger than Entry Limit
+    """
+    cache = BoundedMemoryCache(max_bytes=100, max_entry_bytes=20)
+
+    await cache.set("posts", b"x" * 10)
+    assert await cache.set("posts", b"x" * 50) is False
+
+    assert await cache.get("posts") is None
+    assert cache.stats["skipped"] == 1
+    assert cache.stats["bytes"] == 0
+
+
+@pytest.mark.asyncio
+async def test_nested_entry_size_counted():
+    """
+    Test for Counting Bytes Stored Inside Dict Values (Cached Pages Without Pickling)
+    """
+    cache = BoundedMemoryCache(max_bytes=10 * 1024, max_entry_bytes=4 * 1024)
+
+    assert await cache.set("page", {"posts_ids": [1, 2], "body": b"x" * 5 * 1024}) is False
+    assert await cache.set("page", {"posts_ids": [1, 2], "body": b"x" * 1024}) is True
+    assert cache.stats["bytes"] > 1024
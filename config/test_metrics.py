@@ -0,0 +1,75 @@
+import pytest
+
+from apis.utils.metrics import Histogram, instrument_engine
+
+
+def test_histogram_render():
+    """
+    Test for Rendering Cumulative Histogram Buckets in Prometheus Text Format
+    """
+    histogram = Histogram(name="test_seconds", description="Test", label_names=("route",), buckets=(0.1, 1))
+    histogram.observe(0.05, "/posts")
+    histogram.observe(0.5, "/posts")
+    histogram.observe(5, "/posts")
+
+    lines = histogram.render()
+
+    assert 'test_seconds_bucket{route="/posts",le="0.1"} 1' in lines
+    assert 'test_seconds_bucket{route="/posts",le="1"} 2' in lines
+    assert 'test_seconds_bucket{route="/posts",le="+Inf"} 3' in lines
+    assert 'test_seconds_count{route="/posts"} 3' in lines
+
+
+async def _scrape(
+        client
+) -> dict[str, float]:
+    """
+    Get Samples of "/metrics" by Series Name with Labels
+    """
+    response = await client.get("/metrics")
+    assert response.status_code == 200
+
+    samples: dict[str, float] = {}
+    for line in response.text.splitlines():
+        if line and not line.startswith("#"):
+            series, value = line.rsplit(" ", 1)
+            samples[series] = float(value)
+    return samples
+
+
+def _delta(
+        before: dict[str, float],
+        after: dict[str, float],
+        series: str
+) -> float:
+    return after.get(series, 0) - before.get(series, 0)
+
+
+@pytest.mark.asyncio
+async def test_requests_metrics_by_route_template(client, db_engine, signup_headers):
+    """
+    Test for Labelling Requests with Route Template, Status and DB Queries, and Folding Unknown Paths
+    """
+    instrument_engine(db_engine)
+    headers = await signup_headers()
+    await client.post("/post/add", json={"text": "one two three four five"}, headers=headers)
+
+    before = await _scrape(client)
+    await client.get("/posts", params={"limit": 5}, headers=headers)
+    await client.get("/posts", params={"after": "bad"}, headers=headers)
+    await client.get("/no/such/1")
+    await client.get("/no/such/2")
+    after = await _scrape(client)
+
+    assert _delta(before, after, 'http_request_duration_seconds_count{method="GET",route="/posts",status="200"}') == 1
+    assert _delta(before, after, 'http_request_duration_seconds_count{method="GET",route="/posts",status="400"}') == 1
+
+    # Page Built from DB on Cache Miss, Bad Cursor Rejected Before Any Query
+    assert _delta(before, after, 'http_request_db_queries_count{method="GET",route="/posts"}') == 2
+    assert _delta(before, after, 'http_request_db_queries_sum{method="GET",route="/posts"}') >= 1
+    assert _delta(before, after, 'http_request_db_duration_seconds_sum{method="GET",route="/posts"}') > 0
+
+    assert _delta(
+        before, after, 'http_request_duration_seconds_count{method="GET",route="unmatched",status="404"}'
+    ) == 2
+    assert not any("?" in series or "/no/such" in series for series in after)
@@ -0,0 +1,17 @@
+from apis.utils.pagination import encode_cursor, decode_cursor
+
+
+def test_cursor_round_trip():
+    """
+    Test for Keyset Cursor Encoding and Decoding
+    """
+    cursor = encode_cursor(user_id=7, post_id=1024)
+    assert decode_cursor(cursor) == (7, 1024)
+
+
+def test_invalid_cursor():
+    """
+    Test for Rejecting Broken Cursors
+    """
+    assert decode_cursor("not a cursor") is False
+    assert decode_cursor(encode_cursor(user_id=7, post_id=1)[:-1] + "!") is False
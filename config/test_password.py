@@ -0,0 +1,114 @@
+import asyncio
+import threading
+
+import bcrypt
+import httpx
+import pytest
+from sqlalchemy import event
+
+import apis.utils.password as password
+from config.conftest import TEST_PASSWORD
+
+
+@pytest.mark.asyncio
+async def test_saturated_password_hasher_rejects_signup(client, monkeypatch):
+    """
+    Test for Answering 503 with Retry-After When ALL Workers are Busy and Queue is Full
+    """
+    # One Worker Hashing and One Job Waiting Fill Executor
+    password.shutdown_password_executor()
+    monkeypatch.setattr(password, "PASSWORD_HASHER_WORKERS", 1)
+    monkeypatch.setattr(password, "PASSWORD_HASHER_MAX_QUEUE", 1)
+
+    release = threading.Event()
+
+    def slow_hash_password(password_bytes: bytes) -> bytes:
+        release.wait(timeout=10)
+        return bcrypt.hashpw(password_bytes, bcrypt.gensalt(rounds=4))
+
+    monkeypatch.setattr(password, "_hash_password", slow_hash_password)
+
+    async def signup(email: str) -> httpx.Response:
+        return await client.post("/user/signup", json={"email": email, "password": TEST_PASSWORD})
+
+    try:
+        accepted = [asyncio.create_task(signup(f"user{number}@gmail.com")) for number in range(2)]
+        for _ in range(500):
+            if password._pending_jobs == 2:
+                break
+            await asyncio.sleep(0.01)
+
+        response = await signup("rejected@gmail.com")
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+    finally:
+        release.set()
+
+    assert [response.status_code for response in await asyncio.gather(*accepted)] == [201, 201]
+    assert password._pending_jobs == 0
+
+    password.shutdown_password_executor()
+
+
+def _hash_together(
+        monkeypatch,
+        workers: int,
+        on_hash=None
+) -> None:
+    """
+    Hash Passwords Only When ALL Workers Got Their Jobs -> Signups Wait in Executor Together
+    """
+    password.shutdown_password_executor()
+    monkeypatch.setattr(password, "PASSWORD_HASHER_WORKERS", workers)
+
+    barrier = threading.Barrier(workers)
+
+    def hash_password_together(password_bytes: bytes) -> bytes:
+        barrier.wait(timeout=10)
+        if on_hash is not None:
+            on_hash()
+        return bcrypt.hashpw(password_bytes, bcrypt.gensalt(rounds=4))
+
+    monkeypatch.setattr(password, "_hash_password", hash_password_together)
+
+
+@pytest.mark.asyncio
+async def test_signup_holds_no_connection_while_hashing(client, db_engine, monkeypatch):
+    """
+    Test for Returning Connection into Pool Before Password Hashing of Concurrent Signups
+    """
+    signups_count: int = 6
+
+    checked_out: list[int] = [0]
+    event.listen(db_engine.sync_engine, "checkout", lambda *args: checked_out.__setitem__(0, checked_out[0] + 1))
+    event.listen(db_engine.sync_engine, "checkin", lambda *args: checked_out.__setitem__(0, checked_out[0] - 1))
+
+    checked_out_while_hashing: list[int] = []
+    _hash_together(monkeypatch, workers=signups_count, on_hash=lambda: checked_out_while_hashing.append(checked_out[0]))
+
+    responses = await asyncio.gather(*[
+        client.post("/user/signup", json={"email": f"user{number}@gmail.com", "password": TEST_PASSWORD})
+        for number in range(signups_count)
+    ])
+
+    assert [response.status_code for response in responses] == [201] * signups_count
+    assert checked_out_while_hashing == [0] * signups_count
+
+    password.shutdown_password_executor()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_signups_with_same_email(client, monkeypatch):
+    """
+    Test for Rejecting Second of Concurrent Signups Which Both Passed Email Check
+    """
+    _hash_together(monkeypatch, workers=2)
+
+    responses = await asyncio.gather(*[
+        client.post("/user/signup", json={"email": "same@gmail.com", "password": TEST_PASSWORD})
+        for _ in range(2)
+    ])
+
+    assert sorted(response.status_code for response in responses) == [201, 400]
+
+    password.shutdown_password_executor()
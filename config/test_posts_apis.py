@@ -0,0 +1,263 @@
+from types import SimpleNamespace
+
+import orjson
+import pytest
+from sqlalchemy import Insert, TextClause, select
+from sqlalchemy.dialects import mysql
+
+import apis.posts_apis as posts_apis
+import apis.utils.post_inserts as post_inserts
+import config.database as database
+from apis.utils.pagination import encode_cursor
+from apis.utils.post_inserts import insert_posts
+from apis.utils.query_budget import QueryBudget
+from config.models import User, Post
+
+
+def _text(
+        number: int
+) -> str:
+    return f"post number {number} with enough words"
+
+
+async def _add_posts(
+        client,
+        headers: dict,
+        count: int
+) -> list[int]:
+    """
+    Add Posts with One Request and Get Their Ids
+    """
+    response = await client.post(
+        "/posts/bulk", json={"posts": [{"text": _text(number)} for number in range(count)]}, headers=headers
+    )
+    return response.json()["posts_ids"]
+
+
+async def _get_user_id(
+        email: str
+) -> int:
+    async with database.async_session() as session:
+        return (await session.execute(select(User.id).filter_by(email=email))).scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_insert_posts_ids_in_input_order_across_chunks(db_engine, monkeypatch):
+    """
+    Test for Getting Ids of Multi-Row INSERTs in Input Order When Posts are Split into Chunks
+    """
+    async with database.async_session() as session:
+        session.add(User(id=1, email="chunks@gmail.com", password="x"))
+        await session.commit()
+
+    # Two Posts per INSERT
+    monkeypatch.setattr(post_inserts, "INSERT_CHUNK_BYTES", 2 * len(_text(0)))
+    posts: list[dict] = [{"user_id": 1, "text": _text(number)} for number in range(5)]
+
+    with QueryBudget(db_engine, max_statements=3) as budget:
+        async with database.async_session() as session:
+            posts_ids: list[int] = await insert_posts(session=session, posts=posts)
+            await session.commit()
+    assert len(budget.statements) == 3
+
+    # RETURNING Ids are Sorted -> Only Correct If Ids Grow in Rows Order Inside Statement
+    async with database.async_session() as session:
+        texts: list[str] = [(await session.get(Post, post_id)).text for post_id in posts_ids]
+    assert texts == [post["text"] for post in posts]
+    assert posts_ids == sorted(posts_ids)
+
+
+class _StubMySQLSession:
+    """
+    Session of MySQL Server with Given Auto-Increment Lock Mode, Without Real Server
+    """
+
+    def __init__(
+            self,
+            lock_mode: int
+    ):
+        self.lock_mode: int = lock_mode
+        self.statements: list = []
+        self.added: list[Post] = []
+
+    def get_bind(self):
+        return SimpleNamespace(dialect=SimpleNamespace(name="mysql", insert_returning=False))
+
+    async def execute(self, query):
+        self.statements.append(query)
+        if isinstance(query, TextClause):
+            return SimpleNamespace(one=lambda: (self.lock_mode, 1))
+        return SimpleNamespace(lastrowid=10)
+
+    def add_all(self, posts: list[Post]):
+        self.added.extend(posts)
+
+    async def flush(self):
+        # Interleaved Ids of Other Transactions
+        for number, post in enumerate(self.added):
+            post.id = 20 + number * 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("lock_mode, expected_ids, expected_inserts", [(1, [10, 11, 12], 1), (2, [20, 22, 24], 0)])
+async def test_insert_posts_on_mysql(monkeypatch, lock_mode, expected_ids, expected_inserts):
+    """
+    Test for One Multi-Row INSERT with Consecutive Ids on MySQL and Row by Row Fallback in Interleaved Lock Mode
+    """
+    monkeypatch.setattr(post_inserts, "_mysql_consecutive_ids", [])
+    session = _StubMySQLSession(lock_mode=lock_mode)
+    posts: list[dict] = [{"user_id": 1, "text": _text(number)} for number in range(3)]
+
+    assert await insert_posts(session=session, posts=posts) == expected_ids
+
+    # Lock Mode is Checked Once per Process
+    await insert_posts(session=session, posts=posts)
+    assert sum(isinstance(statement, TextClause) for statement in session.statements) == 1
+
+    inserts: list[Insert] = [statement for statement in session.statements if isinstance(statement, Insert)]
+    assert len(inserts) == expected_inserts * 2
+    if inserts:
+        # ALL Posts of Batch in VALUES of One Statement
+        assert len(inserts[0].compile(dialect=mysql.dialect()).params) == 2 * len(posts)
+
+
+@pytest.mark.asyncio
+async def test_bulk_add_posts(client, signup_headers):
+    """
+    Test for Adding Many Posts in One Request and Seeing Them in Cached Page
+    """
+    headers = await signup_headers()
+
+    # Cache Page Before Bulk Add -> It is Patched with New Posts
+    await client.post("/post/add", json={"text": _text(0)}, headers=headers)
+    assert len((await client.get("/posts", headers=headers)).json()["posts"]) == 1
+
+    response = await client.post(
+        "/posts/bulk", json={"posts": [{"text": _text(number)} for number in range(1, 4)]}, headers=headers
+    )
+    assert response.status_code == 201
+    posts_ids: list[int] = response.json()["posts_ids"]
+    assert len(posts_ids) == 3
+
+    posts: list[dict] = (await client.get("/posts", headers=headers)).json()["posts"]
+    assert [post["text"] for post in posts] == [_text(number) for number in range(4)]
+    assert [post["id"] for post in posts[1:]] == posts_ids
+
+
+@pytest.mark.asyncio
+async def test_bulk_add_posts_validation(client, signup_headers):
+    """
+    Test for Rejecting Bulk Add Without Token or with Too Many Posts
+    """
+    headers = await signup_headers()
+
+    response = await client.post("/posts/bulk", json={"posts": [{"text": _text(0)}]})
+    assert response.status_code == 401
+
+    response = await client.post(
+        "/posts/bulk", json={"posts": [{"text": _text(number)} for number in range(101)]}, headers=headers
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_stream_posts(client, signup_headers, monkeypatch):
+    """
+    Test for Streaming ALL User Posts as NDJSON by Query Param, Accept Header and from Cursor
+    """
+    # Rows are Fetched by Several Server-Side Cursor Batches
+    monkeypatch.setattr(posts_apis, "STREAM_YIELD_PER", 2)
+
+    headers = await signup_headers()
+    posts_ids: list[int] = await _add_posts(client, headers, count=5)
+
+    response = await client.get("/posts", params={"stream": 1, "limit": 1}, headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines: list[dict] = [orjson.loads(line) for line in response.text.splitlines()]
+    assert [post["id"] for post in lines] == posts_ids
+    assert lines[0] == {"id": posts_ids[0], "user_email": "test@gmail.com", "text": _text(0)}
+
+    # Cursor of Second Post -> Stream Starts After It
+    cursor: str = encode_cursor(user_id=await _get_user_id("test@gmail.com"), post_id=posts_ids[1])
+    response = await client.get(
+        "/posts", params={"after": cursor}, headers={**headers, "Accept": "application/x-ndjson"}
+    )
+    assert response.status_code == 200
+    assert [orjson.loads(line)["id"] for line in response.text.splitlines()] == posts_ids[2:]
+
+
+@pytest.mark.asyncio
+async def test_stream_posts_errors_before_streaming(client, signup_headers):
+    """
+    Test for Getting JSON Errors Instead of Stream with Bad Token or Cursor
+    """
+    headers = await signup_headers()
+    await signup_headers(email="other@gmail.com")
+
+    response = await client.get("/posts", params={"stream": 1}, headers={"Authorization": "Bearer bad"})
+    assert response.status_code == 401
+    assert response.headers["content-type"] == "application/json"
+
+    response = await client.get("/posts", params={"stream": 1, "after": "bad"}, headers=headers)
+    assert response.status_code == 400
+
+    # Cursor of Other User
+    cursor: str = encode_cursor(user_id=await _get_user_id("other@gmail.com"), post_id=1)
+    response = await client.get("/posts", params={"stream": 1, "after": cursor}, headers=headers)
+    assert response.status_code == 400
+    assert response.json() == {"error": "That Cursor is Not About This User"}
+
+
+async def _count_posts(
+        posts_ids: list[int]
+) -> int:
+    async with database.async_session() as session:
+        return len((await session.execute(select(Post.id).where(Post.id.in_(posts_ids)))).all())
+
+
+@pytest.mark.asyncio
+async def test_delete_post_of_other_user_or_missing(client, signup_headers):
+    """
+    Test for Rejecting Delete of Other User Post or Missing Post and Keeping Row
+    """
+    headers = await signup_headers()
+    other_headers = await signup_headers(email="other@gmail.com")
+    other_post_id: int = (await _add_posts(client, other_headers, count=1))[0]
+
+    response = await client.post("/post/delete", json={"post_id": other_post_id}, headers=headers)
+    assert response.status_code == 400
+    assert await _count_posts([other_post_id]) == 1
+
+    response = await client.post("/post/delete", json={"post_id": other_post_id + 100}, headers=headers)
+    assert response.status_code == 400
+
+    response = await client.post("/post/delete", json={"post_id": other_post_id}, headers=other_headers)
+    assert response.status_code == 200
+    assert await _count_posts([other_post_id]) == 0
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_posts(client, signup_headers):
+    """
+    Test for Deleting Only Own Posts in Bulk, Reporting Deleted Count and Serving Full Pages After It
+    """
+    headers = await signup_headers()
+    other_headers = await signup_headers(email="other@gmail.com")
+    posts_ids: list[int] = await _add_posts(client, headers, count=4)
+    other_post_id: int = (await _add_posts(client, other_headers, count=1))[0]
+
+    # Cache First Page Which Has Next Page
+    first_page: dict = (await client.get("/posts", params={"limit": 2}, headers=headers)).json()
+    assert [post["id"] for post in first_page["posts"]] == posts_ids[:2]
+
+    response = await client.post(
+        "/posts/delete", json={"post_ids": [*posts_ids[:2], other_post_id, other_post_id + 100]}, headers=headers
+    )
+    assert response.status_code == 200
+    assert response.json() == {"success": True, "deleted": 2}
+    assert await _count_posts([other_post_id]) == 1
+
+    # Posts of Next Page Moved Up
+    first_page = (await client.get("/posts", params={"limit": 2}, headers=headers)).json()
+    assert [post["id"] for post in first_page["posts"]] == posts_ids[2:]
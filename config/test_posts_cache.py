@@ -0,0 +1,201 @@
+import asyncio
+
+import orjson
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import create_async_engine
+
+import apis.utils.cache as posts_cache
+from apis.utils.cache import (
+    cache, get_user_posts_version, get_and_add_user_posts_into_cache, get_cached_posts_and_cache_key,
+    get_or_build_user_posts_page, add_posts_into_cache, delete_posts_from_cache, invalidate_user_posts_cache
+)
+from apis.utils.pagination import encode_cursor
+from config.database import ReplicaRouter
+
+USER_EMAIL: str = "cache@gmail.com"
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def clear_cache():
+    """
+    Every Test Starts with Empty Posts Cache
+    """
+    await cache.clear()
+    yield
+    await cache.clear()
+
+
+def _post(
+        post_id: int
+) -> dict:
+    return {"id": post_id, "user_email": USER_EMAIL, "text": f"post {post_id}"}
+
+
+async def _cache_page(
+        after_id: int,
+        limit: int,
+        posts_ids: list[int],
+        next_cursor: str | None = None
+) -> None:
+    """
+    Cache Page as If It Was Built from DB
+    """
+    version = await get_user_posts_version(user_email=USER_EMAIL)
+    await get_and_add_user_posts_into_cache(
+        user_email=USER_EMAIL,
+        after_id=after_id,
+        limit=limit,
+        page={
+            "user_id": 1,
+            "after_id": after_id,
+            "limit": limit,
+            "next_cursor": next_cursor,
+            "posts": [_post(post_id) for post_id in posts_ids]
+        },
+        version=version
+    )
+
+
+async def _get_cached_page(
+        after_id: int,
+        limit: int
+) -> dict | None:
+    cached_page, _ = await get_cached_posts_and_cache_key(user_email=USER_EMAIL, after_id=after_id, limit=limit)
+    return cached_page
+
+
+@pytest.mark.asyncio
+async def test_out_of_order_post_inserted_in_sorted_position():
+    """
+    Test for Adding Post with Id Lower than Last Cached Post Id
+    """
+    await _cache_page(after_id=0, limit=3, posts_ids=[9, 11])
+    await _cache_page(after_id=0, limit=2, posts_ids=[9, 11], next_cursor=encode_cursor(user_id=1, post_id=11))
+
+    await add_posts_into_cache(user_email=USER_EMAIL, posts=[_post(10), _post(11)])
+
+    last_page = await _get_cached_page(after_id=0, limit=3)
+    assert last_page["posts_ids"] == [9, 10, 11]
+    assert last_page["next_cursor"] is None
+
+    # Overflow Post Moves to Next Page
+    full_page = await _get_cached_page(after_id=0, limit=2)
+    assert full_page["posts_ids"] == [9, 10]
+    assert full_page["next_cursor"] == encode_cursor(user_id=1, post_id=10)
+    assert orjson.loads(full_page["body"])["next_cursor"] == full_page["next_cursor"]
+
+
+@pytest.mark.asyncio
+async def test_post_after_full_last_page_starts_next_page():
+    """
+    Test for Adding Post After Full Last Page and Post on One of Next Pages
+    """
+    await _cache_page(after_id=0, limit=2, posts_ids=[1, 2])
+    await _cache_page(after_id=2, limit=2, posts_ids=[3, 4], next_cursor=encode_cursor(user_id=1, post_id=4))
+
+    await add_posts_into_cache(user_email=USER_EMAIL, posts=[_post(5)])
+
+    first_page = await _get_cached_page(after_id=0, limit=2)
+    assert first_page["posts_ids"] == [1, 2]
+    assert first_page["next_cursor"] == encode_cursor(user_id=1, post_id=2)
+
+    middle_page = await _get_cached_page(after_id=2, limit=2)
+    assert middle_page["posts_ids"] == [3, 4]
+
+
+@pytest.mark.asyncio
+async def test_page_built_before_concurrent_write_is_not_cached():
+    """
+    Test for Compare And Set Rejecting Page Read from DB Before Concurrent Write
+    """
+    build_started = asyncio.Event()
+    write_done = asyncio.Event()
+    db_posts_ids: list[int] = [9, 11]
+    builds: list[list[int]] = []
+
+    async def build_page() -> dict:
+        # Snapshot of DB Is Taken Before Write, Page Is Returned After It
+        posts_ids: list[int] = list(db_posts_ids)
+        builds.append(posts_ids)
+        build_started.set()
+        await write_done.wait()
+        return {
+            "user_id": 1,
+            "after_id": 0,
+            "limit": 10,
+            "next_cursor": None,
+            "posts": [_post(post_id) for post_id in posts_ids]
+        }
+
+    reader = asyncio.create_task(
+        get_or_build_user_posts_page(user_email=USER_EMAIL, after_id=0, limit=10, build_page=build_page)
+    )
+    await build_started.wait()
+
+    # Post with Lower Id Committed While Page is Being Built
+    db_posts_ids.insert(1, 10)
+    await add_posts_into_cache(user_email=USER_EMAIL, posts=[_post(10)])
+    write_done.set()
+
+    # Stale Page is Served to Its Reader Only, Without ETag
+    stale_page = await reader
+    assert stale_page["posts_ids"] == [9, 11]
+    assert "etag" not in stale_page
+    assert await _get_cached_page(after_id=0, limit=10) is None
+
+    # Next Read Rebuilds Page and Then Serves It from Cache
+    for _ in range(2):
+        page = await get_or_build_user_posts_page(user_email=USER_EMAIL, after_id=0, limit=10, build_page=build_page)
+        assert page["posts_ids"] == [9, 10, 11]
+    assert builds == [[9, 11], [9, 10, 11]]
+    etag: str = page["etag"]
+
+    # Concurrent Out of Order Write Patches Cached Page in Place
+    await add_posts_into_cache(user_email=USER_EMAIL, posts=[_post(8), _post(12)])
+    cached_page = await _get_cached_page(after_id=0, limit=10)
+    assert cached_page["posts_ids"] == [8, 9, 10, 11, 12]
+    assert cached_page["etag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_delete_patches_only_last_page():
+    """
+    Test for Dropping Pages with Next Cursor and Their Next Pages After Delete
+    """
+    await _cache_page(after_id=0, limit=2, posts_ids=[1, 2], next_cursor=encode_cursor(user_id=1, post_id=2))
+    await _cache_page(after_id=2, limit=2, posts_ids=[3, 4], next_cursor=encode_cursor(user_id=1, post_id=4))
+    await _cache_page(after_id=4, limit=2, posts_ids=[5])
+    await _cache_page(after_id=0, limit=10, posts_ids=[1, 2, 3, 4, 5])
+
+    await delete_posts_from_cache(user_email=USER_EMAIL, post_ids=[3])
+
+    # Page Before Deleted Post is Kept, Page with It and ALL Next Pages are Rebuilt from DB
+    assert (await _get_cached_page(after_id=0, limit=2))["posts_ids"] == [1, 2]
+    assert await _get_cached_page(after_id=2, limit=2) is None
+    assert await _get_cached_page(after_id=4, limit=2) is None
+    assert (await _get_cached_page(after_id=0, limit=10))["posts_ids"] == [1, 2, 4, 5]
+
+    await delete_posts_from_cache(user_email=USER_EMAIL, post_ids=[1, 2])
+
+    assert await _get_cached_page(after_id=0, limit=2) is None
+    assert (await _get_cached_page(after_id=0, limit=10))["posts_ids"] == [4, 5]
+
+
+@pytest.mark.asyncio
+async def test_invalidation_from_other_worker_pins_reads_to_primary(tmp_path, monkeypatch):
+    """
+    Test for Reading Rebuilt Pages from Primary After Write in Sibling Worker
+    """
+    replica = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+    router = ReplicaRouter(replicas=[replica], eject_seconds=30, read_your_writes_seconds=30)
+    monkeypatch.setattr(posts_cache, "replica_router", router)
+
+    await _cache_page(after_id=0, limit=10, posts_ids=[1])
+    await invalidate_user_posts_cache(USER_EMAIL)
+
+    assert await _get_cached_page(after_id=0, limit=10) is None
+    assert router.is_user_pinned(USER_EMAIL)
+    assert router.get_read_engine(USER_EMAIL) is not replica
+
+    await replica.dispose()
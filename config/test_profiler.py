@@ -0,0 +1,99 @@
+import pstats
+
+import httpx
+import pytest
+import pytest_asyncio
+
+import apis.utils.profiler as profiler
+from apis.utils.profiler import ProfilerMiddleware, get_profile_path, list_profiles
+from app import app
+
+PROFILER_TOKEN: str = "profiler-secret"
+
+
+@pytest_asyncio.fixture
+async def profiled_client(tmp_path, monkeypatch):
+    """
+    Client of APP Behind Profiler Middleware Saving Last Two Profiles into Temporary Directory
+    """
+    monkeypatch.setattr(profiler, "PROFILER_TOKEN", PROFILER_TOKEN)
+    monkeypatch.setattr(profiler, "PROFILER_DIR", str(tmp_path / "profiles"))
+    monkeypatch.setattr(profiler, "PROFILER_KEEP", 2)
+
+    transport = httpx.ASGITransport(app=ProfilerMiddleware(app))
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_profiles_require_token(profiled_client, monkeypatch):
+    """
+    Test for Rejecting Profiles Routes Without Token or with Wrong Token
+    """
+    for headers in ({}, {"X-Profile": "wrong"}):
+        assert (await profiled_client.get("/profiles", headers=headers)).status_code == 403
+        assert (await profiled_client.get("/profiles/any.prof", headers=headers)).status_code == 403
+
+    response = await profiled_client.get("/profiles", headers={"X-Profile": PROFILER_TOKEN})
+    assert response.status_code == 200
+
+    # Wrong Token -> Request is Served Without Profiling
+    response = await profiled_client.get("/app-status", headers={"X-Profile": "wrong"})
+    assert response.status_code == 200
+    assert "x-profile-file" not in response.headers
+
+    # Profiler Disabled -> Any Token is Rejected and Requests are Passed Through
+    monkeypatch.setattr(profiler, "PROFILER_TOKEN", None)
+    response = await profiled_client.get("/app-status", headers={"X-Profile": PROFILER_TOKEN})
+    assert response.status_code == 200
+    assert "x-profile-file" not in response.headers
+    assert (await profiled_client.get("/profiles", headers={"X-Profile": PROFILER_TOKEN})).status_code == 403
+
+    # Only Request with Right Token While Profiler Was Enabled is Profiled
+    assert [name.split("_", 1)[1] for name in list_profiles()] == ["GET_profiles.prof"]
+
+
+@pytest.mark.asyncio
+async def test_profiled_request_saves_profile(profiled_client):
+    """
+    Test for Saving Profile of Request with Token and Downloading It
+    """
+    headers = {"X-Profile": PROFILER_TOKEN}
+
+    response = await profiled_client.get("/app-status", headers=headers)
+    assert response.status_code == 200
+    name: str = response.headers["x-profile-file"]
+    assert name.endswith("_GET_app-status.prof")
+    assert list_profiles() == [name]
+
+    response = await profiled_client.get(f"/profiles/{name}", headers=headers)
+    assert response.status_code == 200
+    assert pstats.Stats(get_profile_path(name)).total_calls > 0
+
+
+@pytest.mark.asyncio
+async def test_only_last_profiles_kept(profiled_client):
+    """
+    Test for Removing Oldest Profiles Above Limit
+    """
+    names: list[str] = []
+    for _ in range(3):
+        response = await profiled_client.get("/app-status", headers={"X-Profile": PROFILER_TOKEN})
+        names.append(response.headers["x-profile-file"])
+
+    assert list_profiles() == names[:0:-1]
+
+
+@pytest.mark.asyncio
+async def test_profile_path_rejects_traversal(profiled_client, tmp_path):
+    """
+    Test for Not Serving Files Outside Profiles Directory
+    """
+    (tmp_path / "secret.prof").write_bytes(b"secret")
+    await profiled_client.get("/app-status", headers={"X-Profile": PROFILER_TOKEN})
+
+    for name in ("../secret.prof", "../x", "/etc/passwd", ""):
+        assert get_profile_path(name) is None
+
+    response = await profiled_client.get("/profiles/..%2Fsecret.prof", headers={"X-Profile": PROFILER_TOKEN})
+    assert response.status_code == 404
@@ -0,0 +1,51 @@
+import pytest
+
+from apis.utils.cache import cache
+from apis.utils.query_budget import QueryBudget, QueryBudgetExceeded
+
+POSTS_COUNT = 30
+
+
+@pytest.mark.asyncio
+async def test_add_post_query_budget(client, db_engine, signup_headers):
+    """
+    Test for Adding Post with One INSERT and No User Lookup
+    """
+    headers = await signup_headers()
+
+    with QueryBudget(db_engine, max_statements=1):
+        response = await client.post("/post/add", json={"text": "one two three four five"}, headers=headers)
+    assert response.status_code == 201
+
+
+@pytest.mark.asyncio
+async def test_get_posts_query_budget_not_depends_on_posts_count(client, db_engine, signup_headers):
+    """
+    Test for Getting Posts Page with Fixed Count of Statements Whatever Count of Posts (No N+1)
+    """
+    headers = await signup_headers()
+    await client.post(
+        "/posts/bulk",
+        json={"posts": [{"text": f"post number {number} with five words"} for number in range(POSTS_COUNT)]},
+        headers=headers
+    )
+    await cache.clear()
+
+    with QueryBudget(db_engine, max_statements=2):
+        response = await client.get("/posts", params={"limit": POSTS_COUNT}, headers=headers)
+    assert len(response.json()["posts"]) == POSTS_COUNT
+
+    # Cached Page -> No Statements at All
+    with QueryBudget(db_engine, max_statements=0):
+        response = await client.get("/posts", params={"limit": POSTS_COUNT}, headers=headers)
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_query_budget_exceeded(client, db_engine, signup_headers):
+    """
+    Test for Failing When Statements are Over Budget
+    """
+    with pytest.raises(QueryBudgetExceeded):
+        with QueryBudget(db_engine, max_statements=0):
+            await signup_headers()
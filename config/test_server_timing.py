@@ -0,0 +1,23 @@
+from apis.utils.server_timing import ServerTimingPhase, _format_server_timing, _request_timings
+
+
+def test_phase_timed_only_inside_request():
+    """
+    Test for Timing Phases Only When Request Timings are Collected
+    """
+    with ServerTimingPhase("cache"):
+        pass
+
+    timings = {"phases": {}, "statements": [("SELECT 1", 0.002)]}
+    token = _request_timings.set(timings)
+    try:
+        with ServerTimingPhase("cache"):
+            pass
+    finally:
+        _request_timings.reset(token)
+
+    header = _format_server_timing(timings, app_seconds=0.005)
+
+    assert header.startswith("cache;dur=")
+    assert 'db;dur=2.000;desc="1 queries"' in header
+    assert header.endswith("app;dur=5.000")
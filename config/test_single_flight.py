@@ -0,0 +1,26 @@
+import asyncio
+
+import pytest
+
+from apis.utils.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_coalesced():
+    """
+    Test for Running Only One Call for ALL Concurrent Callers with Same Key
+    """
+    single_flight = SingleFlight()
+    calls: list[int] = []
+
+    async def build() -> str:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "page"
+
+    results = await asyncio.gather(*[single_flight.do("key", build) for _ in range(10)])
+
+    assert results == ["page"] * 10
+    assert len(calls) == 1
+    assert single_flight.stats == {"calls": 1, "coalesced": 9}
+    assert not single_flight.is_in_flight("key")
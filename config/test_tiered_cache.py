@@ -0,0 +1,53 @@
+import pytest
+
+from apis.utils.memory_cache import BoundedMemoryCache
+from apis.utils.serializers import CompressedMsgPackSerializer
+from apis.utils.tiered_cache import TieredCache
+
+PAGE = {
+    "user_id": 1,
+    "next_cursor": None,
+    "posts_ids": [1, 2],
+    "body": b'{"success":true,"posts":[' + b'{"text":"repeated post text"},' * 100 + b']}'
+}
+
+
+def test_compressed_msgpack_round_trip():
+    """
+    Test for Compressing Only Big Values and Reading Values Written with Other Settings
+    """
+    compressed = CompressedMsgPackSerializer(compression="zlib", compress_min_bytes=1024)
+    raw = CompressedMsgPackSerializer(compression="none")
+
+    value = compressed.dumps(PAGE)
+    assert value[:1] == CompressedMsgPackSerializer.ZLIB
+    assert len(value) < len(raw.dumps(PAGE))
+    assert compressed.dumps({"version": 1})[:1] == CompressedMsgPackSerializer.RAW
+
+    assert raw.loads(value) == PAGE
+    assert compressed.loads(raw.dumps(PAGE)) == PAGE
+    assert compressed.loads(None) is None
+
+
+@pytest.mark.asyncio
+async def test_l1_in_front_of_shared_cache():
+    """
+    Test for Serving Hot Keys from L1 and Dropping Only Local Copy
+    """
+    shared_cache = BoundedMemoryCache(serializer=CompressedMsgPackSerializer())
+    cache = TieredCache(l2=shared_cache, l1=BoundedMemoryCache(), l1_ttl=5)
+
+    await cache.set("page", PAGE, ttl=60)
+    assert isinstance(shared_cache._cache["page"], bytes)
+
+    assert await cache.get("page") == PAGE
+    assert cache.stats["l1_hits"] == 1
+
+    await cache.delete_local("page")
+    assert await cache.get("page") == PAGE
+    assert cache.stats["l1_hits"] == 1
+    assert cache.stats["hits"] == 2
+
+    await cache.delete("page")
+    assert await cache.get("page") is None
+    assert cache.stats["misses"] == 1
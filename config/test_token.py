@@ -0,0 +1,47 @@
+from datetime import timedelta
+
+import pytest
+
+from apis.utils.token import create_access_token, get_current_principal, verified_tokens
+
+
+@pytest.mark.asyncio
+async def test_principal_from_token_with_user_id():
+    """
+    Test for Reading User Id Claim from Token without DB
+    """
+    token = create_access_token({"user_email": "user@gmail.com", "user_id": 7})
+
+    principal = await get_current_principal(token)
+    assert principal.user_email == "user@gmail.com"
+    assert principal.user_id == 7
+
+
+@pytest.mark.asyncio
+async def test_principal_from_email_only_token():
+    """
+    Test for Accepting Old Tokens Issued Without User Id Claim
+    """
+    token = create_access_token({"user_email": "user@gmail.com"})
+
+    principal = await get_current_principal(token)
+    assert principal.user_email == "user@gmail.com"
+    assert principal.user_id is None
+    assert await get_current_principal("broken token") is False
+
+
+@pytest.mark.asyncio
+async def test_verified_token_cached_until_expiration():
+    """
+    Test for Serving Reused Token from Cache and Not Serving Expired One
+    """
+    token = create_access_token({"user_email": "cached@gmail.com", "user_id": 3})
+    hits = verified_tokens.stats["hits"]
+
+    principal = await get_current_principal(token)
+    assert await get_current_principal(token) is principal
+    assert verified_tokens.stats["hits"] == hits + 1
+
+    expired_token = create_access_token({"user_email": "cached@gmail.com"}, expires_delta=timedelta(seconds=-1))
+    assert await get_current_principal(expired_token) is False
+    assert verified_tokens.get(expired_token) is None
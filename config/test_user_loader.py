@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+import config.database as database
+from apis.utils.query_budget import QueryBudget
+from apis.utils.user_loader import UserLoader
+from config.models import User
+
+
+@pytest_asyncio.fixture
+async def db_engine(db_engine):
+    """
+    Fresh SQLite Database with Two Users
+    """
+    async with database.async_session() as session:
+        session.add_all([User(email="first@gmail.com", password="x"), User(email="second@gmail.com", password="x")])
+        await session.commit()
+
+    return db_engine
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_loaded_with_one_query(db_engine):
+    """
+    Test for Batching Different Emails into One Query and Sharing Result of Same Email
+    """
+    loader = UserLoader(window_ms=0, max_batch_size=100, ttl=5, max_cached=100)
+
+    with QueryBudget(db_engine, max_statements=1):
+        first, first_again, second, missing = await asyncio.gather(
+            loader.load("first@gmail.com"),
+            loader.load("first@gmail.com"),
+            loader.load("second@gmail.com"),
+            loader.load("missing@gmail.com")
+        )
+
+    assert first is first_again
+    assert second.email == "second@gmail.com"
+    assert missing is None
+    assert loader.stats["coalesced"] == 1
+
+
+@pytest.mark.asyncio
+async def test_only_found_principals_cached(db_engine):
+    """
+    Test for Serving Found Principals from Cache and Seeing User Signed Up in Other Worker
+    """
+    loader = UserLoader(window_ms=0, max_batch_size=100, ttl=5, max_cached=100)
+
+    assert (await loader.load_principal("first@gmail.com")).user_email == "first@gmail.com"
+    assert await loader.load_principal("new@gmail.com") is None
+
+    with QueryBudget(db_engine, max_statements=0):
+        assert (await loader.load_principal("first@gmail.com")).user_id is not None
+
+    # SignUp Without Invalidation of This Loader -> Missing User is Looked Up Again
+    async with database.async_session() as session:
+        session.add(User(email="new@gmail.com", password="x"))
+        await session.commit()
+
+    assert (await loader.load_principal("new@gmail.com")).user_email == "new@gmail.com"
@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+
+import config.database as database
+from apis.utils.write_batcher import PostWriteBatcher
+from config.models import User, Post
+
+
+@pytest_asyncio.fixture
+async def session_maker(db_engine):
+    """
+    Sessions on Fresh SQLite Database with One User
+    """
+    async with database.async_session() as session:
+        session.add(User(id=1, email="batch@gmail.com", password="x"))
+        await session.commit()
+
+    return database.async_session
+
+
+async def _get_posts_texts(
+        session_maker: sessionmaker
+) -> dict[int, str]:
+    async with session_maker() as session:
+        result = await session.execute(select(Post.id, Post.text))
+        return dict(result.all())
+
+
+@pytest.mark.asyncio
+async def test_full_batch_committed_without_waiting_window(session_maker):
+    """
+    Test for Flushing Batch by Size and Giving Each Request Id of Its Own Post
+    """
+    batcher = PostWriteBatcher(session_maker=session_maker, window_ms=60_000, max_batch_size=3)
+
+    texts: list[str] = [f"post {number}" for number in range(3)]
+    posts_ids: list[int] = await asyncio.wait_for(
+        asyncio.gather(*[batcher.add({"user_id": 1, "text": text}) for text in texts]),
+        timeout=5
+    )
+
+    assert batcher.stats["batches"] == 1
+    assert batcher.stats["max_batch_size"] == 3
+    assert [(await _get_posts_texts(session_maker))[post_id] for post_id in posts_ids] == texts
+
+
+@pytest.mark.asyncio
+async def test_batch_committed_when_window_ends(session_maker):
+    """
+    Test for Flushing Not Full Batch After Window
+    """
+    batcher = PostWriteBatcher(session_maker=session_maker, window_ms=10, max_batch_size=100)
+
+    first_id, second_id = await asyncio.gather(
+        batcher.add({"user_id": 1, "text": "first"}),
+        batcher.add({"user_id": 1, "text": "second"})
+    )
+
+    assert batcher.stats["batches"] == 1
+    assert await _get_posts_texts(session_maker) == {first_id: "first", second_id: "second"}
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_retried_post_by_post(session_maker):
+    """
+    Test for Committing Good Posts of Batch Which Failed Because of One Bad Post
+    """
+    batcher = PostWriteBatcher(session_maker=session_maker, window_ms=10, max_batch_size=100)
+
+    first, bad, last = await asyncio.gather(
+        batcher.add({"user_id": 1, "text": "first"}),
+        batcher.add({"user_id": None, "text": "bad"}),
+        batcher.add({"user_id": 1, "text": "last"}),
+        return_exceptions=True
+    )
+
+    assert isinstance(bad, Exception)
+    assert batcher.stats["failed_batches"] == 1
+    assert await _get_posts_texts(session_maker) == {first: "first", last: "last"}
+
+
+@pytest.mark.asyncio
+async def test_close_commits_pending_posts(session_maker):
+    """
+    Test for Committing Posts Still Waiting for Window on Close
+    """
+    batcher = PostWriteBatcher(session_maker=session_maker, window_ms=60_000, max_batch_size=100)
+
+    request: asyncio.Task = asyncio.create_task(batcher.add({"user_id": 1, "text": "pending"}))
+    await asyncio.sleep(0)
+    await asyncio.wait_for(batcher.close(), timeout=5)
+
+    assert await _get_posts_texts(session_maker) == {await request: "pending"}
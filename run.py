@@ -3,10 +3,32 @@ import subprocess
 import sys
 
 import uvicorn
-from fastapi import HTTPException
 
 
-async def _run_server():
+def _get_run_options() -> dict:
+    """
+    Get Uvicorn Options of Development or Production Mode from Env
+    """
+    # Only Env is Read -> DB Engine is Not Created in Supervisor Process
+    from config.env import env
+
+    production: bool = env("APP_MODE", "development") == "production"
+
+    # Production -> Worker per CPU, uvloop and httptools, No Reload and No pytest on Boot
+    return {
+        "host": env("APP_HOST", "0.0.0.0"),
+        "port": env.int("APP_PORT", 8080),
+        "reload": not production,
+        "workers": env.int("APP_WORKERS", os.cpu_count() or 1) if production else 1,
+        "loop": env("APP_LOOP", "uvloop" if production else "auto"),
+        "http": env("APP_HTTP", "httptools" if production else "auto"),
+        "run_tests": env.bool("APP_RUN_TESTS", not production),
+        "timeout_graceful_shutdown": env.int("APP_GRACEFUL_TIMEOUT", 30),
+        "access_log": env.bool("APP_ACCESS_LOG", not production)
+    }
+
+
+def _run_server() -> None:
     # Get Config Path
     config_dir_path = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config'))
 
@@ -15,22 +37,33 @@ async def _run_server():
 
     from config.logger import logger
 
-    try:
-        # Run pytest for Testing FastAPI APP Status and DB Users Status
-        subprocess.run(["pytest"])
+    run_options: dict = _get_run_options()
 
-        logger.info("The application test has been successfully executed")
-    except Exception as e:
-        logger.error(f"An error occurred when running tests | {e}")
-        raise HTTPException(status_code=500, detail=f"An error occurred when running tests | {e}")
+    if run_options.pop("run_tests"):
+        try:
+            # Run pytest for Testing FastAPI APP Status and DB Users Status
+            subprocess.run(["pytest"])
+
+            logger.info("The application test has been successfully executed")
+        except Exception as e:
+            logger.error(f"An error occurred when running tests | {e}")
+            raise
+
+    # Each Worker Has Own Posts Cache -> Workers Must Invalidate Caches of Each Other
+    if run_options["workers"] > 1:
+        os.environ.setdefault("CACHE_INVALIDATION_BUS", "true")
+
+    logger.info(
+        "Starting application | workers {workers}, loop {loop}, http {http}, reload {reload}".format(**run_options)
+    )
 
     # Run FastAPI Application
+    # On SIGTERM Each Worker Stops Accepting Connections and Drains In-Flight Requests
+    # for Up to "timeout_graceful_shutdown" Seconds Before Shutdown Events Close DB Pool and Executors
     uvicorn_cmd = "app:app"
-    uvicorn.run(uvicorn_cmd, host="0.0.0.0", port=8080, reload=True)
+    uvicorn.run(uvicorn_cmd, **run_options)
 
 
 if __name__ == "__main__":
-    import asyncio
-
-    # Run Async Module
-    asyncio.run(_run_server())
+    # Uvicorn Runs Own Event Loop -> Server is Started Outside of asyncio.run
+    _run_server()